@@ -0,0 +1,158 @@
+import queue
+import threading
+from collections import deque
+
+
+class AnalysisQueue:
+    """
+    Bounded queue of live audio chunks waiting for analysis, with a backpressure policy.
+
+    Chunks are (start, stop) sample ranges in the capture ring (see `AudioRingBuffer`).
+    When `maxsize` chunks are already waiting, `put` applies the queue's policy:
+
+    - "drop_oldest": the oldest waiting chunk is discarded, so feedback stays close to
+      the speaker at the cost of unanalysed audio.
+    - "coalesce": the new range is merged into the newest waiting one, so no audio is
+      skipped and the analysis catches up with one longer chunk.
+    - "block": the producer waits for space (at most `timeout` seconds, after which the
+      new chunk is dropped). The audio callback must never wait, so with this policy
+      `RealTimeAudioAnalyser` puts chunks from a separate feeder thread, which uses
+      `wait_for_space`.
+
+    The `STOP` sentinel (None) is always accepted. `depth`, `max_depth`, `dropped` and
+    `coalesced` report how far the analysis is behind and what was given up; `discard`
+    lets the consumer count chunks it could not analyse for other reasons.
+
+    `put` and `get` follow `queue.Queue`, so the queue can be consumed the same way.
+    """
+
+    POLICIES = ("drop_oldest", "coalesce", "block")
+
+    def __init__(self, maxsize=0, policy="drop_oldest"):
+        """
+        Create an empty queue.
+
+        Parameters:
+        - maxsize (int): Maximum number of waiting chunks (0 for unbounded).
+        - policy (str): What `put` does when the queue is full (one of `POLICIES`).
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}. Expected one of {self.POLICIES}.")
+        self.maxsize = int(maxsize)
+        self.policy = policy
+        self.entries = deque()
+        self.condition = threading.Condition()
+        self.max_depth = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+
+    def full(self):
+        """Return True if a chunk put now would trigger the policy."""
+        return self.maxsize > 0 and len(self.entries) >= self.maxsize
+
+
+    def put(self, chunk, timeout=None):
+        """
+        Queue a chunk, applying the backpressure policy if the queue is full.
+
+        Parameters:
+        - chunk (Tuple[int, int] or None): Sample range to analyse, or the `STOP` sentinel.
+        - timeout (float, optional): Longest wait for space under "block" (indefinitely if None).
+
+        Returns:
+        - bool: True if the chunk was queued or merged, False if it was dropped.
+        """
+        with self.condition:
+            if chunk is not None and self.full():
+                if self.policy == "drop_oldest":
+                    self.entries.popleft()
+                    self.dropped += 1
+                elif self.policy == "coalesce" and self.entries[-1] is not None:
+                    start, stop = self.entries[-1]
+                    self.entries[-1] = (min(start, chunk[0]), max(stop, chunk[1]))
+                    self.coalesced += 1
+                    return True
+                elif self.policy == "block":
+                    if not self.condition.wait_for(lambda: not self.full(), timeout):
+                        self.dropped += 1
+                        return False
+
+            self.entries.append(chunk)
+            self.max_depth = max(self.max_depth, len(self.entries))
+            self.condition.notify_all()
+            return True
+
+
+    def wait_for_space(self, timeout=None):
+        """
+        Wait until a chunk can be queued without applying the policy.
+
+        Parameters:
+        - timeout (float, optional): Seconds to wait (indefinitely if None).
+
+        Returns:
+        - bool: True if there is space, False if the wait timed out.
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.full(), timeout)
+
+
+    def get(self, timeout=None):
+        """
+        Remove and return the oldest waiting chunk.
+
+        Parameters:
+        - timeout (float, optional): Seconds to wait for a chunk (waits indefinitely if None).
+
+        Returns:
+        - Tuple[int, int] or None: The chunk, or the `STOP` sentinel.
+
+        Raises:
+        - queue.Empty: If no chunk arrived within `timeout`.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.entries, timeout):
+                raise queue.Empty
+            chunk = self.entries.popleft()
+            self.condition.notify_all()
+            return chunk
+
+
+    def discard(self, count=1):
+        """Count `count` chunks given up outside `put` (e.g. overwritten before being read) as dropped."""
+        with self.condition:
+            self.dropped += count
+
+
+    @property
+    def depth(self):
+        """Number of chunks currently waiting."""
+        return len(self.entries)
+
+
+    def empty(self):
+        """Return True if no chunk is waiting (as `queue.Queue.empty`)."""
+        return not self.entries
+
+
+    def qsize(self):
+        """Number of chunks currently waiting (as `queue.Queue.qsize`)."""
+        return self.depth
+
+
+    def stats(self):
+        """
+        Current backpressure counters.
+
+        Returns:
+        - dict: "depth", "max_depth", "dropped" and "coalesced" chunk counts, and the "policy".
+        """
+        with self.condition:
+            return {
+                "policy": self.policy,
+                "depth": len(self.entries),
+                "max_depth": self.max_depth,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+            }
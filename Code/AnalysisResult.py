@@ -0,0 +1,170 @@
+import numpy as np
+
+
+class AnalysisResult:
+    """
+    Outcome of a full audio analysis: numeric metrics, pause/break intervals, the
+    engagement score and advice codes.
+
+    The report text shown in the GUI, PDF and batch JSON is rendered from these fields
+    by `render` only when it is needed, so results stay small and cheap to aggregate.
+    """
+
+    __slots__ = (
+        "duration", "avg_loudness", "loudness_level", "pauses", "breaks", "avg_pitch", "avg_prosody",
+        "pitch_variation", "speech_rate", "avg_energy", "monotony", "advice", "score",
+    )
+
+    LOUDNESS_LABELS = {"loud": "Loud", "quiet": "Quiet", "balanced": "Balanced"}
+
+    MONOTONY_TEXT = {
+        "none": "Monotony: No valid pitch",
+        "low": "Monotony: Low variation",
+        "good": "Monotony: Good variation",
+    }
+
+    ADVICE_TEXT = {
+        "loudness_high": "Your speech is quite loud. Consider lowering your volume or moving slightly away from the microphone.",
+        "loudness_low": "Your speech is very quiet. Try increasing your volume or moving closer to the microphone.",
+        "loudness_ok": "Your loudness is well-balanced. Keep it up!",
+        "pauses_none": "Consider adding pauses to give your listeners time to absorb key points.",
+        "pauses_short": "You have frequent short pauses. Try linking thoughts more fluidly.",
+        "pauses_long": "Some pauses may be too long. Try reducing long pauses to keep the listener engaged.",
+        "pauses_ok": "Your pause length is balanced. Keep incorporating pauses naturally.",
+        "pitch_low": "Your pitch is relatively low, which could indicate monotony. Try varying your pitch to engage listeners more effectively.",
+        "pitch_flat": "Your speech pitch variation is quite low. Aim for more dynamic shifts in pitch to keep the audience engaged.",
+        "pitch_ok": "Your pitch variation is good. Keep using that dynamic range to maintain listener interest.",
+        "rate_slow": "Your speech rate is a bit slow. Consider speeding up slightly to maintain energy in your delivery.",
+        "rate_fast": "Your speech rate is quite fast. You might want to slow down to allow your audience to follow better.",
+        "rate_ok": "Your speech rate is well balanced. Keep it up!",
+        "energy_low": "The vocal energy is quite low. Try to put more emphasis into your speech for a stronger delivery.",
+        "energy_high": "Your vocal energy is quite high, which is great for engagement, but be mindful not to tire yourself out.",
+        "energy_ok": "Your vocal energy is balanced. Continue maintaining this level for a clear and engaging delivery.",
+        "monotony_flat": "Your speech might sound monotonous. Varying your pitch and speed can add more emotion and keep the audience's attention.",
+        "monotony_ok": "Your speech has a good variation in tone, making it engaging for listeners. Keep it up!",
+    }
+
+    def __init__(self, duration, avg_loudness, loudness_level, pauses, breaks, avg_pitch, avg_prosody,
+                 pitch_variation, speech_rate, avg_energy, monotony, advice=(), score=0.0):
+        """
+        Initialise the result.
+
+        Parameters:
+        - duration (float): Length of the analysed audio in seconds.
+        - avg_loudness (float): Average loudness in dB.
+        - loudness_level (str): Key of `LOUDNESS_LABELS`.
+        - pauses (np.ndarray): Pause intervals of shape (n, 3) holding (start, end, duration) in seconds.
+        - breaks (np.ndarray): Break intervals in the same layout.
+        - avg_pitch (float): Average pitch in Hz.
+        - avg_prosody (float): Mean pitch in Hz from the prosody analysis.
+        - pitch_variation (float): Standard deviation of pitch in Hz.
+        - speech_rate (float): Estimated speech rate.
+        - avg_energy (float): Average RMS vocal energy.
+        - monotony (str): Key of `MONOTONY_TEXT`.
+        - advice (tuple[str]): Keys of `ADVICE_TEXT`, in report order.
+        - score (float): Engagement score out of 100.
+        """
+        self.duration = float(duration)
+        self.avg_loudness = float(avg_loudness)
+        self.loudness_level = loudness_level
+        self.pauses = np.asarray(pauses, dtype=np.float64).reshape(-1, 3)
+        self.breaks = np.asarray(breaks, dtype=np.float64).reshape(-1, 3)
+        self.avg_pitch = float(avg_pitch)
+        self.avg_prosody = float(avg_prosody)
+        self.pitch_variation = float(pitch_variation)
+        self.speech_rate = float(speech_rate)
+        self.avg_energy = float(avg_energy)
+        self.monotony = monotony
+        self.advice = tuple(advice)
+        self.score = float(score)
+
+
+    @property
+    def pause_count(self):
+        """Number of detected pauses (breaks are counted separately)."""
+        return len(self.pauses)
+
+
+    @property
+    def avg_pause_duration(self):
+        """Total pause time in seconds, as reported by `AudioProcessor.analyse_pauses`."""
+        return float(np.sum(self.pauses[:, 2]))
+
+
+    @property
+    def loudness_feedback(self):
+        """Loudness category and average, e.g. "Balanced: -27.31 dB"."""
+        return f"{self.LOUDNESS_LABELS[self.loudness_level]}: {self.avg_loudness:.2f} dB"
+
+
+    @property
+    def pause_feedback(self):
+        """Pause and break counts with the total pause time."""
+        return f"Detected {self.pause_count} pauses (total {self.avg_pause_duration:.2f} sec) and {len(self.breaks)} breaks."
+
+
+    @property
+    def monotony_feedback(self):
+        """Qualitative assessment of pitch monotony."""
+        return self.MONOTONY_TEXT[self.monotony]
+
+
+    def render(self):
+        """
+        Render the full report: one titled block per metric followed by the advice.
+
+        Returns:
+        - str: Report text.
+        """
+        analysis = (
+            f"Loudness Analysis:\n{self.loudness_feedback}\n\n"
+            f"Pause Analysis:\n{self.pause_feedback}\n\n"
+            f"Pitch Analysis:\nAverage Pitch: {self.avg_pitch:.2f} Hz\n\n"
+            f"Prosody Analysis:\nMean Pitch: {self.avg_prosody:.2f} Hz, Variation: {self.pitch_variation:.2f}\n\n"
+            f"Speech Rate Analysis:\nSpeech Rate: {self.speech_rate:.2f} syllables/second\n\n"
+            f"Vocal Energy Analysis:\nAverage Vocal Energy: {self.avg_energy:.2f}\n\n"
+            f"Monotony Analysis:\n{self.monotony_feedback}\n\n"
+        )
+        advice = "\n\nAdvice:\n" + "".join(f"{self.ADVICE_TEXT[code]}\n\n" for code in self.advice)
+        return analysis + advice
+
+
+    def to_dict(self, intervals=False):
+        """
+        Return the result as JSON-serialisable values.
+
+        Parameters:
+        - intervals (bool): Include the pause and break intervals as lists.
+
+        Returns:
+        - dict: Metrics, per-metric feedback strings, "engagement_score" and "advice" codes.
+        """
+        result = {
+            "duration": self.duration,
+            "avg_loudness": self.avg_loudness,
+            "loudness_feedback": self.loudness_feedback,
+            "pause_count": self.pause_count,
+            "avg_pause_duration": self.avg_pause_duration,
+            "break_count": len(self.breaks),
+            "pause_feedback": self.pause_feedback,
+            "avg_pitch": self.avg_pitch,
+            "avg_prosody": self.avg_prosody,
+            "pitch_variation": self.pitch_variation,
+            "speech_rate": self.speech_rate,
+            "avg_energy": self.avg_energy,
+            "monotony_feedback": self.monotony_feedback,
+            "engagement_score": self.score,
+            "advice": list(self.advice),
+        }
+        if intervals:
+            result["pauses"] = self.pauses.tolist()
+            result["breaks"] = self.breaks.tolist()
+        return result
+
+
+    def __str__(self):
+        return self.render()
+
+
+    def __repr__(self):
+        return f"AnalysisResult(duration={self.duration:.1f}s, score={self.score}, advice={list(self.advice)})"
@@ -4,13 +4,8 @@ import customtkinter as ctk
 import os
 from tkinter import filedialog, messagebox
 from tkinterdnd2 import TkinterDnD  
-from RealTimeAudioAnalyser import RealTimeAudioAnalyser  
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from threading import Thread
-import matplotlib.pyplot as plt
 import numpy as numpy
-from PIL import Image, ImageTk
-import cv2
 
 
 
@@ -39,6 +34,7 @@ class AudioAnalysisApp:
 
         self.face_analyser = None
         self.video_capture = None
+        self.profiler = None
 
 
 
@@ -49,7 +45,7 @@ class AudioAnalysisApp:
 
         - Defines default values for key analysis parameters like pause thresholds, loudness, etc.
         - Tries to load overrides from 'config.txt' located in the ConfigFolder.
-        - If found, replaces the default settings with values from the file.
+        - If found, replaces the default settings with values from the file (as numbers, except for text settings such as `realtime_backpressure`).
         """
         
         self.settings = {
@@ -59,6 +55,15 @@ class AudioAnalysisApp:
             "pause_threshold_value": 0.001,
             "update_interval": 5.0,
             "silence_threshold": 0.012,
+            "analysis_workers": 1,
+            "cache_max_mb": 2048.0,
+            "profile_trace": 0.0,
+            "analysis_rate": 0.0,
+            "voice_gate": 0.0,
+            "record_buffer_minutes": 2.0,
+            "realtime_window": 5.0,
+            "realtime_queue_size": 3,
+            "realtime_backpressure": "drop_oldest",
         }
 
         config_path = os.path.join("Code", "ConfigFolder", "config.txt")
@@ -70,7 +75,7 @@ class AudioAnalysisApp:
                         key = key.strip()
                         value = value.strip()
                         if key in self.settings:
-                            self.settings[key] = float(value)
+                            self.settings[key] = value if isinstance(self.settings[key], str) else float(value)
         else:
             print("Config file not found")
 
@@ -138,6 +143,8 @@ class AudioAnalysisApp:
     ########################## Real-time analysis ###############################
 
     def realtime_analysis_menu(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         from FaceAnalysis import FaceAnalysis
 
         self.stop_webcam_feed()
@@ -733,6 +740,7 @@ class AudioAnalysisApp:
             try:
                 new_settings = {key: float(var.get()) for key, var in settings_vars.items()}
                 self.settings.update(new_settings)
+                self.processor.update_settings(new_settings)
                 with open("Code\ConfigFolder\config.txt", "w") as file:
                     for key, value in new_settings.items():
                         file.write(f"{key}={value}\n")
@@ -948,7 +956,8 @@ class AudioAnalysisApp:
         Process the audio file and generate analysis feedback and graphs in the UI.
 
         This function:
-        - Loads the selected audio file using `AudioProcessor`
+        - Loads the selected audio file using `AudioProcessor`, reusing decoded audio and
+          extracted features from the on-disk `FeatureCache` on repeat runs
         - Performs feedback analysis and updates the engagement score
         - Displays textual feedback and various graphs:
             - Waveform
@@ -957,23 +966,40 @@ class AudioAnalysisApp:
             - Loudness and Pauses Over Time
 
         The graph plotting is performed in a threaded fashion using `PlotManager`.
+
+        When the `profile_trace` setting is on, every stage (load, denoise, each analysis,
+        advice, each plot and the PDF export) is timed by a `StageProfiler` and the trace
+        is written to `Code/analysis_trace.json`.
         """
         from AudioProcessor import AudioProcessor
+        from FeatureCache import FeatureCache
         from PlotManager import PlotManager
+        from StageProfiler import StageProfiler
 
         def background_analysis_and_generate_graphs():
-            audio_processor = AudioProcessor()
-            y, sr = audio_processor.load_audio_file(file_path, noise_suppression_factor=0.15) 
-            if y is None or sr is None:
-                self.update_feedback_with_highlights("Error processing the audio file.")
-                return
-
-            feedback = audio_processor.give_audio_feedback(y, sr)
-            score = audio_processor.engagement_score  
-            self.update_engagement_score(score)
+            audio_processor = AudioProcessor(self.settings)
+            self.profiler = None
+            if self.settings.get("profile_trace", 0.0):
+                self.profiler = StageProfiler(trace_path=os.path.join("Code", "analysis_trace.json"))
+            audio_processor.profiler = self.profiler
+
+            cache = FeatureCache(max_mb=self.settings.get("cache_max_mb", 2048.0))
+            with StageProfiler.maybe(self.profiler, "file_analysis"):
+                y, sr = audio_processor.load_audio_file(
+                    file_path, noise_suppression_factor=0.15, cache=cache, profiler=self.profiler,
+                    analysis_rate=self.settings.get("analysis_rate", 0.0),
+                )
+                if y is None or sr is None:
+                    self.update_feedback_with_highlights("Error processing the audio file.")
+                    return
+
+                result = audio_processor.give_cached_audio_feedback(file_path, y, sr, cache, noise_suppression_factor=0.15)
+            self.update_engagement_score(result.score if result is not None else 0)
             
-            if not feedback:
+            if result is None:
                 feedback = "No feedback could be generated for this audio file."
+            else:
+                feedback = result.render()
  
             self.update_feedback_with_highlights(feedback)
             
@@ -992,7 +1018,7 @@ class AudioAnalysisApp:
                 graph_frame_section = tk.Frame(self.graph_frame, bg=self.colors["background"])
                 graph_frame_section.pack(pady=10, fill=tk.X)
 
-                plot_manager = PlotManager(y, sr, graph_frame_section, graph_type)
+                plot_manager = PlotManager(y, sr, graph_frame_section, graph_type, profiler=self.profiler)
                 plot_manager.plot_graph_in_thread()
             
 
@@ -1093,7 +1119,7 @@ class AudioAnalysisApp:
             messagebox.showerror("Error", "Please select a file first.")
             return
 
-        pdf_exporter = PDFExporter(self.feedback_text)
+        pdf_exporter = PDFExporter(self.feedback_text, profiler=self.profiler)
         pdf_exporter.export_to_pdf()
         
         
@@ -1133,10 +1159,12 @@ class AudioAnalysisApp:
         Exit the application cleanly.
 
         - Cleans up temporary image files.
+        - Stops recording and deletes the live recording's temporary file.
         - Releases webcam resources if active.
         - Properly shuts down the Tkinter window.
         """
         self.cleanup_files()
+        self.analyser.close()
 
         self.root.quit()
         self.root.destroy()
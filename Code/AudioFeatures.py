@@ -0,0 +1,298 @@
+from functools import cached_property
+import librosa
+import numpy as np
+from FrameKernels import FrameKernels
+from PitchTracker import PitchTracker
+from VoiceActivityDetector import VoiceActivityDetector
+
+
+class AudioFeatures:
+    def __init__(self, y, sr, frame_length=2048, hop_length=512, center=True, pitch_engine="piptrack", voice_gate=False):
+        """
+        Shared frame-level feature bundle for a single audio signal.
+
+        Every feature is computed lazily on first access and then cached, so one
+        bundle passed through all of the `analyse_*` methods costs a single STFT,
+        a single pitch track and a single RMS/ZCR envelope (plus the shorter-frame
+        `loudness_rms` envelope the loudness report uses).
+
+        Parameters:
+        - y (np.ndarray): Audio time series.
+        - sr (int): Sampling rate of the audio.
+        - frame_length (int): Frame / FFT size in samples (default 2048).
+        - hop_length (int): Hop size in samples (default 512).
+        - center (bool): Pad the signal so frames are centred (default True). Streamed
+          blocks use False so that frames tile exactly across block boundaries.
+        - pitch_engine (str): Pitch tracker used for `pitch_values` (see `PitchTracker.ENGINES`).
+        - voice_gate (bool): Restrict the pitch track and speech-rate estimate to the frames
+          marked active by `VoiceActivityDetector` (default False). The spectrogram is then
+          only computed for those frames.
+        """
+        self.y = y
+        self.sr = sr
+        self.frame_length = frame_length
+        self.hop_length = hop_length
+        self.center = center
+        self.pitch_engine = pitch_engine
+        self.voice_gate = voice_gate
+
+    REFERENCE_RATE = 44100
+
+    @classmethod
+    def scaled_frames(cls, sr, frame_length=2048, hop_length=512):
+        """
+        Frame and hop sizes at `sr` that span the same durations as the defaults at `REFERENCE_RATE`.
+
+        Used in analysis-rate mode, so features computed on resampled audio keep the
+        time and frequency resolution of the 44.1 kHz recordings the defaults were tuned for.
+
+        Parameters:
+        - sr (int): Sampling rate of the analysed audio.
+        - frame_length (int): Frame size in samples at the reference rate.
+        - hop_length (int): Hop size in samples at the reference rate.
+
+        Returns:
+        - Tuple[int, int]: Even frame length and hop length in samples at `sr`.
+        """
+        scale = sr / cls.REFERENCE_RATE
+        return max(2, 2 * int(round(frame_length * scale / 2))), max(1, int(round(hop_length * scale)))
+
+    @classmethod
+    def from_envelopes(cls, sr, rms, zcr, duration, hop_length=512, voice_gate=False, loudness_rms=None):
+        """
+        Build a bundle from precomputed frame-level envelopes, with no signal attached.
+
+        Used when envelopes were gathered block by block (e.g. while streaming a file),
+        so the RMS/ZCR based analyses can run without the full signal in memory.
+
+        Parameters:
+        - sr (int): Sampling rate the envelopes were computed at.
+        - rms (np.ndarray): Frame-level RMS envelope.
+        - zcr (np.ndarray): Frame-level zero-crossing rate envelope.
+        - duration (float): Duration of the underlying signal in seconds.
+        - hop_length (int): Hop size used for the envelopes.
+        - voice_gate (bool): Gate the speech-rate estimate on voice activity.
+        - loudness_rms (np.ndarray, optional): Frame-level loudness envelope (see `loudness_rms`).
+
+        Returns:
+        - AudioFeatures: Bundle with `rms`, `loudness_rms`, `zcr` and `duration` prefilled.
+        """
+        features = cls(None, sr, hop_length=hop_length, voice_gate=voice_gate)
+        features.rms = rms
+        features.loudness_rms = rms if loudness_rms is None else loudness_rms
+        features.zcr = zcr
+        features.duration = duration
+        return features
+
+    @classmethod
+    def batch(cls, signals, sr, frame_length=2048, hop_length=512, pitch_engine="piptrack", voice_gate=False):
+        """
+        Build centred feature bundles for several clips at the same rate in one pass.
+
+        The clips are zero-padded into one stacked buffer and every frame of every clip
+        is addressed by its offset in it. RMS and ZCR come from one `FrameKernels` pass
+        over the whole buffer (the ZCR rows are edge-padded as `librosa` does), spectra from one `frame_magnitudes` call, and the pitch
+        track from one `librosa.piptrack` call over all frames, which treats every
+        frame independently. The results are then split back per clip, so many short
+        clips cost a few large NumPy calls instead of many small ones.
+
+        Parameters:
+        - signals (list[np.ndarray]): 1D clips sampled at `sr`.
+        - sr (int): Sampling rate of the clips.
+        - frame_length (int): Frame / FFT size in samples.
+        - hop_length (int): Hop size in samples.
+        - pitch_engine (str): Pitch tracker for each bundle. The piptrack spectra and
+          pitch track are only precomputed for "piptrack" without `voice_gate`.
+        - voice_gate (bool): Voice-activity gating for each bundle.
+
+        Returns:
+        - list[AudioFeatures]: One bundle per clip with `rms`, `loudness_rms`, `zcr` (and, for piptrack,
+          `magnitude` and `pitch_track`) prefilled.
+        """
+        signals = [np.asarray(y, dtype=np.float32) for y in signals]
+        half = frame_length // 2
+        row = max(len(y) for y in signals) + 2 * half
+
+        stacked = np.zeros((len(signals), row), dtype=np.float32)
+        edges = np.zeros((len(signals), row), dtype=np.float32)
+        starts, offsets = [], [0]
+        for i, y in enumerate(signals):
+            stacked[i, half:half + len(y)] = y
+            edges[i, half:half + len(y)] = y
+            if len(y):
+                edges[i, :half], edges[i, half + len(y):] = y[0], y[-1]
+            frames = 1 + len(y) // hop_length
+            starts.append(i * row + np.arange(frames) * hop_length)
+            offsets.append(offsets[-1] + frames)
+        starts = np.concatenate(starts)
+
+        flat = stacked.ravel()
+        rms = FrameKernels.frame_rms(flat, starts, frame_length)
+        loudness_length = frame_length // 2
+        loudness_rms = FrameKernels.frame_rms(flat, starts + (frame_length - loudness_length) // 2, loudness_length)
+        zcr = FrameKernels.frame_zcr(edges.ravel(), starts, frame_length)
+
+        track = pitch_engine == "piptrack" and not voice_gate
+        if track:
+            magnitude = cls.frame_magnitudes(flat, starts, frame_length)
+            pitches, magnitudes = librosa.piptrack(S=magnitude, sr=sr, n_fft=frame_length, hop_length=hop_length)
+
+        bundles = []
+        for i, y in enumerate(signals):
+            frames = slice(offsets[i], offsets[i + 1])
+            features = cls(y, sr, frame_length, hop_length, center=True, pitch_engine=pitch_engine, voice_gate=voice_gate)
+            features.rms = rms[frames]
+            features.loudness_rms = loudness_rms[frames]
+            features.zcr = zcr[frames]
+            if track:
+                features.magnitude = magnitude[:, frames]
+                features.pitch_track = (pitches[:, frames], magnitudes[:, frames])
+            bundles.append(features)
+        return bundles
+
+    CACHEABLE = ("rms", "loudness_rms", "zcr", "pitch_values", "duration")
+
+    def to_arrays(self):
+        """
+        Export the features needed by the analyses, computing any that are still missing.
+
+        Returns:
+        - dict: Arrays keyed by the names in `CACHEABLE`.
+        """
+        return {name: np.asarray(getattr(self, name)) for name in self.CACHEABLE}
+
+    def load_arrays(self, arrays):
+        """
+        Prefill cached features from arrays produced by `to_arrays`.
+
+        Parameters:
+        - arrays (dict): Arrays keyed by feature name.
+
+        Returns:
+        - AudioFeatures: This bundle, for chaining.
+        """
+        for name in self.CACHEABLE:
+            if name in arrays:
+                value = arrays[name]
+                setattr(self, name, value.item() if value.ndim == 0 else value)
+        return self
+
+    @cached_property
+    def magnitude(self):
+        """Magnitude spectrogram |STFT| (n_fft = frame_length)."""
+        return np.abs(librosa.stft(self.y, n_fft=self.frame_length, hop_length=self.hop_length, center=self.center))
+
+    @cached_property
+    def voiced(self):
+        """Boolean mask of frames with voice activity (see `VoiceActivityDetector`)."""
+        return VoiceActivityDetector.detect(self.rms, self.zcr, self.sr, self.hop_length)
+
+    SPECTRUM_BLOCK_FRAMES = 128
+
+    @classmethod
+    def frame_magnitudes(cls, y, starts, frame_length):
+        """
+        Hann-windowed magnitude spectra of the frames of `y` that begin at `starts`.
+
+        Frames are strided views of `y`, gathered and transformed `SPECTRUM_BLOCK_FRAMES`
+        at a time, so only the requested frames are ever copied or transformed. Each
+        column equals the matching column of `np.abs(librosa.stft(...))`.
+
+        Parameters:
+        - y (np.ndarray): 1D float32 signal, already padded as the frames require.
+        - starts (np.ndarray): Sample index of the first sample of each frame.
+        - frame_length (int): Frame / FFT size in samples.
+
+        Returns:
+        - np.ndarray: float32 array of shape (1 + frame_length // 2, len(starts)).
+        """
+        frames = np.lib.stride_tricks.sliding_window_view(y, frame_length)
+        window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame_length) / frame_length)).astype(np.float32)
+
+        magnitude = np.empty((1 + frame_length // 2, len(starts)), dtype=np.float32)
+        for start in range(0, len(starts), cls.SPECTRUM_BLOCK_FRAMES):
+            block = starts[start:start + cls.SPECTRUM_BLOCK_FRAMES]
+            magnitude[:, start:start + len(block)] = np.abs(np.fft.rfft(frames[block] * window, axis=1)).T
+        return magnitude
+
+    @cached_property
+    def voiced_magnitude(self):
+        """
+        Magnitude spectrogram of the voice-active frames only, one column per active frame.
+
+        Silent stretches cost no FFTs (see `frame_magnitudes`). The columns equal the
+        matching columns of `magnitude`.
+        """
+        y = np.asarray(self.y, dtype=np.float32)
+        if self.center:
+            y = np.pad(y, self.frame_length // 2)
+        n_frames = 1 + (len(y) - self.frame_length) // self.hop_length
+        active = np.flatnonzero(self.voiced[:n_frames])
+        return self.frame_magnitudes(y, active * self.hop_length, self.frame_length)
+
+    @cached_property
+    def pitch_track(self):
+        """
+        Tuple of (pitches, magnitudes) from `librosa.piptrack` on the shared spectrogram.
+
+        With `voice_gate`, piptrack runs on `voiced_magnitude`, so there is one column per
+        voice-active frame rather than per frame.
+        """
+        S = self.voiced_magnitude if self.voice_gate else self.magnitude
+        return librosa.piptrack(S=S, sr=self.sr, n_fft=self.frame_length, hop_length=self.hop_length)
+
+    @cached_property
+    def pitch_frames(self):
+        """Tuple of (pitches, mask) from the selected pitch engine, one column per frame."""
+        return PitchTracker.track(self, self.pitch_engine)
+
+    @cached_property
+    def pitch_values(self):
+        """Pitch values in Hz from the selected pitch engine."""
+        pitches, mask = self.pitch_frames
+        return pitches[mask]
+
+    def framed(self, pad_mode):
+        """
+        The signal padded as `librosa` pads it for centred frames (unchanged otherwise) and its frame starts.
+        """
+        y = np.asarray(self.y)
+        if self.center:
+            y = np.pad(y, self.frame_length // 2, mode=pad_mode)
+        return y, FrameKernels.frame_starts(len(y), self.frame_length, self.hop_length)
+
+    @cached_property
+    def rms(self):
+        """Frame-level RMS energy envelope (as `librosa.feature.rms`, from `FrameKernels.frame_rms`)."""
+        y, starts = self.framed("constant")
+        return FrameKernels.frame_rms(y, starts, self.frame_length)
+
+    @cached_property
+    def loudness_rms(self):
+        """
+        Frame-level RMS over `frame_length // 2` samples centred in each frame, used for loudness.
+
+        The loudness report has always been computed on 1024-sample frames, which follow
+        level changes more closely than the 2048-sample frames of `rms`. With centred
+        frames this equals `librosa.feature.rms(frame_length=frame_length // 2)` at the
+        same hop; there is one value per frame of `rms` either way.
+        """
+        y, starts = self.framed("constant")
+        length = self.frame_length // 2
+        return FrameKernels.frame_rms(y, starts + (self.frame_length - length) // 2, length)
+
+    @cached_property
+    def zcr(self):
+        """Frame-level zero-crossing rate envelope (as `librosa.feature.zero_crossing_rate`, from `FrameKernels.frame_zcr`)."""
+        y, starts = self.framed("edge")
+        return FrameKernels.frame_zcr(y, starts, self.frame_length)
+
+    @cached_property
+    def times(self):
+        """Start time in seconds of each RMS frame."""
+        return librosa.frames_to_time(np.arange(len(self.rms)), sr=self.sr, hop_length=self.hop_length)
+
+    @cached_property
+    def duration(self):
+        """Duration of the signal in seconds."""
+        return librosa.get_duration(y=self.y, sr=self.sr)
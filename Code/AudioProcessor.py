@@ -1,11 +1,20 @@
+import copy
 import os
 import librosa
 import numpy as np
-import tkinter as tk
 import math
-from AudioAnalysisApp import AudioAnalysisApp
-import librosa
-import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from types import MappingProxyType
+from AnalysisResult import AnalysisResult
+from AudioFeatures import AudioFeatures
+from FrameKernels import FrameKernels
+from NoiseSuppressor import NoiseSuppressor
+from PauseDetector import PauseDetector
+from SessionAccumulator import SessionAccumulator
+from StageProfiler import StageProfiler
+from StreamingFeatures import StreamingFeatures
+from WavReader import WavReader
 
 
 
@@ -15,32 +24,160 @@ class AudioProcessor:
     
     def __init__(self, settings=None):
         """
-        Initialise the AudioProcessor with optional global settings.
+        Initialise the AudioProcessor with optional analysis settings.
+
+        The processor keeps a frozen snapshot of `settings`, so later changes to the
+        caller's dictionary (e.g. the GUI settings page) only apply to processors
+        created afterwards or passed to `update_settings`.
 
         Parameters:
-        - settings (dict, optional): Configuration dictionary for global settings.
+        - settings (dict, optional): Configuration dictionary of analysis settings.
         """
-        self.engagement_score = 0
-        
-        if not hasattr(AudioProcessor, "_global_settings"):
-            AudioProcessor._global_settings = settings if settings is not None else {}
-        self.settings = AudioProcessor._global_settings
+        self.profiler = None
+        self.settings = self.freeze_settings(settings or {})
+
+    @staticmethod
+    def freeze_settings(settings):
+        """
+        Return a read-only snapshot of `settings`.
+
+        Parameters:
+        - settings (Mapping): Settings to copy.
+
+        Returns:
+        - MappingProxyType: Immutable view of a private copy of the settings.
+        """
+        return MappingProxyType(dict(settings))
 
     def update_settings(self, new_settings):
         """
-        Update and apply global settings to all AudioProcessor instances.
+        Replace this processor's settings with a new snapshot that includes `new_settings`.
+
+        Analyses already running keep the snapshot they started with.
 
         Parameters:
         - new_settings (dict): Dictionary of new settings to merge with the existing ones.
         """
-        AudioProcessor._global_settings.update(new_settings)
-        self.settings = AudioProcessor._global_settings
+        self.settings = self.freeze_settings({**self.settings, **new_settings})
+
+    def with_settings(self, overrides=None):
+        """
+        Return a copy of the processor bound to a snapshot of its settings merged with `overrides`.
+
+        Every `give_*` entry point runs on such a copy, so concurrent runs on one
+        processor (e.g. from a thread pool with different threshold configurations)
+        never see each other's settings or a change made mid-run.
+
+        Parameters:
+        - overrides (dict, optional): Settings for this run only.
+
+        Returns:
+        - AudioProcessor: Processor for a single run, sharing the profiler.
+        """
+        run = copy.copy(self)
+        run.settings = self.freeze_settings({**self.settings, **(overrides or {})})
+        run.profiler = self.profiler
+        return run
     
-    def reset_engagement_score(self):
+    def stage(self, name, **details):
         """
-        Reset the internal engagement score to zero.
+        Time a pipeline stage with the attached `StageProfiler`, if any.
+
+        Set `self.profiler` to a `StageProfiler` to record wall time, CPU time and
+        peak memory for loading, denoising, each `analyse_*` method and the advice.
+        Shared features are computed lazily, so their cost is recorded under the first
+        analysis that needs them (the STFT and pitch track under "analyse_pitch").
+
+        Parameters:
+        - name (str): Stage name.
+        - **details: Extra values stored with the stage record.
+
+        Returns:
+        - ContextManager: The profiler's stage, or a no-op context when profiling is off.
+        """
+        return StageProfiler.maybe(self.profiler, name, **details)
+
+    def __getstate__(self):
+        """
+        Leave the profiler behind when the processor is sent to worker processes.
+        """
+        state = self.__dict__.copy()
+        state["profiler"] = None
+        state["settings"] = dict(self.settings)
+        return state
+
+    def __setstate__(self, state):
         """
-        self.engagement_score = 0
+        Restore a processor sent to a worker process, refreezing its settings.
+        """
+        self.__dict__.update(state)
+        self.settings = self.freeze_settings(state["settings"])
+
+    def build_features(self, y, sr, features=None, **kwargs):
+        """
+        Return `features` if given, otherwise build a fresh `AudioFeatures` bundle for `y`.
+
+        The bundle uses the pitch engine named by the `pitch_engine` setting
+        ("piptrack" by default, or "yin" for the speech-band tracker), the frame/hop
+        sizes from `frame_parameters`, and voice-activity gating when the `voice_gate`
+        setting is on.
+
+        Parameters:
+        - y (np.ndarray): Audio time series, or raw samples from `WavReader.view` (converted here).
+        - sr (int): Sampling rate of the audio.
+        - features (AudioFeatures, optional): Existing bundle, if any.
+        - **kwargs: Extra `AudioFeatures` arguments (e.g. `center`).
+
+        Returns:
+        - AudioFeatures: Bundle to read features from.
+        """
+        if features is not None:
+            return features
+        if y.ndim > 1 or y.dtype.kind in "iu":
+            y = WavReader.to_float32(y)
+        frame_length, hop_length = self.frame_parameters(sr)
+        kwargs = {"frame_length": frame_length, "hop_length": hop_length, **kwargs}
+        return AudioFeatures(
+            y, sr, pitch_engine=self.settings.get("pitch_engine", "piptrack"),
+            voice_gate=bool(self.settings.get("voice_gate", 0)), **kwargs,
+        )
+
+    def frame_parameters(self, sr):
+        """
+        Frame and hop sizes for the analyses at `sr`.
+
+        With the `analysis_rate` setting on (e.g. 16000), audio is resampled to that rate
+        when loaded, and frames are scaled to span the same durations as 2048/512 samples
+        at 44.1 kHz (see `AudioFeatures.scaled_frames`). Otherwise the fixed 2048/512 are used.
+
+        Parameters:
+        - sr (int): Sampling rate of the analysed audio.
+
+        Returns:
+        - Tuple[int, int]: Frame length and hop length in samples.
+        """
+        if self.settings.get("analysis_rate"):
+            return AudioFeatures.scaled_frames(sr)
+        return 2048, 512
+
+    @staticmethod
+    def resample_for_analysis(y, sr, analysis_rate):
+        """
+        Resample once to the analysis rate with a polyphase filter.
+
+        Parameters:
+        - y (np.ndarray): Audio time series.
+        - sr (int): Sampling rate of the audio.
+        - analysis_rate (int or None): Target rate. Audio already at or below it is returned as is.
+
+        Returns:
+        - Tuple[np.ndarray, int]: float32 audio and its sampling rate.
+        """
+        if not analysis_rate or int(analysis_rate) >= sr:
+            return y, sr
+        analysis_rate = int(analysis_rate)
+        y = librosa.resample(y, orig_sr=sr, target_sr=analysis_rate, res_type="polyphase")
+        return y.astype(np.float32, copy=False), analysis_rate
 
 
 
@@ -50,59 +187,84 @@ class AudioProcessor:
     ########################## Audio Processing ###############################
 
 
-    def noise_suppression(self, audio, sr, noise_suppression_factor=0.15):
+    def noise_suppression(self, audio, sr, noise_suppression_factor=0.15, block_frames=256, n_fft=2048, hop_length=512):
         """
         Apply simple noise suppression using spectral gating.
 
+        The noise profile is estimated once, then the signal is denoised in blocks of
+        `block_frames` STFT frames and resynthesised by overlap-add (see `NoiseSuppressor`),
+        so working memory stays fixed regardless of the recording length.
+
         Parameters:
         - audio (np.ndarray): Audio signal (1D array).
         - sr (int): Sample rate of the audio.
         - noise_suppression_factor (float): Scaling factor for noise threshold (default 0.15).
+        - block_frames (int): Number of STFT frames held in memory at once (default 256).
+        - n_fft (int): FFT size in samples (default 2048).
+        - hop_length (int): Hop size in samples (default 512).
 
         Returns:
         - np.ndarray: Denoised audio signal.
         """
         noise_suppression_factor = 0.15 if noise_suppression_factor is None else noise_suppression_factor
-            
-        stft = librosa.stft(audio)
-        magnitude, phase = librosa.magphase(stft)
-        noise_profile = np.mean(magnitude[:, :int(sr)], axis=1)
-        noise_threshold = noise_profile * noise_suppression_factor
-        noise_reduced_magnitude = np.maximum(magnitude - noise_threshold[:, np.newaxis], 0)
-        cleaned_stft = noise_reduced_magnitude * phase
-        cleaned_audio = librosa.istft(cleaned_stft).astype(np.float32)
-        return cleaned_audio
+
+        suppressor = NoiseSuppressor(sr, noise_suppression_factor, n_fft, hop_length, block_frames)
+        return suppressor.process(np.asarray(audio, dtype=np.float32))
 
 
     @staticmethod
-    def load_audio_file(file_path, noise_suppression_factor=0.15):
+    def load_audio_file(file_path, noise_suppression_factor=0.15, cache=None, profiler=None, analysis_rate=None):
         """
-        Load an audio file from disk, optionally applying noise suppression.
+        Load an audio file from disk, optionally resampling it and applying noise suppression.
 
         Parameters:
         - file_path (str): Path to the audio file.
         - noise_suppression_factor (float): Strength of noise suppression (default 0.15).
+        - cache (FeatureCache, optional): Cache to reuse decoded, denoised audio from.
+        - profiler (StageProfiler, optional): Records the "load", "resample" and "denoise" stages.
+        - analysis_rate (int, optional): Resample once to this rate (e.g. 16000) before denoising,
+          with the denoiser's frames scaled to match (see `AudioFeatures.scaled_frames`).
 
         Returns:
-        - Tuple[np.ndarray, int]: Tuple of audio chunks and sample rate,
+        - Tuple[np.ndarray, int]: Tuple of the audio signal and sample rate,
           or (None, None) if loading fails.
         """
         try:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
 
-            y, sr = librosa.load(file_path, sr=None, dtype=np.float32)
+            if cache is not None:
+                key = cache.key(
+                    file_path, "pcm", sr=None, noise_suppression_factor=noise_suppression_factor,
+                    analysis_rate=int(analysis_rate) if analysis_rate else None,
+                )
+                with StageProfiler.maybe(profiler, "load", cached=True):
+                    arrays = cache.load(key)
+                if arrays is not None:
+                    return arrays["y"], int(arrays["sr"])
+
+            with StageProfiler.maybe(profiler, "load", cached=False):
+                y, sr = librosa.load(file_path, sr=None, dtype=np.float32)
 
             if not isinstance(y, np.ndarray) or y.ndim != 1:
                 raise ValueError("Invalid audio data format. Expected a numerical 1D NumPy array.")
 
 
+            frames = {}
+            if analysis_rate:
+                with StageProfiler.maybe(profiler, "resample"):
+                    y, sr = AudioProcessor.resample_for_analysis(y, sr, analysis_rate)
+                n_fft, hop_length = AudioFeatures.scaled_frames(sr)
+                frames = {"n_fft": n_fft, "hop_length": hop_length}
+
             if noise_suppression_factor > 0:
-                y = AudioProcessor().noise_suppression(y, sr, noise_suppression_factor)
+                with StageProfiler.maybe(profiler, "denoise"):
+                    y = AudioProcessor().noise_suppression(y, sr, noise_suppression_factor, **frames)
 
-            audio_chunks, _ = AudioProcessor.load_audio_in_chunks(y, sr=sr)
+            if cache is not None:
+                cache.store(key, {"y": y, "sr": sr})
         
-            return audio_chunks, sr
+            return y, sr
 
         except Exception as e:
             print(f"Error while loading file: {e}")
@@ -111,21 +273,40 @@ class AudioProcessor:
 
         
     @staticmethod
-    def load_audio_in_chunks(filename, chunk_size=10.0, sr=None):
+    def load_audio_in_chunks(filename, chunk_size=10.0, sr=None, raw=False):
         """
         Split an audio signal or file into chunks of fixed duration.
 
+        Every chunk is a mono float32 1D array at the returned sample rate, whatever the
+        input. Chunks of an array are slices of it, so they are zero-copy views that share
+        its memory. Uncompressed WAV files read at their native rate (and `WavReader`
+        inputs) are memory-mapped rather than decoded by librosa, and each chunk is
+        converted from the mapping on its own; with `raw` set, the unconverted views of the
+        mapping (samples of the file's type, shaped (frames, channels)) are returned
+        instead. The final chunk holds any remainder shorter than `chunk_size`.
+
         Parameters:
-        - filename (Union[str, np.ndarray]): Audio file path or preloaded 1D NumPy array.
+        - filename (Union[str, np.ndarray, WavReader]): Audio file path, preloaded 1D NumPy array
+          or memory-mapped WAV file.
         - chunk_size (float): Duration of each chunk in seconds.
-        - sr (int): Sample rate (required if input is a NumPy array).
+        - sr (int): Sample rate (required if input is a NumPy array; files are resampled to it if given).
+        - raw (bool): Return raw views of a memory-mapped WAV file at its native rate.
 
         Returns:
-        - Tuple[np.ndarray, int]: Tuple of concatenated audio chunks and sample rate,
+        - Tuple[list[np.ndarray], int]: Tuple of the list of chunks and sample rate,
           or (None, None) if loading fails.
         """
         try:
-            if isinstance(filename, str):
+            reader = AudioProcessor.open_wav(filename)
+            if reader is not None and sr in (None, reader.sr):
+                chunks = reader.chunks(chunk_size)
+                if not raw:
+                    chunks = [WavReader.to_float32(chunk) for chunk in chunks]
+                return chunks, reader.sr
+
+            if isinstance(filename, WavReader):
+                y = librosa.resample(filename.read(), orig_sr=filename.sr, target_sr=sr)
+            elif isinstance(filename, str):
                 y, sr = librosa.load(filename, sr=sr)
             elif isinstance(filename, np.ndarray): 
                 if sr is None:
@@ -137,24 +318,94 @@ class AudioProcessor:
             if not isinstance(y, np.ndarray) or y.ndim != 1:
                 raise ValueError("Input audio must be a 1D numpy array.")
 
-            total_duration = len(y) / sr
-            num_chunks = math.floor(total_duration / chunk_size)
-
-            chunk_samples = int(chunk_size * sr)
+            chunk_samples = max(1, int(chunk_size * sr))
+            num_chunks = math.ceil(len(y) / chunk_samples)
             chunks = [y[i * chunk_samples:(i + 1) * chunk_samples] for i in range(num_chunks)]
 
-            final_chunk = y[num_chunks * chunk_samples:]
-            if len(final_chunk) > 0:
-                chunks.append(final_chunk)
-
-            chunks = [np.atleast_1d(chunk) for chunk in chunks]
-
-            return np.concatenate(chunks), sr
+            return chunks, sr
         except Exception as e:
             print(f"Error loading audio in chunks: {e}")
             return None, None
 
 
+    @staticmethod
+    def open_wav(source):
+        """
+        Return `source` as a `WavReader` if it is one or names a WAV file that can be memory-mapped.
+
+        Parameters:
+        - source: A `WavReader`, a file path, or any other audio input.
+
+        Returns:
+        - WavReader: The reader, or None for compressed files and non-file inputs.
+        """
+        if isinstance(source, WavReader):
+            return source
+        if WavReader.can_read(source):
+            return WavReader(source)
+        return None
+
+
+    @staticmethod
+    def stream_audio_file(file_path, block_duration=10.0, max_memory_mb=64.0, frame_length=2048, hop_length=512):
+        """
+        Stream a mono audio file from disk in fixed-duration blocks at its native sample rate.
+
+        Blocks are read with `librosa.stream`, so only one block is decoded at a time and
+        consecutive blocks overlap by `frame_length - hop_length` samples. Frame-level
+        features computed with `center=False` therefore tile exactly across blocks.
+        Uncompressed WAV files are memory-mapped with `WavReader` and converted block by
+        block instead of being decoded.
+
+        Parameters:
+        - file_path (Union[str, WavReader]): Path to the audio file, or a memory-mapped WAV file.
+        - block_duration (float): Target duration of each block in seconds.
+        - max_memory_mb (float): Ceiling on the size of a decoded block buffer in megabytes.
+        - frame_length (int): Analysis frame size in samples.
+        - hop_length (int): Analysis hop size in samples.
+
+        Yields:
+        - Tuple[np.ndarray, int]: A float32 audio block and the sample rate.
+        """
+        reader = AudioProcessor.open_wav(file_path)
+        if reader is not None:
+            block_frames = AudioProcessor.stream_block_frames(reader.sr, block_duration, max_memory_mb, frame_length, hop_length)
+            for block in reader.stream(block_frames, frame_length, hop_length):
+                yield block, reader.sr
+            return
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        sr = librosa.get_samplerate(file_path)
+        block_frames = AudioProcessor.stream_block_frames(sr, block_duration, max_memory_mb, frame_length, hop_length)
+
+        for block in librosa.stream(file_path, block_length=block_frames, frame_length=frame_length,
+                                    hop_length=hop_length, mono=True, dtype=np.float32):
+            yield block, sr
+
+
+    @staticmethod
+    def stream_block_frames(sr, block_duration, max_memory_mb, frame_length=2048, hop_length=512):
+        """
+        Work out how many analysis frames fit in one streamed block.
+
+        Parameters:
+        - sr (int): Sample rate of the file.
+        - block_duration (float): Target duration of each block in seconds.
+        - max_memory_mb (float): Ceiling on the decoded block buffer in megabytes (float32 samples).
+        - frame_length (int): Analysis frame size in samples.
+        - hop_length (int): Analysis hop size in samples.
+
+        Returns:
+        - int: Number of frames per block (at least 1).
+        """
+        wanted = int(block_duration * sr / hop_length)
+        max_samples = int(max_memory_mb * 1024 * 1024 / np.dtype(np.float32).itemsize)
+        allowed = (max_samples - (frame_length - hop_length)) // hop_length
+        return max(1, min(wanted, allowed))
+
+
 
 
 
@@ -164,105 +415,106 @@ class AudioProcessor:
 
     ########################## Analysis ###############################
 
-    def analyse_loudness(self, y, sr):
+    def analyse_loudness(self, y, sr, features=None):
         """
         Analyse the average loudness of the audio signal and provide qualitative feedback.
 
         Parameters:
         - y (np.ndarray): Audio time series.
         - sr (int): Sampling rate of the audio.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - Tuple[float, str]: Average loudness in dB and a qualitative feedback string.
         """
-        rms = librosa.feature.rms(y=y, frame_length=1024, hop_length=512)[0]
+        rms = self.build_features(y, sr, features).loudness_rms
         avg_loudness = np.mean(librosa.amplitude_to_db(rms, ref=np.max))
 
+        label = AnalysisResult.LOUDNESS_LABELS[self.loudness_level(avg_loudness)]
+        return float(avg_loudness), f"{label}: {avg_loudness:.2f} dB"
+
+
+    def loudness_level(self, avg_loudness):
+        """
+        Classify average loudness against the `loudness_threshold` setting (within 8 dB is balanced).
+
+        Parameters:
+        - avg_loudness (float): Average loudness in dB.
+
+        Returns:
+        - str: "loud", "quiet" or "balanced".
+        """
         threshold = self.settings.get("loudness_threshold", -25.0)
 
         if avg_loudness > threshold + 8:
-            feedback = f"Loud: {avg_loudness:.2f} dB"
+            return "loud"
         elif avg_loudness < threshold - 8:
-            feedback = f"Quiet: {avg_loudness:.2f} dB"
-        else:
-            feedback = f"Balanced: {avg_loudness:.2f} dB"
-        return float(avg_loudness), feedback
+            return "quiet"
+        return "balanced"
 
 
-    def analyse_pauses(self, y, sr):
+    def analyse_pauses(self, y, sr, features=None):
         """
         Detect pauses and breaks in the speech based on RMS energy levels.
 
         Parameters:
         - y (np.ndarray): Audio time series.
         - sr (int): Sampling rate of the audio.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - Tuple[int, float, str]: Number of pauses, total duration of pauses in seconds, and feedback string.
         """
+        pauses, breaks = self.detect_pause_intervals(y, sr, features)
+
+        total_pause_time = float(np.sum(pauses[:, 2]))
+        feedback = f"Detected {len(pauses)} pauses (total {total_pause_time:.2f} sec) and {len(breaks)} breaks."
+
+        return len(pauses), total_pause_time, feedback
+
+
+    def detect_pause_intervals(self, y, sr, features=None):
+        """
+        Locate pause and break intervals from frames whose RMS falls below the pause threshold.
+
+        Parameters:
+        - y (np.ndarray): Audio time series.
+        - sr (int): Sampling rate of the audio.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Pause and break intervals, each of shape (n, 3)
+          holding (start, end, duration) in seconds.
+        """
         min_pause_duration = self.settings.get("pause_duration", 0.3)
         break_duration = self.settings.get("break_duration", 7.0)
         pause_threshold = self.settings.get("pause_threshold_value", 0.001)
 
-
-        rms = librosa.feature.rms(y=y)[0]
-        times = librosa.frames_to_time(np.arange(len(rms)), sr=sr)
-        frame_duration = times[1] - times[0]
+        features = self.build_features(y, sr, features)
+        rms = features.rms
+        times = features.times
+        frame_duration = times[1] - times[0] if len(times) > 1 else 0.0
         frame_duration = max(frame_duration, 0.01)
 
         min_pause_frames = int(min_pause_duration / frame_duration)
         break_frames = int(break_duration / frame_duration)
 
-        pauses = []
-        breaks = []
-        pause_start = None
-        count = 0
-
-        for i, value in enumerate(rms):
-            if value < pause_threshold:
-                if pause_start is None:
-                    pause_start = times[i]
-                    count = 1
-                else:
-                    count += 1
-            else:
-                if pause_start is not None and count >= min_pause_frames:
-                    pause_end = times[i]
-                    pause_duration = pause_end - pause_start
-                    if count >= break_frames:
-                        breaks.append((pause_start, pause_end, pause_duration))
-                    else:
-                        pauses.append((pause_start, pause_end, pause_duration))
-                pause_start = None
-                count = 0
-
-        if pause_start is not None and count >= min_pause_frames:
-            pause_end = times[-1]
-            pause_duration = pause_end - pause_start
-            if count >= break_frames:
-                breaks.append((pause_start, pause_end, pause_duration))
-            else:
-                pauses.append((pause_start, pause_end, pause_duration))
-
-        total_pause_time = sum([p[2] for p in pauses])
-        feedback = f"Detected {len(pauses)} pauses (total {total_pause_time:.2f} sec) and {len(breaks)} breaks."
-
-        return len(pauses), total_pause_time, feedback
+        return PauseDetector.detect_below(rms, pause_threshold, times, min_pause_frames, break_frames)
 
 
-    def analyse_pitch(self, y, sr):
+    def analyse_pitch(self, y, sr, features=None):
         """
         Estimate average pitch from the audio using pitch tracking.
 
         Parameters:
         - y (np.ndarray): Audio signal.
         - sr (int): Sample rate.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - Tuple[float, np.ndarray]: Average pitch and array of pitch values.
         """
-        pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-        pitch_values = pitches[magnitudes > np.median(magnitudes)]
+        pitch_values = self.build_features(y, sr, features).pitch_values
 
         if len(pitch_values) == 0:
             return 0, np.array([])
@@ -270,85 +522,205 @@ class AudioProcessor:
         return avg_pitch, pitch_values
 
 
-    def analyse_prosody(self, y, sr):
+    def analyse_prosody(self, y, sr, features=None):
         """
         Analyse prosody characteristics: average and variability of pitch.
 
         Parameters:
         - y (np.ndarray): Audio signal.
         - sr (int): Sample rate.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - Tuple[float, float]: Mean and standard deviation of pitch values.
         """
-        pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-        pitch_values = pitches[magnitudes > np.median(magnitudes)]
-        
+        pitch_values = self.build_features(y, sr, features).pitch_values
+
         return np.mean(pitch_values), np.std(pitch_values)
 
 
-    def analyse_speech_rate(self, y, sr):
+    def analyse_speech_rate(self, y, sr, features=None):
         """
         Estimate the speech rate based on zero-crossing rate features.
 
+        With voice gating on, only voice-active frames are counted and averaged.
+
         Parameters:
         - y (np.ndarray): Audio signal.
         - sr (int): Sample rate.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - float: Estimated speech rate (units: speech frames per second).
         """
-        zcr = librosa.feature.zero_crossing_rate(y, frame_length=2048, hop_length=512)[0]
+        features = self.build_features(y, sr, features)
+        zcr = features.zcr[features.voiced] if features.voice_gate else features.zcr
+        if len(zcr) == 0:
+            return 0.0
         threshold = np.mean(zcr) + 0.005
         speech_frames = np.sum(zcr > threshold)
-        duration = librosa.get_duration(y=y, sr=sr)
+        duration = features.duration
         speech_rate = speech_frames / duration if duration > 0 else 0.0
 
         return speech_rate
 
 
 
-    def analyse_vocal_energy(self, y, sr):
+    def analyse_vocal_energy(self, y, sr, features=None):
         """
         Compute the average vocal energy of the audio using RMS.
 
         Parameters:
         - y (np.ndarray): Audio signal.
         - sr (int): Sample rate.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - float: Mean RMS value representing vocal energy.
         """
-        rms = librosa.feature.rms(y=y)[0]
+        rms = self.build_features(y, sr, features).rms
 
         return float(np.mean(rms))
 
 
-    def analyse_monotony(self, y, sr):
+    def analyse_monotony(self, y, sr, features=None):
         """
         Assess monotony in speech based on pitch variability.
 
         Parameters:
         - y (np.ndarray): Audio signal.
         - sr (int): Sample rate.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
         - str: Qualitative assessment of pitch monotony.
         """
-        pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-        pitch_values = pitches[magnitudes > np.median(magnitudes)]
-        pitch_values = pitch_values[(pitch_values > 50) & (pitch_values < 500)]
+        pitch_values = self.build_features(y, sr, features).pitch_values
+
+        return AnalysisResult.MONOTONY_TEXT[self.monotony_level(pitch_values)]
+
+
+    def monotony_level(self, pitch_values):
+        """
+        Classify the variability of the 50-500 Hz pitch values.
+
+        Parameters:
+        - pitch_values (np.ndarray): Pitch values in Hz.
+
+        Returns:
+        - str: "none" if no value is in band, otherwise "low" or "good" (see `variation_level`).
+        """
+        pitch_values = FrameKernels.band_values(pitch_values, 50, 500)
 
         if len(pitch_values) == 0:
-            return "Monotony: No valid pitch"
+            return "none"
+        return self.variation_level(np.mean(pitch_values), np.std(pitch_values))
 
-        pitch_std = np.std(pitch_values)
-        avg_pitch = np.mean(pitch_values)
+
+    def variation_level(self, avg_pitch, pitch_std):
+        """
+        Classify pitch variability relative to the average pitch.
+
+        Parameters:
+        - avg_pitch (float): Mean of the in-band pitch values.
+        - pitch_std (float): Standard deviation of the in-band pitch values.
+
+        Returns:
+        - str: "low" if the deviation is under 5% of the mean (at least 10 Hz), else "good".
+        """
         threshold = max(0.05 * avg_pitch, 10)
 
         if pitch_std < threshold:
-            return "Monotony: Low variation"
-        return "Monotony: Good variation"
+            return "low"
+        return "good"
+
+
+    def analyse_timeline(self, y, sr, window=None, hop=None, features=None):
+        """
+        Report loudness, energy, speech rate, pitch variation and pause density per window.
+
+        Every metric is reduced to a per-frame series once, and the window totals are read
+        off cumulative sums, so overlapping windows cost O(1) each instead of re-running the
+        `analyse_*` methods. Thresholds (loudness reference, speech-rate ZCR threshold) are
+        taken from the whole recording so windows are comparable with each other and with
+        the full report.
+
+        Parameters:
+        - y (np.ndarray): Audio time series.
+        - sr (int): Sampling rate of the audio.
+        - window (float, optional): Window length in seconds (defaults to the `timeline_window` setting, 30 s).
+        - hop (float, optional): Step between windows in seconds (defaults to the `timeline_hop` setting, 10 s).
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
+
+        Returns:
+        - dict: Arrays with one entry per window: "start" and "end" in seconds, "loudness"
+          in dB, "energy" (mean RMS), "speech_rate" (speech frames per second),
+          "pitch_variation" (pitch standard deviation in Hz) and "pause_density"
+          (pauses starting per minute).
+        """
+        window = float(self.settings.get("timeline_window", 30.0) if window is None else window)
+        hop = float(self.settings.get("timeline_hop", 10.0) if hop is None else hop)
+
+        features = self.build_features(y, sr, features)
+        rms = features.rms
+        zcr = features.zcr
+        n_frames = len(rms)
+        frame_rate = sr / features.hop_length
+
+        window_frames = max(1, int(round(window * frame_rate)))
+        hop_frames = max(1, int(round(hop * frame_rate)))
+        if n_frames > window_frames:
+            starts = np.arange(0, n_frames - window_frames + 1, hop_frames)
+        else:
+            starts = np.zeros(1, dtype=int)
+        stops = np.minimum(starts + window_frames, n_frames)
+        counts = stops - starts
+        start_times = starts / frame_rate
+        end_times = np.minimum(stops / frame_rate, features.duration)
+        seconds = np.maximum(end_times - start_times, 1e-9)
+
+        loudness = librosa.amplitude_to_db(features.loudness_rms, ref=np.max)
+        speech = zcr > np.mean(zcr) + 0.005 if len(zcr) else np.zeros(0, dtype=bool)
+
+        pauses, _ = self.detect_pause_intervals(y, sr, features)
+        pause_frames = np.searchsorted(features.times, pauses[:, 0]).clip(0, max(n_frames - 1, 0))
+        pause_starts = np.bincount(pause_frames, minlength=n_frames)
+
+        pitches, mask = features.pitch_frames
+        shift = float(np.mean(pitches[mask])) if mask.any() else 0.0
+        offsets = np.where(mask, pitches - shift, 0.0)
+        pitch_count = self.window_sums(mask.sum(axis=0), starts, stops)
+        pitch_sum = self.window_sums(offsets.sum(axis=0), starts, stops)
+        pitch_sum_sq = self.window_sums((offsets * offsets).sum(axis=0), starts, stops)
+        safe_count = np.maximum(pitch_count, 1)
+        pitch_variance = pitch_sum_sq / safe_count - (pitch_sum / safe_count) ** 2
+
+        return {
+            "start": start_times,
+            "end": end_times,
+            "loudness": self.window_sums(loudness, starts, stops) / counts,
+            "energy": self.window_sums(rms, starts, stops) / counts,
+            "speech_rate": self.window_sums(speech, starts, stops) / seconds,
+            "pitch_variation": np.where(pitch_count > 0, np.sqrt(np.maximum(pitch_variance, 0.0)), 0.0),
+            "pause_density": self.window_sums(pause_starts, starts, stops) * 60.0 / seconds,
+        }
+
+
+    @staticmethod
+    def window_sums(values, starts, stops):
+        """
+        Sum `values[start:stop]` for every window using one cumulative sum.
+
+        Parameters:
+        - values (np.ndarray): Per-frame values.
+        - starts (np.ndarray): First frame of each window.
+        - stops (np.ndarray): Exclusive last frame of each window.
+
+        Returns:
+        - np.ndarray: float64 total per window.
+        """
+        prefix = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+        return prefix[stops] - prefix[starts]
 
 
     
@@ -359,128 +731,543 @@ class AudioProcessor:
 
     ########################## Feedback ###############################
 
-    def give_audio_feedback(self, y, sr):
+    def give_audio_feedback(self, y, sr, workers=None, chunk_size=10.0, features=None, settings=None):
         """
         Run a full suite of audio analyses and generate structured feedback and improvement advice.
 
+        All analyses share a single `AudioFeatures` bundle, so the STFT, pitch track and
+        RMS/ZCR envelopes are each computed once per report. With more than one worker the
+        signal is split into chunks that are summarised concurrently in a process pool and
+        merged with `feedback_from_summaries`.
+
+        A `WavReader` can be passed as `y` to analyse a memory-mapped WAV file without
+        loading it: it is streamed block by block in-process, or split into chunks that
+        each worker reads from the mapping.
+
+        An attached profiler records the run as one "audio_feedback" stage, with the
+        analyses nested inside it.
+
         Parameters:
-        - y (np.ndarray): Audio time series.
-        - sr (int): Sampling rate of the audio.
+        - y (Union[np.ndarray, WavReader]): Audio time series, or a memory-mapped WAV file.
+        - sr (int): Sampling rate of the audio (ignored for a `WavReader`).
+        - workers (int, optional): Number of worker processes (defaults to the
+          `analysis_workers` setting, or 1 for in-process analysis).
+        - chunk_size (float): Chunk duration in seconds for parallel analysis.
+        - features (AudioFeatures, optional): Prebuilt feature bundle (e.g. from the cache);
+          when given, the analysis runs in-process on it.
+        - settings (dict, optional): Settings overrides for this run only (see `with_settings`).
 
         Returns:
-        - str: Combined analysis results and tailored advice as a single formatted string.
+        - AnalysisResult: Metrics, pause/break intervals, engagement score and advice codes
+          (`render()` gives the report text), or None if the analysis failed.
         """
         try:
-            self.reset_engagement_score()
-            
-            avg_loudness, loudness_feedback = self.analyse_loudness(y, sr)
-            pause_count, avg_pause_duration, pause_feedback = self.analyse_pauses(y, sr)
-            avg_pitch, pitch_values = self.analyse_pitch(y, sr)
-            avg_prosody, pitch_variation = self.analyse_prosody(y, sr)
-            speech_rate = self.analyse_speech_rate(y, sr)
-            avg_energy = self.analyse_vocal_energy(y, sr)
-            monotony_feedback = self.analyse_monotony(y, sr)
-
-            feedback = (
-                f"Loudness Analysis:\n{loudness_feedback}\n\n"
-                f"Pause Analysis:\n{pause_feedback}\n\n"
-                f"Pitch Analysis:\nAverage Pitch: {avg_pitch:.2f} Hz\n\n"
-                f"Prosody Analysis:\nMean Pitch: {avg_prosody:.2f} Hz, Variation: {pitch_variation:.2f}\n\n"
-                f"Speech Rate Analysis:\nSpeech Rate: {speech_rate:.2f} syllables/second\n\n"
-                f"Vocal Energy Analysis:\nAverage Vocal Energy: {avg_energy:.2f}\n\n"
-                f"Monotony Analysis:\n{monotony_feedback}\n\n"
-            )
-
-            advice = self.generate_advice(avg_loudness, pause_count, avg_pause_duration, avg_pitch, pitch_variation, speech_rate, avg_energy, monotony_feedback)
-            
-            return feedback + advice
+            run = self.with_settings(settings)
+            workers = int(run.settings.get("analysis_workers", 1) if workers is None else workers)
+            with run.stage("audio_feedback", workers=workers):
+                if workers > 1 and features is None:
+                    with run.stage("parallel_analysis", workers=workers):
+                        return run.give_parallel_audio_feedback(y, sr, workers, chunk_size)
+                if isinstance(y, WavReader):
+                    return run.give_audio_feedback_from_file(y, noise_suppression_factor=0)
+
+                return run.analyse_all(y, sr, features)
         except MemoryError:
             print("Memory issue while plotting Fourier Transform. Try using a smaller sample size.")
         except Exception as e:
             print("An error occurred while plotting feedback", e)
-            
 
-    def generate_advice(self, avg_loudness, pause_count, avg_pause_duration, avg_pitch, pitch_variation, speech_rate, avg_energy, monotony_feedback):
+
+    def analyse_all(self, y, sr, features=None):
         """
-        Generate improvement advice based on audio analysis metrics.
+        Run every analysis over one shared feature bundle and score the result.
+
+        The run is one "analyse_all" stage, with a nested stage per analysis, so an
+        attached profiler writes its trace once the whole run has finished.
 
         Parameters:
-        - avg_loudness (float): Average loudness in dB.
-        - pause_count (int): Number of detected pauses.
-        - avg_pause_duration (float): Total duration of pauses.
-        - avg_pitch (float): Average pitch in Hz.
-        - pitch_variation (float): Standard deviation of pitch.
-        - speech_rate (float): Estimated speech rate.
-        - avg_energy (float): Average RMS vocal energy.
-        - monotony_feedback (str): Result from monotony analysis.
+        - y (np.ndarray): Audio time series.
+        - sr (int): Sampling rate of the audio.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
 
         Returns:
-        - str: Tailored advice string based on analysis outcomes.
+        - AnalysisResult: Metrics, pause/break intervals, engagement score and advice codes.
         """
-        advice = "\n\nAdvice:\n"
-        score = 0
+        with self.stage("analyse_all"):
+            features = self.build_features(y, sr, features)
+
+            with self.stage("analyse_loudness"):
+                avg_loudness, _ = self.analyse_loudness(y, sr, features)
+            with self.stage("analyse_pauses"):
+                pauses, breaks = self.detect_pause_intervals(y, sr, features)
+            with self.stage("analyse_pitch"):
+                avg_pitch, pitch_values = self.analyse_pitch(y, sr, features)
+            with self.stage("analyse_prosody"):
+                avg_prosody, pitch_variation = self.analyse_prosody(y, sr, features)
+            with self.stage("analyse_speech_rate"):
+                speech_rate = self.analyse_speech_rate(y, sr, features)
+            with self.stage("analyse_vocal_energy"):
+                avg_energy = self.analyse_vocal_energy(y, sr, features)
+            with self.stage("analyse_monotony"):
+                monotony = self.monotony_level(features.pitch_values)
+
+            return self.advise(AnalysisResult(
+                features.duration, avg_loudness, self.loudness_level(avg_loudness), pauses, breaks,
+                avg_pitch, avg_prosody, pitch_variation, speech_rate, avg_energy, monotony,
+            ))
+
+
+    def give_cached_audio_feedback(self, file_path, y, sr, cache, noise_suppression_factor=0.15, settings=None):
+        """
+        Run `give_audio_feedback`, reusing the file's extracted features from the cache when present.
 
-        # Loudness
-        if avg_loudness > -20:
-            advice += "Your speech is quite loud. Consider lowering your volume or moving slightly away from the microphone.\n\n"
-        elif avg_loudness < -40:
-            advice += "Your speech is very quiet. Try increasing your volume or moving closer to the microphone.\n\n"
-        else:
-            advice += "Your loudness is well-balanced. Keep it up!\n\n"
-            score += 16.7
-
-        # Pauses
-        if pause_count == 0:
-            advice += "Consider adding pauses to give your listeners time to absorb key points.\n\n"
-        elif avg_pause_duration < 0.3:
-            advice += "You have frequent short pauses. Try linking thoughts more fluidly.\n\n"
-        elif avg_pause_duration > 1.5:
-            advice += "Some pauses may be too long. Try reducing long pauses to keep the listener engaged.\n\n"
-        else:
-            advice += "Your pause length is balanced. Keep incorporating pauses naturally.\n\n"
-            score += 16.7
-
-        # Pitch / variation
-        if avg_pitch < 100:
-            advice += "Your pitch is relatively low, which could indicate monotony. Try varying your pitch to engage listeners more effectively.\n\n"
-        elif pitch_variation < 10:
-            advice += "Your speech pitch variation is quite low. Aim for more dynamic shifts in pitch to keep the audience engaged.\n\n"
-        else:
-            advice += "Your pitch variation is good. Keep using that dynamic range to maintain listener interest.\n\n"
-            score += 16.7
-
-        # Speech rate
-        if speech_rate < 2.0:
-            advice += "Your speech rate is a bit slow. Consider speeding up slightly to maintain energy in your delivery.\n\n"
-        elif speech_rate > 4.0:
-            advice += "Your speech rate is quite fast. You might want to slow down to allow your audience to follow better.\n\n"
-        else:
-            advice += "Your speech rate is well balanced. Keep it up!\n\n"
-            score += 16.7
-
-        # Energy
-        if avg_energy < 0.05:
-            advice += "The vocal energy is quite low. Try to put more emphasis into your speech for a stronger delivery.\n\n"
-        elif avg_energy > 0.15:
-            advice += "Your vocal energy is quite high, which is great for engagement, but be mindful not to tire yourself out.\n\n"
-        else:
-            advice += "Your vocal energy is balanced. Continue maintaining this level for a clear and engaging delivery.\n\n"
-            score += 16.7
+        Parameters:
+        - file_path (str): Path of the audio file `y` was loaded from.
+        - y (np.ndarray): Audio time series.
+        - sr (int): Sampling rate of the audio.
+        - cache (FeatureCache): Cache holding feature entries.
+        - noise_suppression_factor (float): Noise suppression applied when `y` was loaded.
+        - settings (dict, optional): Settings overrides for this run only (see `with_settings`).
 
-        # Monotony
-        if 'Monotony: Monotonous speech detected' in monotony_feedback:
-            advice += "Your speech might sound monotonous. Varying your pitch and speed can add more emotion and keep the audience's attention.\n\n"
-        else:
-            advice += "Your speech has a good variation in tone, making it engaging for listeners. Keep it up!\n\n"
-            score += 16.7
+        Returns:
+        - AnalysisResult: Result of `give_audio_feedback`, or None if the analysis failed.
+        """
+        run = self.with_settings(settings)
+        features = run.build_features(y, sr)
+        key = cache.key(
+            file_path, "features", sr=sr, noise_suppression_factor=noise_suppression_factor,
+            frame_length=features.frame_length, hop_length=features.hop_length, pitch_engine=features.pitch_engine,
+            voice_gate=features.voice_gate,
+        )
 
-        self.engagement_score = round(score, 1)
-        return advice
+        with run.stage("feature_cache", kind="load"):
+            arrays = cache.load(key)
+        if arrays is not None:
+            features.load_arrays(arrays)
+
+        feedback = run.give_audio_feedback(y, sr, features=features)
+
+        if arrays is None and feedback is not None:
+            with run.stage("feature_cache", kind="store"):
+                cache.store(key, features.to_arrays())
+        return feedback
+
+
+    BATCH_MAX_FRAMES = 2048
+
+    def give_batch_audio_feedback(self, signals, sr, max_frames=None, settings=None):
+        """
+        Analyse many clips at the same sample rate with batched feature extraction.
+
+        Clips are sorted by length and grouped so each group holds at most `max_frames`
+        analysis frames; each group's RMS, ZCR, spectra and pitch track are computed
+        together by `AudioFeatures.batch`, then every clip gets its own report from
+        `analyse_all`. Results match looping `give_audio_feedback` over the clips.
+
+        Parameters:
+        - signals (list[np.ndarray]): 1D clips sampled at `sr` (e.g. per-slide recordings).
+        - sr (int): Sampling rate shared by the clips.
+        - max_frames (int, optional): Frame budget per group (defaults to `BATCH_MAX_FRAMES`,
+          about 8 MB of float32 spectrum at n_fft=2048).
+        - settings (dict, optional): Settings overrides for this run only (see `with_settings`).
+
+        Returns:
+        - list[AnalysisResult]: One result per clip, in input order.
+        """
+        run = self.with_settings(settings)
+        frame_length, hop_length = run.frame_parameters(sr)
+        max_frames = max_frames or self.BATCH_MAX_FRAMES
+        order = sorted(range(len(signals)), key=lambda i: len(signals[i]))
+        results = [None] * len(signals)
+
+        group = []
+        for position, index in enumerate(order):
+            group.append(index)
+            frames = len(group) * (1 + len(signals[index]) // hop_length)
+            next_frames = (len(group) + 1) * (1 + len(signals[order[position + 1]]) // hop_length) if position + 1 < len(order) else None
+            if next_frames is not None and next_frames <= max_frames:
+                continue
+
+            with run.stage("batch_features", clips=len(group), frames=frames):
+                bundles = AudioFeatures.batch(
+                    [signals[i] for i in group], sr, frame_length, hop_length,
+                    pitch_engine=run.settings.get("pitch_engine", "piptrack"),
+                    voice_gate=bool(run.settings.get("voice_gate", 0)),
+                )
+            for i, features in zip(group, bundles):
+                results[i] = run.analyse_all(features.y, sr, features)
+            group = []
+        return results
+
+
+    def give_parallel_audio_feedback(self, y, sr, workers=None, chunk_size=10.0):
+        """
+        Summarise fixed-duration chunks in a process pool and merge them into one report.
+
+        Chunks are laid out on the frames of the whole signal (see `parallel_chunks`):
+        each one spans whole frames of the zero-padded signal that centred framing uses,
+        and overlaps the next by `frame_length - hop_length` samples. Every chunk is
+        framed with `center=False`, so the merged envelopes are the whole-signal frames,
+        with no padding at chunk edges and no extra frames that would shift later pauses.
+
+        A `WavReader` is passed to the workers by path, and each worker converts only its
+        own chunk of the mapping, so the samples are never copied between processes.
+
+        Parameters:
+        - y (Union[np.ndarray, WavReader]): Audio time series, or a memory-mapped WAV file.
+        - sr (int): Sampling rate of the audio (ignored for a `WavReader`).
+        - workers (int, optional): Number of worker processes (defaults to the CPU count).
+        - chunk_size (float): Chunk duration in seconds.
+
+        Returns:
+        - AnalysisResult: Merged result for the whole signal.
+        """
+        if isinstance(y, WavReader):
+            sr = y.sr
+        elif not isinstance(y, np.ndarray) or y.ndim != 1:
+            raise ValueError("Audio could not be split into chunks.")
+        ranges = self.parallel_chunks(len(y), sr, chunk_size)
+        starts, stops = zip(*ranges)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if isinstance(y, WavReader):
+                summaries = list(executor.map(self.summarise_wav_chunk, repeat(y), starts, stops))
+            else:
+                segments = (self.centred_segment(y, len(y), start, stop, self.frame_parameters(sr)[0] // 2) for start, stop in ranges)
+                summaries = list(executor.map(self.summarise_segment, segments, repeat(sr)))
+
+        duration = y.duration if isinstance(y, WavReader) else len(y) / sr
+        return self.feedback_from_summaries(summaries, sr, duration=duration)
+
+
+    def parallel_chunks(self, n_samples, sr, chunk_size):
+        """
+        Sample ranges of the chunks analysed in parallel, in the centre-padded signal.
+
+        The signal's centred frames are split into runs of about `chunk_size` seconds,
+        and each chunk spans the padded samples of its run of frames.
+
+        Parameters:
+        - n_samples (int): Length of the signal in samples.
+        - sr (int): Sampling rate of the signal.
+        - chunk_size (float): Chunk duration in seconds.
+
+        Returns:
+        - list[Tuple[int, int]]: (start, stop) of each chunk in the signal padded by
+          `frame_length // 2` samples at both ends.
+        """
+        frame_length, hop_length = self.frame_parameters(sr)
+        n_frames = 1 + n_samples // hop_length
+        chunk_frames = max(1, int(chunk_size * sr / hop_length))
+        return [
+            (first * hop_length, (min(first + chunk_frames, n_frames) - 1) * hop_length + frame_length)
+            for first in range(0, n_frames, chunk_frames)
+        ]
+
+
+    @staticmethod
+    def centred_segment(y, n_samples, start, stop, pad):
+        """
+        Samples `start` to `stop` of `y` zero-padded by `pad` at both ends, padding only this segment.
+
+        Parameters:
+        - y (Union[np.ndarray, WavReader]): Signal (a `WavReader` is converted to float32 here).
+        - n_samples (int): Length of the signal in samples.
+        - start (int): First sample in the padded signal.
+        - stop (int): Exclusive last sample in the padded signal.
+        - pad (int): Padding at each end of the signal.
+
+        Returns:
+        - np.ndarray: The segment (a view of `y` when it needs no padding).
+        """
+        lo, hi = min(max(start - pad, 0), n_samples), min(max(stop - pad, 0), n_samples)
+        segment = y.read(lo, hi) if isinstance(y, WavReader) else y[lo:hi]
+        before, after = lo - (start - pad), (stop - pad) - hi
+        if before or after:
+            segment = np.pad(segment, (before, after))
+        return segment
+
+
+    def summarise_segment(self, y, sr):
+        """
+        `summarise_chunk` for a segment framed with `center=False` (see `parallel_chunks`).
+        """
+        return self.summarise_chunk(y, sr, self.build_features(y, sr, center=False))
+
+
+    def summarise_wav_chunk(self, reader, start, stop):
+        """
+        `summarise_segment` for samples `start` to `stop` of a memory-mapped WAV file padded for centred frames.
+        """
+        pad = self.frame_parameters(reader.sr)[0] // 2
+        return self.summarise_segment(self.centred_segment(reader, len(reader), start, stop, pad), reader.sr)
+
+
+    def give_audio_feedback_from_file(self, file_path, block_duration=10.0, settings=None, noise_suppression_factor=0.15):
+        """
+        Run the full analysis suite over a file streamed from disk in bounded-size blocks.
+
+        Only one decoded block is held in memory at a time. Blocks are denoised as they
+        arrive, as `load_audio_file` denoises the whole signal (see
+        `NoiseSuppressor.process_stream`), then framed with `center=False` and reduced to
+        their frame-level RMS/ZCR envelopes and pitch moments, which are merged into the
+        same report as `give_audio_feedback`. The noise profile comes from the start of
+        the file, so with noise suppression the file is read twice: up to the end of the
+        profiled frames, then in full. The memory ceiling for a block is read from the
+        `stream_memory_mb` setting (default 64 MB).
+
+        Parameters:
+        - file_path (Union[str, WavReader]): Path to the audio file, or a memory-mapped WAV file.
+        - block_duration (float): Target duration of each streamed block in seconds.
+        - settings (dict, optional): Settings overrides for this run only (see `with_settings`).
+        - noise_suppression_factor (float): Strength of noise suppression (default 0.15, 0 disables).
+
+        Returns:
+        - AnalysisResult: Merged result for the whole file, or None if streaming failed.
+        """
+        try:
+            run = self.with_settings(settings)
+            max_memory_mb = run.settings.get("stream_memory_mb", 64.0)
+            reader = run.open_wav(file_path)
+            native_sr = reader.sr if reader is not None else librosa.get_samplerate(file_path)
+            duration = reader.duration if reader is not None else librosa.get_duration(path=file_path)
+            frame_length, hop_length = run.frame_parameters(native_sr)
+            block_frames = run.stream_block_frames(native_sr, block_duration, max_memory_mb, frame_length, hop_length)
+
+            def blocks():
+                # Consecutive blocks without overlap (frames of one hop); `stream` reframes them.
+                for block, _ in run.stream_audio_file(reader or file_path, block_duration, max_memory_mb, hop_length, hop_length):
+                    yield block
+
+            pieces = blocks()
+            if noise_suppression_factor > 0:
+                suppressor = NoiseSuppressor(native_sr, noise_suppression_factor, frame_length, hop_length, block_frames)
+                with run.stage("noise_profile"):
+                    noise_profile = suppressor.estimate_stream_noise_profile(blocks())
+                pieces = suppressor.process_stream(blocks(), noise_profile)
+
+            stream = run.start_stream(native_sr, window_seconds=0.0)
+            summaries = []
+            for piece in pieces:
+                features = stream.update(piece)
+                if features is not None:
+                    summaries.append(run.summarise_chunk(features.y, native_sr, features))
+
+            if not summaries:
+                raise ValueError("No audio data could be streamed from the file.")
+
+            return run.feedback_from_summaries(summaries, native_sr, duration=duration)
+        except MemoryError:
+            print("Memory issue while streaming the audio file. Try a smaller stream_memory_mb setting.")
+        except Exception as e:
+            print("An error occurred while streaming feedback", e)
+
+
+    def summarise_chunk(self, y, sr, features=None):
+        """
+        Reduce one chunk of audio to the statistics needed to rebuild a full report.
+
+        Parameters:
+        - y (np.ndarray): Audio chunk.
+        - sr (int): Sampling rate of the audio.
+        - features (AudioFeatures, optional): Shared feature bundle to reuse instead of recomputing.
+
+        Returns:
+        - dict: Frame-level "rms", "loudness_rms" and "zcr" envelopes, their "hop_length", the chunk "duration", and
+          (count, sum, sum of squares) moments for all "pitch" values and for the
+          50-500 Hz "band_pitch" values used by the monotony check.
+        """
+        features = self.build_features(y, sr, features)
+        pitch_values = features.pitch_values
+        band_values = FrameKernels.band_values(pitch_values, 50, 500)
+
+        return {
+            "rms": features.rms,
+            "loudness_rms": features.loudness_rms,
+            "zcr": features.zcr,
+            "hop_length": features.hop_length,
+            "duration": len(y) / sr,
+            "pitch": self.pitch_moments(pitch_values),
+            "band_pitch": self.pitch_moments(band_values),
+        }
+
+
+    @staticmethod
+    def pitch_moments(values):
+        """
+        Return (count, sum, sum of squares) of an array, in float64 for safe merging.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        return len(values), float(np.sum(values)), float(np.sum(values * values))
+
+
+    @staticmethod
+    def mean_and_std(moments):
+        """
+        Convert merged (count, sum, sum of squares) moments to a mean and population standard deviation.
+        """
+        count, total, total_sq = moments
+        if count == 0:
+            return 0.0, 0.0
+        mean = total / count
+        return mean, float(np.sqrt(max(total_sq / count - mean * mean, 0.0)))
+
+
+    def feedback_from_summaries(self, summaries, sr, duration=None):
+        """
+        Merge per-chunk summaries from `summarise_chunk` into a single scored result.
+
+        RMS/ZCR based metrics are computed on the concatenated envelopes, so they match the
+        whole-signal analysis up to frame alignment. Pitch statistics are merged from
+        moments, with the magnitude median threshold applied per chunk.
+
+        Parameters:
+        - summaries (list[dict]): Chunk summaries in playback order.
+        - sr (int): Sampling rate of the audio.
+        - duration (float, optional): Total duration in seconds (defaults to the sum of chunk durations).
+
+        Returns:
+        - AnalysisResult: Metrics, pause/break intervals, engagement score and advice codes.
+        """
+        if duration is None:
+            duration = sum(summary["duration"] for summary in summaries)
+
+        features = AudioFeatures.from_envelopes(
+            sr,
+            rms=np.concatenate([summary["rms"] for summary in summaries]),
+            zcr=np.concatenate([summary["zcr"] for summary in summaries]),
+            duration=duration,
+            hop_length=summaries[0]["hop_length"],
+            voice_gate=bool(self.settings.get("voice_gate", 0)),
+            loudness_rms=np.concatenate([summary["loudness_rms"] for summary in summaries]),
+        )
+
+        avg_loudness, _ = self.analyse_loudness(None, sr, features)
+        pauses, breaks = self.detect_pause_intervals(None, sr, features)
+        speech_rate = self.analyse_speech_rate(None, sr, features)
+        avg_energy = self.analyse_vocal_energy(None, sr, features)
+
+        pitch = tuple(map(sum, zip(*(summary["pitch"] for summary in summaries))))
+        band_pitch = tuple(map(sum, zip(*(summary["band_pitch"] for summary in summaries))))
+        avg_pitch, pitch_variation = self.mean_and_std(pitch)
+        monotony = "none" if band_pitch[0] == 0 else self.variation_level(*self.mean_and_std(band_pitch))
+
+        return self.advise(AnalysisResult(
+            duration, avg_loudness, self.loudness_level(avg_loudness), pauses, breaks,
+            avg_pitch, avg_pitch, pitch_variation, speech_rate, avg_energy, monotony,
+        ))
+
+
+    def advise(self, result):
+        """
+        Choose the advice codes for a result and score it.
+
+        Each metric contributes one code from `AnalysisResult.ADVICE_TEXT`; every metric
+        in its balanced range ("*_ok") adds 16.7 points to the engagement score.
+
+        Parameters:
+        - result (AnalysisResult): Result with its metrics filled in.
+
+        Returns:
+        - AnalysisResult: The same result, with `advice` and `score` set.
+        """
+        with self.stage("advice"):
+            advice = []
+
+            # Loudness
+            if result.avg_loudness > -20:
+                advice.append("loudness_high")
+            elif result.avg_loudness < -40:
+                advice.append("loudness_low")
+            else:
+                advice.append("loudness_ok")
+
+            # Pauses
+            if result.pause_count == 0:
+                advice.append("pauses_none")
+            elif result.avg_pause_duration < 0.3:
+                advice.append("pauses_short")
+            elif result.avg_pause_duration > 1.5:
+                advice.append("pauses_long")
+            else:
+                advice.append("pauses_ok")
+
+            # Pitch / variation
+            if result.avg_pitch < 100:
+                advice.append("pitch_low")
+            elif result.pitch_variation < 10:
+                advice.append("pitch_flat")
+            else:
+                advice.append("pitch_ok")
+
+            # Speech rate
+            if result.speech_rate < 2.0:
+                advice.append("rate_slow")
+            elif result.speech_rate > 4.0:
+                advice.append("rate_fast")
+            else:
+                advice.append("rate_ok")
+
+            # Energy
+            if result.avg_energy < 0.05:
+                advice.append("energy_low")
+            elif result.avg_energy > 0.15:
+                advice.append("energy_high")
+            else:
+                advice.append("energy_ok")
+
+            # Monotony
+            if result.monotony == "low":
+                advice.append("monotony_flat")
+            else:
+                advice.append("monotony_ok")
+
+            result.advice = tuple(advice)
+            result.score = round(16.7 * sum(code.endswith("_ok") for code in advice), 1)
+        return result
 
     
     
     
     
+    def start_session(self, sr):
+        """
+        Start a whole-session report for a live recording.
+
+        Feed each new chunk to `update` on the returned accumulator and call its `report`
+        for the `give_audio_feedback`-style result of everything recorded so far. Each
+        update costs time proportional to the chunk, not to the session.
+
+        Parameters:
+        - sr (int): Sampling rate of the recording.
+
+        Returns:
+        - SessionAccumulator: Empty session using a snapshot of this processor's settings.
+        """
+        return SessionAccumulator(self, sr)
+
+
+    def start_stream(self, sr, window_seconds=None):
+        """
+        Start incremental frame-level features for a live recording.
+
+        Feed each new chunk to `update` on the returned stream. Only the frames the chunk
+        completes are analysed, and its `metrics`/`feedback` summarise a sliding window of
+        frames already computed.
+
+        Parameters:
+        - sr (int): Sampling rate of the recording.
+        - window_seconds (float, optional): Length of the sliding window (defaults to the
+          `realtime_window` setting, 5 s).
+
+        Returns:
+        - StreamingFeatures: Empty stream using a snapshot of this processor's settings.
+        """
+        if window_seconds is None:
+            window_seconds = self.settings.get("realtime_window", 5.0)
+        return StreamingFeatures(self, sr, window_seconds)
+
+
     def give_realtime_audio_feedback(self, y, sr):
         """
         Provide streamlined, real-time feedback on vocal delivery aspects.
@@ -493,10 +1280,11 @@ class AudioProcessor:
         - str: Real-time advice string based on current speaking metrics.
         """
         try:
-            avg_loudness, loudness_feedback = self.analyse_loudness(y, sr)
-            avg_prosody, pitch_variation = self.analyse_prosody(y, sr)
-            speech_rate = self.analyse_speech_rate(y, sr)
-            avg_energy = self.analyse_vocal_energy(y, sr)
+            features = self.build_features(y, sr)
+            avg_loudness, loudness_feedback = self.analyse_loudness(y, sr, features)
+            avg_prosody, pitch_variation = self.analyse_prosody(y, sr, features)
+            speech_rate = self.analyse_speech_rate(y, sr, features)
+            avg_energy = self.analyse_vocal_energy(y, sr, features)
 
             advice = self.generate_realtime_advice(avg_loudness, pitch_variation, speech_rate, avg_energy)
             return advice or "No feedback available for this segment."
@@ -572,6 +1360,9 @@ class AudioProcessor:
         """
         Initialise and run the Tkinter-based GUI for audio analysis.
         """
+        import tkinter as tk
+        from AudioAnalysisApp import AudioAnalysisApp
+
         root = tk.Tk()
         app = AudioAnalysisApp(root)
         root.mainloop()
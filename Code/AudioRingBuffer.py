@@ -0,0 +1,118 @@
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Preallocated single-producer ring buffer of mono float32 samples for live capture.
+
+    The audio callback is the only writer: `write` copies each block once into the
+    ring and then publishes the new total in `written`. Samples are addressed by
+    their absolute index since recording started, so readers (analysis, playback,
+    saving) receive `(start, stop)` index pairs instead of copies of the audio and
+    resolve them with `read` when they need the samples. No lock is taken: a single
+    attribute assignment publishes each block, and readers check afterwards that the
+    range they read was not overwritten in the meantime.
+
+    The ring keeps the most recent `capacity` samples. Its memory is allocated once
+    up front (zero pages are only committed by the OS as they are written).
+    """
+
+    def __init__(self, capacity):
+        """
+        Allocate the ring.
+
+        Parameters:
+        - capacity (int): Number of samples kept.
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive.")
+        self.capacity = int(capacity)
+        self.samples = np.zeros(self.capacity, dtype=np.float32)
+        self.written = 0
+
+
+    @classmethod
+    def for_duration(cls, seconds, sr):
+        """
+        Ring holding `seconds` of audio at `sr` Hz.
+        """
+        return cls(max(1, int(seconds * sr)))
+
+
+    def __len__(self):
+        """Number of samples currently available (at most `capacity`)."""
+        return min(self.written, self.capacity)
+
+
+    @property
+    def oldest(self):
+        """Absolute index of the oldest sample still held."""
+        return max(0, self.written - self.capacity)
+
+
+    def write(self, block):
+        """
+        Append a block of samples (only to be called from the single producer).
+
+        Parameters:
+        - block (np.ndarray): Samples of shape (frames,) or (frames, 1).
+
+        Returns:
+        - Tuple[int, int]: Absolute (start, stop) indices of the block.
+        """
+        block = np.asarray(block, dtype=np.float32).reshape(-1)
+        start = self.written
+        stop = start + len(block)
+
+        block = block[-self.capacity:]
+        position = (stop - len(block)) % self.capacity
+        head = min(len(block), self.capacity - position)
+        self.samples[position:position + head] = block[:head]
+        self.samples[:len(block) - head] = block[head:]
+
+        self.written = stop
+        return start, stop
+
+
+    def read(self, start=None, stop=None):
+        """
+        Samples with absolute indices `start` to `stop`.
+
+        A range that does not wrap around the end of the ring is returned as a view; a
+        wrapped range is copied. Either way, the range is checked again after it has
+        been sliced or copied. A view is only valid until the producer writes over it
+        (once `holds(start)` is False): callers that keep the samples, or hand them to
+        another thread or process, must copy them and then check `holds(start)` to know
+        the copy is intact.
+
+        Parameters:
+        - start (int, optional): First absolute index (defaults to `oldest`).
+        - stop (int, optional): Exclusive last absolute index (defaults to `written`).
+
+        Returns:
+        - np.ndarray: 1D float32 samples.
+
+        Raises:
+        - IndexError: If the range has not been written yet or was already overwritten.
+        """
+        stop = self.written if stop is None else stop
+        start = self.oldest if start is None else start
+        if not start <= stop <= self.written or not self.holds(start):
+            raise IndexError(f"Samples {start}-{stop} are not in the ring (it holds {self.oldest}-{self.written}).")
+
+        position = start % self.capacity
+        end = position + (stop - start)
+        if end <= self.capacity:
+            samples = self.samples[position:end]
+        else:
+            samples = np.concatenate((self.samples[position:], self.samples[:end - self.capacity]))
+        if not self.holds(start):
+            raise IndexError(f"Samples {start}-{stop} were overwritten while being read.")
+        return samples
+
+
+    def holds(self, start):
+        """
+        Return True if the sample at absolute index `start` has not been overwritten.
+        """
+        return start >= self.oldest
@@ -0,0 +1,260 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from AudioProcessor import AudioProcessor
+from StageProfiler import StageProfiler
+
+
+class BatchAnalyser:
+    AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg")
+    CSV_FIELDS = [
+        "file", "duration", "engagement_score", "avg_loudness", "pause_count", "avg_pause_duration", "break_count",
+        "avg_pitch", "avg_prosody", "pitch_variation", "speech_rate", "avg_energy",
+        "monotony_feedback", "elapsed_seconds", "error",
+    ]
+
+    TIMELINE_FIELDS = ["start", "end", "loudness", "energy", "speech_rate", "pitch_variation", "pause_density"]
+
+    def __init__(self, output_dir, workers=None, settings=None, noise_suppression_factor=0.15, timeline=False, trace=False):
+        """
+        Initialise a headless batch run of the `give_audio_feedback` pipeline.
+
+        Parameters:
+        - output_dir (str): Directory for per-file JSON results and the CSV/summary files.
+        - workers (int, optional): Number of worker processes (defaults to the CPU count).
+        - settings (dict, optional): Analysis settings passed to every `AudioProcessor`.
+        - noise_suppression_factor (float): Noise suppression applied when loading files.
+        - timeline (bool): Also write a per-window metric timeline CSV for every file.
+        - trace (bool): Record per-stage timing and memory, saved under "trace" in each file's JSON.
+        """
+        self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.settings = settings or {}
+        self.noise_suppression_factor = noise_suppression_factor
+        self.timeline = timeline
+        self.trace = trace
+
+
+    @staticmethod
+    def load_settings(config_path):
+        """
+        Read `key=value` analysis settings from a config file, as the GUI does.
+
+        Parameters:
+        - config_path (str): Path to the config file.
+
+        Returns:
+        - dict: Settings with float values (empty if the file is missing).
+        """
+        settings = {}
+        if not os.path.exists(config_path):
+            print(f"Config file not found: {config_path}")
+            return settings
+
+        with open(config_path, "r") as file:
+            for line in file:
+                if "=" in line:
+                    key, value = line.strip().split("=", 1)
+                    try:
+                        settings[key.strip()] = float(value.strip())
+                    except ValueError:
+                        settings[key.strip()] = value.strip()
+        return settings
+
+
+    @classmethod
+    def find_audio_files(cls, inputs):
+        """
+        Expand files and directories into a sorted list of audio files.
+
+        Parameters:
+        - inputs (Iterable[str]): File and directory paths. Directories are searched recursively.
+
+        Returns:
+        - list[str]: Audio file paths.
+        """
+        files = set()
+        for path in inputs:
+            if os.path.isdir(path):
+                for folder, _, names in os.walk(path):
+                    files.update(
+                        os.path.join(folder, name) for name in names
+                        if name.lower().endswith(cls.AUDIO_EXTENSIONS)
+                    )
+            elif os.path.isfile(path):
+                files.add(path)
+            else:
+                print(f"Skipping missing input: {path}")
+        return sorted(files)
+
+
+    @staticmethod
+    def analyse_file(file_path, settings, noise_suppression_factor, timeline=False, trace=False):
+        """
+        Load and analyse one file. Runs inside a worker process.
+
+        Parameters:
+        - file_path (str): Path to the audio file.
+        - settings (dict): Analysis settings.
+        - noise_suppression_factor (float): Noise suppression applied when loading.
+        - timeline (bool): Include the `analyse_timeline` arrays under "timeline".
+        - trace (bool): Include a `StageProfiler` trace of the run under "trace".
+
+        Returns:
+        - dict: Metrics, pause/break intervals, engagement score, advice codes, report text
+          and timing for the file, or an "error" entry.
+        """
+        start = time.perf_counter()
+        result = {"file": file_path}
+        profiler = StageProfiler() if trace else None
+
+        try:
+            processor = AudioProcessor()
+            processor.update_settings(settings)
+            processor.profiler = profiler
+            y, sr = processor.load_audio_file(
+                file_path, noise_suppression_factor=noise_suppression_factor, profiler=profiler,
+                analysis_rate=settings.get("analysis_rate"),
+            )
+            if y is None:
+                raise ValueError("Audio could not be loaded.")
+
+            features = processor.build_features(y, sr)
+            analysis = processor.analyse_all(y, sr, features)
+
+            result.update(analysis.to_dict(intervals=True))
+            result["report"] = analysis.render()
+            if timeline:
+                result["timeline"] = processor.analyse_timeline(y, sr, features=features)
+        except Exception as e:
+            result["error"] = str(e)
+
+        if profiler is not None:
+            result["trace"] = profiler.to_dict()
+        result["elapsed_seconds"] = time.perf_counter() - start
+        return result
+
+
+    def run(self, inputs):
+        """
+        Analyse every audio file found in `inputs` across the worker pool and write the results.
+
+        Parameters:
+        - inputs (Iterable[str]): File and directory paths.
+
+        Returns:
+        - dict: Run summary including throughput in audio-hours per wall-clock hour.
+        """
+        files = self.find_audio_files(inputs)
+        os.makedirs(self.output_dir, exist_ok=True)
+        results = []
+        start = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self.analyse_file, path, self.settings, self.noise_suppression_factor, self.timeline, self.trace)
+                for path in files
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                if "timeline" in result:
+                    self.write_timeline(result["file"], result.pop("timeline"))
+                results.append(result)
+                self.write_json(result)
+                status = result.get("error") or f"score {result['engagement_score']}"
+                print(f"[{len(results)}/{len(files)}] {result['file']}: {status}")
+
+        wall_seconds = time.perf_counter() - start
+        results.sort(key=lambda result: result["file"])
+        self.write_csv(results)
+
+        audio_seconds = sum(result.get("duration", 0.0) for result in results)
+        summary = {
+            "files": len(files),
+            "failed": sum(1 for result in results if "error" in result),
+            "workers": self.workers,
+            "audio_hours": audio_seconds / 3600,
+            "wall_seconds": wall_seconds,
+            "audio_hours_per_wall_hour": audio_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+        }
+        with open(os.path.join(self.output_dir, "summary.json"), "w") as file:
+            json.dump(summary, file, indent=2)
+        return summary
+
+
+    def result_path(self, file_path, extension):
+        """
+        Output path for a file's result inside `output_dir`.
+
+        The name is the file's name plus a short hash of its absolute path, so files with
+        the same name in different input folders (or on different drives) do not overwrite
+        each other's results.
+        """
+        path = os.path.normcase(os.path.abspath(file_path))
+        digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.output_dir, f"{stem}_{digest}{extension}")
+
+
+    def write_json(self, result):
+        """Write one file's result as JSON."""
+        with open(self.result_path(result["file"], ".json"), "w") as file:
+            json.dump(result, file, indent=2)
+
+
+    def write_timeline(self, file_path, timeline):
+        """Write one file's per-window metrics as CSV."""
+        with open(self.result_path(file_path, "_timeline.csv"), "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.TIMELINE_FIELDS)
+            writer.writerows(zip(*(timeline[field].tolist() for field in self.TIMELINE_FIELDS)))
+
+
+    def write_csv(self, results):
+        """Write one CSV row per file (without the full report text)."""
+        with open(os.path.join(self.output_dir, "results.csv"), "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(results)
+
+
+def main(argv=None):
+    """
+    Command-line entry point for headless batch analysis.
+    """
+    default_config = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ConfigFolder", "config.txt")
+
+    parser = argparse.ArgumentParser(description="Analyse a batch of lecture recordings without the GUI.")
+    parser.add_argument("inputs", nargs="+", help="Audio files or directories to analyse.")
+    parser.add_argument("-o", "--output-dir", default="batch_results", help="Directory for JSON/CSV results.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("-c", "--config", default=default_config, help="Settings file of key=value lines.")
+    parser.add_argument("-n", "--noise-suppression", type=float, default=0.15, help="Noise suppression factor (0 disables).")
+    parser.add_argument("-t", "--timeline", action="store_true", help="Also write per-window metric timelines (see timeline_window/timeline_hop settings).")
+    parser.add_argument("--trace", action="store_true", help="Record per-stage wall time, CPU time and peak memory in each JSON result.")
+    args = parser.parse_args(argv)
+
+    analyser = BatchAnalyser(
+        args.output_dir,
+        workers=args.workers,
+        settings=BatchAnalyser.load_settings(args.config),
+        noise_suppression_factor=args.noise_suppression,
+        timeline=args.timeline,
+        trace=args.trace,
+    )
+    summary = analyser.run(args.inputs)
+
+    print(
+        f"Analysed {summary['files']} files ({summary['failed']} failed), "
+        f"{summary['audio_hours']:.2f} audio-hours in {summary['wall_seconds']:.1f} s: "
+        f"{summary['audio_hours_per_wall_hour']:.1f} audio-hours per wall-clock hour."
+    )
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
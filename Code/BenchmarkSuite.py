@@ -0,0 +1,1038 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import librosa
+import numpy as np
+import soundfile as sf
+from AudioFeatures import AudioFeatures
+from AudioRingBuffer import AudioRingBuffer
+from AudioProcessor import AudioProcessor
+from NoiseSuppressor import NoiseSuppressor
+from PauseDetector import PauseDetector
+from PitchTracker import PitchTracker
+from RecordingWriter import RecordingWriter
+
+
+class BenchmarkSuite:
+    def __init__(self, repeats=3, seed=0):
+        """
+        Initialise the benchmark suite.
+
+        Parameters:
+        - repeats (int): Number of timed repetitions per measurement (the best time is kept).
+        - seed (int): Seed for the random generator used to build synthetic inputs.
+        """
+        self.repeats = repeats
+        self.rng = np.random.default_rng(seed)
+
+
+    def time_call(self, func, *args, **kwargs):
+        """
+        Time a function call and return the best wall time over `self.repeats` runs.
+
+        Returns:
+        - float: Fastest wall time in seconds.
+        """
+        best = float("inf")
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+
+
+
+
+    ########################## Pause Detection ###############################
+
+
+    @staticmethod
+    def legacy_pause_loop(rms, times, pause_threshold, min_pause_frames, break_frames):
+        """
+        Reference frame-by-frame state machine, as previously used by `analyse_pauses`.
+
+        Returns:
+        - Tuple[list, list]: Pause and break (start, end, duration) tuples.
+        """
+        pauses, breaks = [], []
+        pause_start = None
+        count = 0
+
+        for i, value in enumerate(rms):
+            if value < pause_threshold:
+                if pause_start is None:
+                    pause_start = times[i]
+                    count = 1
+                else:
+                    count += 1
+            else:
+                if pause_start is not None and count >= min_pause_frames:
+                    target = breaks if count >= break_frames else pauses
+                    target.append((pause_start, times[i], times[i] - pause_start))
+                pause_start = None
+                count = 0
+
+        if pause_start is not None and count >= min_pause_frames:
+            target = breaks if count >= break_frames else pauses
+            target.append((pause_start, times[-1], times[-1] - pause_start))
+
+        return pauses, breaks
+
+
+    def synthetic_rms(self, n_frames, silence_probability=0.02):
+        """
+        Build an RMS-like envelope with randomly placed silent stretches.
+
+        Parameters:
+        - n_frames (int): Number of frames.
+        - silence_probability (float): Chance per frame of starting a silent stretch.
+
+        Returns:
+        - np.ndarray: Envelope with values around 0.05 and silent runs near zero.
+        """
+        rms = np.abs(self.rng.normal(0.05, 0.02, n_frames))
+        starts = np.flatnonzero(self.rng.random(n_frames) < silence_probability)
+        lengths = self.rng.integers(2, 400, len(starts))
+        for start, length in zip(starts, lengths):
+            rms[start:start + length] = 0.0005
+        return rms
+
+
+    def benchmark_pause_detection(self, hours=(0.5, 1.0, 3.0), sr=44100, hop_length=512):
+        """
+        Compare the legacy pause loop with the vectorised `PauseDetector` on long envelopes.
+
+        Parameters:
+        - hours (Iterable[float]): Recording lengths to simulate.
+        - sr (int): Sample rate used to convert hours to frames.
+        - hop_length (int): Hop size between RMS frames.
+
+        Returns:
+        - list[dict]: One result row per recording length.
+        """
+        results = []
+        for duration in hours:
+            n_frames = int(duration * 3600 * sr / hop_length)
+            rms = self.synthetic_rms(n_frames)
+            times = np.arange(n_frames) * hop_length / sr
+            args = (0.001, 10, 600)
+
+            legacy = self.time_call(self.legacy_pause_loop, rms, times, *args)
+            vectorised = self.time_call(PauseDetector.detect, rms < args[0], times, *args[1:])
+
+            results.append({
+                "benchmark": "pause_detection",
+                "audio_hours": duration,
+                "frames": n_frames,
+                "legacy_seconds": legacy,
+                "vectorised_seconds": vectorised,
+                "speedup": legacy / vectorised if vectorised > 0 else float("inf"),
+            })
+        return results
+
+
+    ########################## Pitch Tracking ###############################
+
+
+    @staticmethod
+    def synthetic_voiced(duration, sr, f0_start=120.0, f0_end=220.0, harmonics=5):
+        """
+        Build a harmonic voiced tone whose fundamental glides linearly between two frequencies.
+
+        Parameters:
+        - duration (float): Length in seconds.
+        - sr (int): Sample rate.
+        - f0_start (float): Fundamental at the start in Hz.
+        - f0_end (float): Fundamental at the end in Hz.
+        - harmonics (int): Number of harmonics, with amplitude falling as 1/k.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: float32 signal and the true per-sample fundamental.
+        """
+        t = np.arange(int(duration * sr)) / sr
+        f0 = np.linspace(f0_start, f0_end, len(t))
+        phase = 2 * np.pi * np.cumsum(f0) / sr
+        y = sum(np.sin(k * phase) / k for k in range(1, harmonics + 1))
+        y = 0.3 * y / np.max(np.abs(y))
+        return y.astype(np.float32), f0
+
+
+    def benchmark_pitch_engines(self, durations=(5.0, 30.0), sample_rates=(22050, 44100)):
+        """
+        Compare the "piptrack" and "yin" pitch engines for speed and accuracy.
+
+        Accuracy is the absolute error between each engine's mean pitch and the true
+        mean fundamental of a gliding synthetic voiced tone.
+
+        Parameters:
+        - durations (Iterable[float]): Signal lengths in seconds.
+        - sample_rates (Iterable[int]): Sample rates to test.
+
+        Returns:
+        - list[dict]: One result row per engine, duration and sample rate.
+        """
+        results = []
+        for sr in sample_rates:
+            for duration in durations:
+                y, f0 = self.synthetic_voiced(duration, sr)
+                for engine in PitchTracker.ENGINES:
+                    extract = lambda: AudioFeatures(y, sr, pitch_engine=engine).pitch_values
+                    seconds = self.time_call(extract)
+                    values = extract()
+                    mean_pitch = float(np.mean(values)) if len(values) else 0.0
+                    results.append({
+                        "benchmark": "pitch_engine",
+                        "engine": engine,
+                        "sample_rate": sr,
+                        "audio_seconds": duration,
+                        "seconds": seconds,
+                        "true_mean_hz": float(np.mean(f0)),
+                        "mean_pitch_hz": mean_pitch,
+                        "abs_error_hz": abs(mean_pitch - float(np.mean(f0))),
+                    })
+        return results
+
+
+    ########################## Noise Suppression ###############################
+
+
+    @staticmethod
+    def legacy_noise_suppression(audio, sr, noise_suppression_factor=0.15):
+        """
+        Reference whole-signal spectral gating, as previously used by `noise_suppression`.
+        """
+        stft = librosa.stft(audio)
+        magnitude, phase = librosa.magphase(stft)
+        noise_profile = np.mean(magnitude[:, :int(sr)], axis=1)
+        noise_threshold = noise_profile * noise_suppression_factor
+        noise_reduced_magnitude = np.maximum(magnitude - noise_threshold[:, np.newaxis], 0)
+        return librosa.istft(noise_reduced_magnitude * phase).astype(np.float32)
+
+
+    def peak_memory(self, func, *args, **kwargs):
+        """
+        Run a function once under `tracemalloc` and return its peak traced allocation.
+
+        Returns:
+        - float: Peak allocated memory in megabytes.
+        """
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+
+    def benchmark_noise_suppression(self, durations=(60.0, 300.0), sr=22050):
+        """
+        Compare whole-signal and block-wise noise suppression for time, peak memory and error.
+
+        Parameters:
+        - durations (Iterable[float]): Signal lengths in seconds.
+        - sr (int): Sample rate.
+
+        Returns:
+        - list[dict]: One result row per duration.
+        """
+        results = []
+        for duration in durations:
+            y = (self.rng.standard_normal(int(duration * sr)) * 0.05).astype(np.float32)
+            suppressor = NoiseSuppressor(sr)
+            out = np.empty(suppressor.hop_length * (suppressor.frame_count(len(y)) - 1), dtype=np.float32)
+
+            results.append({
+                "benchmark": "noise_suppression",
+                "audio_seconds": duration,
+                "sample_rate": sr,
+                "legacy_seconds": self.time_call(self.legacy_noise_suppression, y, sr),
+                "blockwise_seconds": self.time_call(suppressor.process, y, out),
+                "legacy_peak_mb": self.peak_memory(self.legacy_noise_suppression, y, sr),
+                "blockwise_peak_mb": self.peak_memory(suppressor.process, y, out),
+                "max_abs_error": float(np.max(np.abs(self.legacy_noise_suppression(y, sr) - suppressor.process(y)))),
+            })
+        return results
+
+
+    ########################## Analysis Functions ###############################
+
+
+    ANALYSES = (
+        "analyse_loudness", "analyse_pauses", "analyse_pitch", "analyse_prosody",
+        "analyse_speech_rate", "analyse_vocal_energy", "analyse_monotony",
+    )
+
+    def synthetic_lecture(self, duration, sr, segment=4.0, silence=1.0, noise_level=0.01):
+        """
+        Build a speech-like signal: voiced segments with pitch glides, separated by silences, over background noise.
+
+        Parameters:
+        - duration (float): Length in seconds.
+        - sr (int): Sample rate.
+        - segment (float): Length of each voiced segment in seconds.
+        - silence (float): Length of the silence after each segment in seconds.
+        - noise_level (float): Standard deviation of the background noise.
+
+        Returns:
+        - np.ndarray: float32 signal of `duration * sr` samples.
+        """
+        n_samples = int(duration * sr)
+        parts = []
+        total = 0
+        while total < n_samples:
+            f0_start, f0_end = self.rng.uniform(90.0, 250.0, 2)
+            voiced, _ = self.synthetic_voiced(segment, sr, f0_start, f0_end)
+            parts += [voiced, np.zeros(int(silence * sr), dtype=np.float32)]
+            total += len(voiced) + int(silence * sr)
+
+        y = np.concatenate(parts)[:n_samples]
+        y += self.rng.normal(0.0, noise_level, n_samples).astype(np.float32)
+        return y
+
+
+    def benchmark_analysis(self, durations=(10.0, 60.0), sample_rates=(16000, 22050, 44100)):
+        """
+        Time each `analyse_*` method, `noise_suppression`, `load_audio_file` and `give_audio_feedback`.
+
+        Each `analyse_*` call builds its own features, as it does when called on its own;
+        `give_audio_feedback` shows the cost of the full report with shared features. One
+        short report is run first so one-off JIT compilation in librosa is not timed.
+
+        Parameters:
+        - durations (Iterable[float]): Signal lengths in seconds.
+        - sample_rates (Iterable[int]): Sample rates to test.
+
+        Returns:
+        - list[dict]: One result row per function, duration and sample rate.
+        """
+        processor = AudioProcessor()
+        processor.give_audio_feedback(self.synthetic_lecture(1.0, 22050), 22050, workers=1)
+        results = []
+
+        with tempfile.TemporaryDirectory() as folder:
+            for sr in sample_rates:
+                for duration in durations:
+                    y = self.synthetic_lecture(duration, sr)
+                    path = os.path.join(folder, f"lecture_{sr}_{int(duration)}.wav")
+                    sf.write(path, y, sr)
+
+                    calls = [(name, {}, getattr(processor, name), (y, sr), {}) for name in self.ANALYSES]
+                    calls += [
+                        ("noise_suppression", {}, processor.noise_suppression, (y, sr), {}),
+                        ("load_audio_file", {"noise_suppression_factor": 0.0}, processor.load_audio_file, (path,), {"noise_suppression_factor": 0.0}),
+                        ("load_audio_file", {"noise_suppression_factor": 0.15}, processor.load_audio_file, (path,), {}),
+                        ("give_audio_feedback", {}, processor.give_audio_feedback, (y, sr), {"workers": 1}),
+                    ]
+
+                    for name, params, func, args, kwargs in calls:
+                        seconds = self.time_call(func, *args, **kwargs)
+                        results.append({
+                            "benchmark": "analysis",
+                            "function": name,
+                            **params,
+                            "sample_rate": sr,
+                            "audio_seconds": duration,
+                            "seconds": seconds,
+                            "realtime_factor": duration / seconds if seconds > 0 else float("inf"),
+                        })
+        return results
+
+
+    ########################## Analysis Rate ###############################
+
+
+    DRIFT_METRICS = ("avg_loudness", "pause_count", "avg_pitch", "pitch_variation", "speech_rate", "avg_energy")
+
+    def benchmark_analysis_rate(self, duration=60.0, native_rate=44100, analysis_rates=(22050, 16000, 8000)):
+        """
+        Compare analysing at the native rate with resampling once to a lower analysis rate.
+
+        Each row times polyphase resampling plus the full analysis at the analysis rate
+        (frames scaled with `AudioFeatures.scaled_frames`), and reports how far every metric
+        drifts from the native-rate result and whether the advice codes still agree.
+
+        Parameters:
+        - duration (float): Length of the synthetic lecture in seconds.
+        - native_rate (int): Sample rate the signal is generated at.
+        - analysis_rates (Iterable[int]): Analysis rates to compare.
+
+        Returns:
+        - list[dict]: One result row per analysis rate.
+        """
+        processor = AudioProcessor()
+        y = self.synthetic_lecture(duration, native_rate)
+
+        def analyse(rate):
+            signal, sr = processor.resample_for_analysis(y, native_rate, rate)
+            frame_length, hop_length = AudioFeatures.scaled_frames(sr)
+            return processor.analyse_all(signal, sr, AudioFeatures(signal, sr, frame_length, hop_length))
+
+        native_seconds = self.time_call(analyse, native_rate)
+        reference = analyse(native_rate)
+
+        results = []
+        for rate in analysis_rates:
+            seconds = self.time_call(analyse, rate)
+            result = analyse(rate)
+            row = {
+                "benchmark": "analysis_rate",
+                "sample_rate": rate,
+                "native_rate": native_rate,
+                "audio_seconds": duration,
+                "native_seconds": native_seconds,
+                "seconds": seconds,
+                "speedup": native_seconds / seconds if seconds > 0 else float("inf"),
+                "advice_matches": result.advice == reference.advice,
+            }
+            for metric in self.DRIFT_METRICS:
+                native_value, value = getattr(reference, metric), getattr(result, metric)
+                row[f"{metric}_drift"] = abs(value - native_value)
+                row[f"{metric}_relative_drift"] = abs(value - native_value) / abs(native_value) if native_value else 0.0
+            results.append(row)
+        return results
+
+
+    ########################## Voice Gate ###############################
+
+
+    def benchmark_voice_gate(self, duration=60.0, sr=22050, silences=(1.0, 4.0, 12.0), engines=("piptrack", "yin")):
+        """
+        Compare the full analysis with and without voice-activity gating on lectures with growing silences.
+
+        Each row reports the share of frames `VoiceActivityDetector` marks active, the
+        time of `analyse_all` both ways with one pitch engine, and whether the advice
+        codes agree.
+
+        Parameters:
+        - duration (float): Length of each synthetic lecture in seconds.
+        - sr (int): Sample rate.
+        - silences (Iterable[float]): Silence after each 4 s voiced segment, in seconds.
+        - engines (Iterable[str]): Pitch engines to time (see `PitchTracker.ENGINES`).
+
+        Returns:
+        - list[dict]: One result row per pitch engine and silence length.
+        """
+        results = []
+
+        for engine in engines:
+            ungated = AudioProcessor({"pitch_engine": engine})
+            gated = AudioProcessor({"pitch_engine": engine, "voice_gate": 1.0})
+            for silence in silences:
+                y = self.synthetic_lecture(duration, sr, silence=silence)
+                seconds = self.time_call(ungated.analyse_all, y, sr)
+                gated_seconds = self.time_call(gated.analyse_all, y, sr)
+                features = gated.build_features(y, sr)
+                reference, result = ungated.analyse_all(y, sr), gated.analyse_all(y, sr, features)
+
+                results.append({
+                    "benchmark": "voice_gate",
+                    "function": "analyse_all",
+                    "pitch_engine": engine,
+                    "silence": silence,
+                    "sample_rate": sr,
+                    "audio_seconds": duration,
+                    "active_fraction": float(np.mean(features.voiced)),
+                    "seconds": seconds,
+                    "gated_seconds": gated_seconds,
+                    "speedup": seconds / gated_seconds if gated_seconds > 0 else float("inf"),
+                    "advice_matches": result.advice == reference.advice,
+                })
+        return results
+
+
+    def benchmark_batched_features(self, clip_counts=(50, 200), durations=(0.3, 2.0), sr=22050):
+        """
+        Compare looping `give_audio_feedback` over many short clips with `give_batch_audio_feedback`.
+
+        Parameters:
+        - clip_counts (Iterable[int]): Numbers of clips per batch.
+        - durations (Tuple[float, float]): Range of clip lengths in seconds.
+        - sr (int): Sample rate.
+
+        Returns:
+        - list[dict]: One result row per batch size.
+        """
+        processor = AudioProcessor()
+        results = []
+
+        for count in clip_counts:
+            lengths = self.rng.uniform(durations[0], durations[1], count)
+            clips = [self.synthetic_lecture(length, sr, segment=0.5, silence=0.2) for length in lengths]
+
+            loop = lambda: [processor.give_audio_feedback(clip, sr) for clip in clips]
+            seconds = self.time_call(loop)
+            batched_seconds = self.time_call(processor.give_batch_audio_feedback, clips, sr)
+            reference, batched = loop(), processor.give_batch_audio_feedback(clips, sr)
+
+            results.append({
+                "benchmark": "batched_features",
+                "function": "give_batch_audio_feedback",
+                "clips": count,
+                "sample_rate": sr,
+                "audio_seconds": float(np.sum(lengths)),
+                "seconds": seconds,
+                "batched_seconds": batched_seconds,
+                "speedup": seconds / batched_seconds if batched_seconds > 0 else float("inf"),
+                "advice_matches": all(a.advice == b.advice for a, b in zip(batched, reference)),
+            })
+        return results
+
+
+    ########################## Real-Time Consumer ###############################
+
+
+    @staticmethod
+    def legacy_busy_consumer(analyser):
+        """
+        Reference polling loop, as `RealTimeAudioAnalyser.process_audio` previously ran
+        (skipping the `STOP` sentinel, which it did not know about), over the unbounded
+        `queue.Queue` it used.
+        """
+        while analyser.is_recording or not analyser.analysis_queue.empty():
+            if not analyser.analysis_queue.empty():
+                chunk = analyser.analysis_queue.get()
+                if chunk is not analyser.STOP:
+                    analyser.analyse_chunk(chunk)
+
+
+    def benchmark_realtime_consumer(self, idle_seconds=2.0):
+        """
+        Measure the CPU used by the real-time analysis thread while it waits for chunks.
+
+        A `RealTimeAudioAnalyser` (without a window) is put in the recording state with an
+        empty queue, and the process CPU time is sampled over `idle_seconds` while the
+        consumer thread runs, for the blocking `process_audio` and the previous polling loop.
+
+        Parameters:
+        - idle_seconds (float): Length of the idle period to measure.
+
+        Returns:
+        - list[dict]: One result row per consumer, with CPU seconds and the share of one core used.
+        """
+        import queue
+        import threading
+        from types import SimpleNamespace
+        from AnalysisQueue import AnalysisQueue
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}))
+        consumers = {
+            "process_audio": (analyser.process_audio, AnalysisQueue),
+            "legacy_busy_loop": (lambda: self.legacy_busy_consumer(analyser), queue.Queue),
+        }
+        results = []
+
+        for name, (consumer, make_queue) in consumers.items():
+            analyser.is_recording = True
+            analyser.analysis_queue = make_queue()
+            thread = threading.Thread(target=consumer)
+            thread.start()
+
+            wall, cpu = time.perf_counter(), time.process_time()
+            time.sleep(idle_seconds)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+            analyser.stop_recording()
+            thread.join()
+            results.append({
+                "benchmark": "realtime_consumer",
+                "function": name,
+                "idle_seconds": wall,
+                "cpu_seconds": cpu,
+                "cpu_fraction": cpu / wall,
+            })
+        return results
+
+
+    @staticmethod
+    def legacy_capture(blocks, sr, analysis_queue):
+        """
+        Reference capture path, as `RealTimeAudioAnalyser.record_audio` previously buffered audio:
+        two copies of every block in Python lists, a concatenated copy per analysis chunk and
+        one more for playback.
+        """
+        buffer, audio_buffer = [], []
+        for indata in blocks:
+            buffer.append(indata.copy())
+            audio_buffer.append(indata.copy())
+            if len(buffer) * len(indata) >= sr:
+                analysis_queue.append(np.concatenate(buffer, axis=0))
+                buffer.clear()
+        return np.concatenate(audio_buffer, axis=0)
+
+
+    @staticmethod
+    def ring_capture(blocks, sr, analysis_queue):
+        """
+        Capture path of `RealTimeAudioAnalyser.record_audio` with an `AudioRingBuffer` sized for the whole input.
+        """
+        ring = AudioRingBuffer(sum(len(indata) for indata in blocks))
+        chunk_start = 0
+        for indata in blocks:
+            _, stop = ring.write(indata)
+            if stop - chunk_start >= sr:
+                analysis_queue.append((chunk_start, stop))
+                chunk_start = stop
+        return ring.read()
+
+
+    def benchmark_capture_buffer(self, durations=(60.0, 600.0), sr=44100, block_frames=512):
+        """
+        Compare the legacy list-based capture buffering with the preallocated ring buffer.
+
+        Both are fed the same sequence of (block_frames, 1) float32 callback blocks and
+        return the recording for playback. Rows report the total time, the time per
+        callback block and the peak traced memory.
+
+        Parameters:
+        - durations (Iterable[float]): Recording lengths in seconds.
+        - sr (int): Capture sample rate.
+        - block_frames (int): Frames per audio callback.
+
+        Returns:
+        - list[dict]: One result row per capture path and duration.
+        """
+        results = []
+        for duration in durations:
+            samples = (self.rng.standard_normal(int(duration * sr)) * 0.1).astype(np.float32).reshape(-1, 1)
+            blocks = [samples[start:start + block_frames] for start in range(0, len(samples), block_frames)]
+
+            for name, capture in (("legacy_lists", self.legacy_capture), ("ring_buffer", self.ring_capture)):
+                seconds = self.time_call(capture, blocks, sr, [])
+                results.append({
+                    "benchmark": "capture_buffer",
+                    "function": name,
+                    "sample_rate": sr,
+                    "audio_seconds": duration,
+                    "seconds": seconds,
+                    "seconds_per_block": seconds / len(blocks),
+                    "peak_mb": self.peak_memory(capture, blocks, sr, []),
+                })
+        return results
+
+
+    @staticmethod
+    def legacy_download(blocks, sr, filename):
+        """
+        Reference recording and download, as before `RecordingWriter`: every block kept in memory,
+        then concatenated, normalised and written in one go.
+        """
+        import wave
+
+        audio_array = BenchmarkSuite.legacy_capture(blocks, sr, []).flatten()
+        audio_array = ((audio_array / np.max(np.abs(audio_array))) * 32767).astype(np.int16)
+        with wave.open(filename, "wb") as output:
+            output.setnchannels(1)
+            output.setsampwidth(2)
+            output.setframerate(sr)
+            output.writeframes(audio_array.tobytes())
+
+
+    @staticmethod
+    def spill_download(blocks, sr, filename, window_seconds=120.0):
+        """
+        Recording through a `window_seconds` ring spilled to disk by `RecordingWriter` (written
+        once per second of audio, as its thread would), then exported.
+        """
+        ring = AudioRingBuffer.for_duration(window_seconds, sr)
+        writer = RecordingWriter(ring, sr)
+        try:
+            for indata in blocks:
+                ring.write(indata)
+                if ring.written - writer.flushed >= sr:
+                    writer.write_pending()
+            writer.stop()
+            writer.export(filename)
+        finally:
+            writer.discard()
+
+
+    def benchmark_recording_writer(self, durations=(300.0, 1200.0), sr=44100, block_frames=512):
+        """
+        Compare peak memory and time of recording then downloading, in memory versus spilled to disk.
+
+        Parameters:
+        - durations (Iterable[float]): Recording lengths in seconds.
+        - sr (int): Capture sample rate.
+        - block_frames (int): Frames per audio callback.
+
+        Returns:
+        - list[dict]: One result row per path and duration.
+        """
+        results = []
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "recording.wav")
+            for duration in durations:
+                samples = (self.rng.standard_normal(int(duration * sr)) * 0.1).astype(np.float32).reshape(-1, 1)
+                blocks = [samples[start:start + block_frames] for start in range(0, len(samples), block_frames)]
+
+                for name, record in (("legacy_in_memory", self.legacy_download), ("spill_to_disk", self.spill_download)):
+                    results.append({
+                        "benchmark": "recording_writer",
+                        "function": name,
+                        "sample_rate": sr,
+                        "audio_seconds": duration,
+                        "seconds": self.time_call(record, blocks, sr, filename),
+                        "peak_mb": self.peak_memory(record, blocks, sr, filename),
+                    })
+        return results
+
+
+    @staticmethod
+    def legacy_chunk_metrics(processor, y, sr):
+        """
+        Previous per-chunk real-time analysis: rebuild every feature of the chunk for the
+        silence check, the advice and the metric graphs.
+        """
+        np.mean(librosa.feature.rms(y=y, frame_length=2048, hop_length=512)[0])
+        processor.give_realtime_audio_feedback(y, sr)
+        features = processor.build_features(y, sr)
+        return {
+            "Loudness": processor.analyse_loudness(y, sr, features)[0],
+            "Pitch": processor.analyse_pitch(y, sr, features)[0],
+            "Speech Rate": processor.analyse_speech_rate(y, sr, features),
+            "Energy": processor.analyse_vocal_energy(y, sr, features),
+        }
+
+
+    @staticmethod
+    def streaming_chunk_metrics(stream, session, y):
+        """
+        Current per-chunk real-time analysis (see `RealTimeAudioAnalyser.analyse_chunk`).
+        """
+        features = stream.update(y)
+        session.add_block(len(y), features)
+        stream.feedback()
+        return stream.metrics()
+
+
+    def benchmark_streaming_features(self, duration=60.0, sr=44100, chunk_seconds=1.0):
+        """
+        Compare analysing live chunks from scratch with the streaming feature extractor.
+
+        The legacy path also updates a session accumulator, as `analyse_chunk` did, so both
+        rows cover the same work per chunk.
+
+        Parameters:
+        - duration (float): Length of the simulated recording in seconds.
+        - sr (int): Capture sample rate.
+        - chunk_seconds (float): Length of each analysed chunk.
+
+        Returns:
+        - list[dict]: One result row per path, with the time per chunk.
+        """
+        processor = AudioProcessor()
+        signal = self.synthetic_lecture(duration, sr).astype(np.float32)
+        step = int(chunk_seconds * sr)
+        chunks = [signal[start:start + step] for start in range(0, len(signal) - step + 1, step)]
+
+        def legacy():
+            session = processor.start_session(sr)
+            for y in chunks:
+                session.update(y)
+                self.legacy_chunk_metrics(processor, y, sr)
+
+        def streaming():
+            stream, session = processor.start_stream(sr), processor.start_session(sr)
+            for y in chunks:
+                self.streaming_chunk_metrics(stream, session, y)
+
+        results = []
+        for name, analyse in (("legacy_per_chunk", legacy), ("streaming_features", streaming)):
+            seconds = self.time_call(analyse)
+            results.append({
+                "benchmark": "streaming_features",
+                "function": name,
+                "sample_rate": sr,
+                "audio_seconds": duration,
+                "seconds": seconds,
+                "seconds_per_chunk": seconds / len(chunks),
+            })
+        return results
+
+
+    def benchmark_realtime_backpressure(self, duration=60.0, sr=44100, chunk_seconds=1.0, realtime_factor=200.0, queue_size=3):
+        """
+        Feed live chunks to the analysis worker faster than it can keep up, per queue policy.
+
+        The chunks of a synthetic recording are queued `realtime_factor` times faster than real
+        time. Each one is sent to a `LiveAnalysisWorker` process (with a full report
+        every chunk) by `RealTimeAudioAnalyser.process_audio` for `AnalysisQueue`'s
+        policies, and by the previous polling loop (`legacy_busy_consumer`) over an
+        unbounded `queue.Queue`. The lag of a chunk is the time from queuing its newest
+        samples to its result.
+
+        Parameters:
+        - duration (float): Length of the simulated recording in seconds.
+        - sr (int): Capture sample rate.
+        - chunk_seconds (float): Length of each queued chunk.
+        - realtime_factor (float): How much faster than real time chunks are queued.
+        - queue_size (int): Bound of the `AnalysisQueue`.
+
+        Returns:
+        - list[dict]: One result row per queue, with analysed/dropped/merged chunk counts,
+          the deepest backlog and the mean and worst lag.
+        """
+        import queue
+        import threading
+        from types import SimpleNamespace
+        from AnalysisQueue import AnalysisQueue
+        from LiveAnalysisWorker import LiveAnalysisWorker
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        signal = self.synthetic_lecture(duration, sr).astype(np.float32)
+        ring = AudioRingBuffer(len(signal))
+        ring.write(signal)
+        step = int(chunk_seconds * sr)
+        chunks = [(start, start + step) for start in range(0, len(signal) - step + 1, step)]
+        worker = LiveAnalysisWorker({}, sr)
+        worker.analyse(signal[:step], 0.0)
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}))
+
+        results = []
+        for name, policy in (("legacy_busy_loop", None),) + tuple((policy, policy) for policy in AnalysisQueue.POLICIES):
+            analysis_queue = queue.Queue() if policy is None else AnalysisQueue(queue_size, policy)
+            queued_at, lags, max_depth = {}, [], 0
+
+            def analyse_chunk(chunk, live_worker=None, start=None, analysis_queue=None):
+                if isinstance(chunk, tuple):
+                    start, chunk = chunk[0], ring.read(*chunk)
+                worker.analyse(chunk, 0.0, report=True, start=start)
+                lags.append(time.perf_counter() - queued_at[start + len(chunk)])
+
+            analyser.analysis_queue = analysis_queue
+            analyser.analyse_chunk = analyse_chunk
+            analyser.is_recording = True
+            if policy is None:
+                consumer_name, consumer = "legacy_busy_consumer", threading.Thread(target=self.legacy_busy_consumer, args=(analyser,))
+            else:
+                consumer_name, consumer = "process_audio", threading.Thread(target=analyser.process_audio, args=(analysis_queue, ring))
+            consumer.start()
+            for chunk in chunks:
+                queued_at[chunk[1]] = time.perf_counter()
+                analysis_queue.put(chunk)
+                max_depth = max(max_depth, analysis_queue.qsize())
+                time.sleep(chunk_seconds / realtime_factor)
+            analyser.stop_recording()
+            consumer.join()
+
+            stats = analysis_queue.stats() if policy is not None else {"dropped": 0, "coalesced": 0}
+            results.append({
+                "benchmark": "realtime_backpressure",
+                "function": name,
+                "consumer": consumer_name,
+                "sample_rate": sr,
+                "audio_seconds": duration,
+                "realtime_factor": realtime_factor,
+                "chunks": len(chunks),
+                "analysed": len(lags),
+                "dropped": stats["dropped"],
+                "coalesced": stats["coalesced"],
+                "max_depth": max_depth,
+                "mean_lag_seconds": float(np.mean(lags)),
+                "max_lag_seconds": float(np.max(lags)),
+            })
+        worker.close()
+        return results
+
+
+    ########################## Import Time ###############################
+
+
+    IMPORTS = {
+        "AudioProcessor": "import AudioProcessor",
+        "BatchAnalyser": "import BatchAnalyser",
+        "AudioAnalysisApp": "import AudioAnalysisApp",
+        "gui_stack": (
+            "import tkinter, customtkinter, tkinterdnd2, cv2, PIL.ImageTk, "
+            "matplotlib.backends.backend_tkagg, scipy.signal, RealTimeAudioAnalyser, PlotManager, AudioProcessor"
+        ),
+    }
+    HEAVY_MODULES = ("tkinter", "customtkinter", "matplotlib", "cv2", "PIL", "scipy.signal", "sounddevice", "deepface", "numba")
+
+    def benchmark_import_time(self, imports=None):
+        """
+        Time cold imports, each in a fresh interpreter, and list which heavy modules they pull in.
+
+        "gui_stack" approximates what importing `AudioProcessor` used to load through
+        `AudioAnalysisApp` and its own SciPy imports (Tk, CustomTkinter, OpenCV, PIL,
+        matplotlib's Tk backend and `scipy.signal`);
+        `sounddevice` and `deepface` are left out as they need PortAudio or optional models.
+
+        Parameters:
+        - imports (dict, optional): Names mapped to import statements (defaults to `IMPORTS`).
+
+        Returns:
+        - list[dict]: One result row per import, with the best time and the heavy modules loaded,
+          or an "error" entry if the import failed.
+        """
+        folder = os.path.dirname(os.path.abspath(__file__))
+        script = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "{statement}\n"
+            "seconds = time.perf_counter() - start\n"
+            "print(json.dumps({{'seconds': seconds, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))\n"
+        )
+
+        results = []
+        for name, statement in (imports or self.IMPORTS).items():
+            row = {"benchmark": "import_time", "function": name}
+            best = None
+            for _ in range(self.repeats):
+                process = subprocess.run(
+                    [sys.executable, "-c", script.format(statement=statement, heavy=self.HEAVY_MODULES)],
+                    capture_output=True, text=True, cwd=folder,
+                )
+                if process.returncode != 0:
+                    row["error"] = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "import failed"
+                    break
+                measured = json.loads(process.stdout.strip().splitlines()[-1])
+                if best is None or measured["seconds"] < best["seconds"]:
+                    best = measured
+
+            if best is not None and "error" not in row:
+                row.update({"seconds": best["seconds"], "heavy_modules": best["loaded"]})
+            results.append(row)
+        return results
+
+
+    ########################## Running and Comparing ###############################
+
+
+    BENCHMARKS = {
+        "pause_detection": "benchmark_pause_detection",
+        "pitch_engines": "benchmark_pitch_engines",
+        "noise_suppression": "benchmark_noise_suppression",
+        "analysis": "benchmark_analysis",
+        "analysis_rate": "benchmark_analysis_rate",
+        "voice_gate": "benchmark_voice_gate",
+        "batched_features": "benchmark_batched_features",
+        "realtime_consumer": "benchmark_realtime_consumer",
+        "capture_buffer": "benchmark_capture_buffer",
+        "recording_writer": "benchmark_recording_writer",
+        "streaming_features": "benchmark_streaming_features",
+        "realtime_backpressure": "benchmark_realtime_backpressure",
+        "import_time": "benchmark_import_time",
+    }
+
+    def run(self, names=None):
+        """
+        Run the named benchmarks (all of them by default).
+
+        Parameters:
+        - names (Iterable[str], optional): Keys of `BENCHMARKS` to run.
+
+        Returns:
+        - list[dict]: Combined result rows.
+        """
+        results = []
+        for name in names or self.BENCHMARKS:
+            if name not in self.BENCHMARKS:
+                raise ValueError(f"Unknown benchmark: {name}. Expected one of {sorted(self.BENCHMARKS)}.")
+            results += getattr(self, self.BENCHMARKS[name])()
+        return results
+
+
+    def metadata(self):
+        """
+        Describe the environment a run was measured in, so results from different commits can be compared.
+
+        Returns:
+        - dict: Commit, timestamp, interpreter, library versions and run parameters.
+        """
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            "commit": commit,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "librosa": librosa.__version__,
+            "repeats": self.repeats,
+        }
+
+
+    ROW_KEYS = ("benchmark", "function", "engine", "noise_suppression_factor", "silence", "clips", "sample_rate", "audio_seconds", "audio_hours")
+
+    @classmethod
+    def compare(cls, baseline, current):
+        """
+        Compare timings of matching rows between two result lists.
+
+        Rows are matched on `ROW_KEYS`, and every timing field (ending in "seconds",
+        other than "audio_seconds") is compared.
+
+        Parameters:
+        - baseline (list[dict]): Result rows from the reference run.
+        - current (list[dict]): Result rows from the new run.
+
+        Returns:
+        - list[dict]: One row per matched timing with the baseline and current seconds
+          and their ratio (above 1 means the current run is slower).
+        """
+        row_key = lambda row: tuple((key, row[key]) for key in cls.ROW_KEYS if key in row)
+        reference = {row_key(row): row for row in baseline}
+        comparison = []
+
+        for row in current:
+            old = reference.get(row_key(row))
+            if old is None:
+                continue
+            for field, value in row.items():
+                if field.endswith("seconds") and field != "audio_seconds" and field in old:
+                    comparison.append({
+                        **dict(row_key(row)),
+                        "field": field,
+                        "baseline": old[field],
+                        "current": value,
+                        "ratio": value / old[field] if old[field] > 0 else float("inf"),
+                    })
+        return comparison
+
+
+def main(argv=None):
+    """
+    Command-line entry point: run the benchmarks and print or save the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the audio analysis pipeline.")
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BenchmarkSuite.BENCHMARKS)}).")
+    parser.add_argument("-r", "--repeats", type=int, default=3, help="Timed repetitions per measurement (best is kept).")
+    parser.add_argument("-o", "--output", default=None, help="Write the JSON results to this file instead of stdout.")
+    parser.add_argument("--compare", default=None, help="Earlier JSON results to compare timings against.")
+    args = parser.parse_args(argv)
+
+    suite = BenchmarkSuite(repeats=args.repeats)
+    report = {"metadata": suite.metadata(), "results": suite.run(args.benchmarks)}
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            report["comparison"] = BenchmarkSuite.compare(json.load(file)["results"], report["results"])
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Wrote {len(report['results'])} benchmark results to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
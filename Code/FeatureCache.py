@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+
+
+class FeatureCache:
+    """
+    Content-addressed on-disk cache for decoded audio and extracted features.
+
+    Entries are keyed by a SHA-256 of the audio file's contents plus the parameters
+    that affect the stored arrays, and are saved as compressed NumPy archives. Reading
+    an entry refreshes its modification time, and the least recently used entries are
+    evicted whenever the cache grows beyond its disk budget.
+    """
+
+    _file_hashes = {}
+
+    def __init__(self, cache_dir=None, max_mb=2048.0, compress=True):
+        """
+        Initialise the cache.
+
+        Parameters:
+        - cache_dir (str, optional): Directory for cache entries (default `Code/CacheFolder`).
+        - max_mb (float): Disk budget in megabytes before LRU eviction kicks in.
+        - compress (bool): Store archives with `np.savez_compressed` (default True).
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CacheFolder")
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.compress = compress
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+
+    @classmethod
+    def file_hash(cls, file_path, block_size=1 << 20):
+        """
+        SHA-256 of a file's contents, memoised per (path, size, modification time).
+
+        Parameters:
+        - file_path (str): Path to the file.
+        - block_size (int): Read size in bytes.
+
+        Returns:
+        - str: Hex digest.
+        """
+        stat = os.stat(file_path)
+        memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in cls._file_hashes:
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as file:
+                for block in iter(lambda: file.read(block_size), b""):
+                    digest.update(block)
+            cls._file_hashes[memo_key] = digest.hexdigest()
+        return cls._file_hashes[memo_key]
+
+
+    def key(self, file_path, kind, **params):
+        """
+        Build the cache key for a file and the parameters that produced an entry.
+
+        Parameters:
+        - file_path (str): Path to the source audio file.
+        - kind (str): Entry type, e.g. "pcm" or "features".
+        - **params: Parameters that change the cached arrays (sample rate, noise factor, frame/hop...).
+
+        Returns:
+        - str: Hex key.
+        """
+        description = json.dumps({"file": self.file_hash(file_path), "kind": kind, **params}, sort_keys=True, default=str)
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+    def path_for(self, key):
+        """Location of the archive for `key`."""
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+
+    def load(self, key):
+        """
+        Load an entry and mark it as recently used.
+
+        Parameters:
+        - key (str): Cache key.
+
+        Returns:
+        - dict or None: Mapping of array names to arrays, or None on a miss.
+        """
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+            os.utime(path)
+            return arrays
+        except Exception as e:
+            print(f"Discarding unreadable cache entry {path}: {e}")
+            self.remove(path)
+            return None
+
+
+    def store(self, key, arrays):
+        """
+        Save an entry atomically, then evict old entries if over budget.
+
+        Parameters:
+        - key (str): Cache key.
+        - arrays (dict): Mapping of array names to NumPy arrays or scalars.
+        """
+        save = np.savez_compressed if self.compress else np.savez
+        handle, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+
+        try:
+            with os.fdopen(handle, "wb") as file:
+                save(file, **arrays)
+            os.replace(temp_path, self.path_for(key))
+        except Exception as e:
+            print(f"Could not write cache entry: {e}")
+            self.remove(temp_path)
+            return
+
+        self.evict()
+
+
+    def evict(self):
+        """
+        Delete least recently used entries until the cache fits in its disk budget.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npz"):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.remove(path)
+            total -= size
+
+
+    @staticmethod
+    def remove(path):
+        """Delete a file, ignoring it if already gone."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,229 @@
+import math
+import numpy as np
+
+
+class FrameKernels:
+    """
+    Frame-level kernels for RMS framing, zero-crossing counting, pause segmentation and
+    pitch-band filtering.
+
+    Each kernel has a NumPy version and a plain loop version. When `numba` is installed
+    (it ships with `librosa`), the loop versions are compiled on first use (cached on
+    disk, and releasing the GIL) and replace the NumPy ones, so a kernel makes one pass
+    over the samples without the temporary arrays NumPy needs. Both versions perform the
+    same floating-point operations in the same order, so their results are identical.
+    `numba` is only imported by the first kernel call, keeping it out of
+    `import AudioProcessor`; `ACCELERATED` turns False if it is missing. Set
+    `ACCELERATED = False` to force the NumPy versions.
+
+    Frame kernels take explicit, sorted frame start offsets so the same code serves
+    single signals and the stacked buffers of `AudioFeatures.batch`.
+    """
+
+    ACCELERATED = True
+    ZERO_THRESHOLD = 1e-10
+    compiled = {}
+
+    @classmethod
+    def kernel(cls, name):
+        """
+        Compiled loop version of kernel `name`, or None to use the NumPy version.
+        """
+        if not cls.ACCELERATED:
+            return None
+        if name not in cls.compiled:
+            try:
+                import numba
+            except ImportError:
+                cls.ACCELERATED = False
+                return None
+            cls.compiled[name] = numba.njit(cache=True, nogil=True)(getattr(cls, f"loop_{name}"))
+        return cls.compiled[name]
+
+
+    @staticmethod
+    def frame_starts(length, frame_length, hop_length):
+        """
+        Start offsets of the full frames of a signal of `length` samples (none if it is shorter than a frame).
+        """
+        return np.arange(max(0, 1 + (length - frame_length) // hop_length), dtype=np.int64) * hop_length
+
+
+    ########################## RMS ###############################
+
+
+    @classmethod
+    def frame_rms(cls, y, starts, frame_length):
+        """
+        Root-mean-square of the frames of `y` starting at `starts`.
+
+        Squares are summed in float64 as one running total, and each frame is the
+        difference of that total at its two ends.
+
+        Parameters:
+        - y (np.ndarray): 1D signal.
+        - starts (np.ndarray): Sorted frame start offsets, each at most `len(y) - frame_length`.
+        - frame_length (int): Frame size in samples.
+
+        Returns:
+        - np.ndarray: RMS of each frame (float32, as `librosa.feature.rms` returns).
+        """
+        y = np.ascontiguousarray(y)
+        starts = np.ascontiguousarray(starts, dtype=np.int64)
+        kernel = cls.kernel("frame_rms")
+        if kernel is None:
+            return cls.numpy_frame_rms(y, starts, frame_length)
+        return kernel(y, starts, frame_length)
+
+
+    @staticmethod
+    def numpy_frame_rms(y, starts, frame_length):
+        power = np.concatenate(([0.0], np.cumsum(np.square(y, dtype=np.float64))))
+        return np.sqrt(np.maximum(power[starts + frame_length] - power[starts], 0.0) / frame_length).astype(np.float32)
+
+
+    @staticmethod
+    def loop_frame_rms(y, starts, frame_length):
+        out = np.empty(len(starts), dtype=np.float32)
+        opened = np.empty(len(starts))
+        first = last = 0
+        total = 0.0
+        for i in range(len(y) + 1):
+            while first < len(starts) and starts[first] == i:
+                opened[first] = total
+                first += 1
+            while last < len(starts) and starts[last] + frame_length == i:
+                out[last] = math.sqrt(max(total - opened[last], 0.0) / frame_length)
+                last += 1
+            if last == len(starts) or i == len(y):
+                break
+            sample = np.float64(y[i])
+            total += sample * sample
+        return out
+
+
+    ########################## Zero Crossings ###############################
+
+
+    @classmethod
+    def frame_zcr(cls, y, starts, frame_length):
+        """
+        Zero-crossing rate of the frames of `y` starting at `starts`, as `librosa.feature.zero_crossing_rate` counts it.
+
+        Samples within `ZERO_THRESHOLD` of zero count as positive, and a crossing is
+        counted at the later of two samples, so the first sample of a frame never holds one.
+
+        Parameters:
+        - y (np.ndarray): 1D signal.
+        - starts (np.ndarray): Sorted frame start offsets, each at most `len(y) - frame_length`.
+        - frame_length (int): Frame size in samples.
+
+        Returns:
+        - np.ndarray: Crossings per sample of each frame (float64).
+        """
+        y = np.ascontiguousarray(y)
+        starts = np.ascontiguousarray(starts, dtype=np.int64)
+        kernel = cls.kernel("frame_zcr")
+        if kernel is None:
+            return cls.numpy_frame_zcr(y, starts, frame_length)
+        return kernel(y, starts, frame_length, y.dtype.type(cls.ZERO_THRESHOLD))
+
+
+    @classmethod
+    def numpy_frame_zcr(cls, y, starts, frame_length):
+        signs = np.signbit(y) & (np.abs(y) > cls.ZERO_THRESHOLD)
+        changes = np.concatenate(([0, 0], np.cumsum(signs[1:] != signs[:-1])))
+        return (changes[starts + frame_length] - changes[starts + 1]) / frame_length
+
+
+    @staticmethod
+    def loop_frame_zcr(y, starts, frame_length, threshold):
+        out = np.empty(len(starts))
+        opened = np.empty(len(starts), dtype=np.int64)
+        first = last = 0
+        changes = 0
+        previous = False
+        for i in range(len(y) + 1):
+            while first < len(starts) and starts[first] + 1 == i:
+                opened[first] = changes
+                first += 1
+            while last < len(starts) and starts[last] + frame_length == i:
+                out[last] = (changes - opened[last]) / frame_length
+                last += 1
+            if last == len(starts) or i == len(y):
+                break
+            negative = y[i] < 0 and abs(y[i]) > threshold
+            if i > 0 and negative != previous:
+                changes += 1
+            previous = negative
+        return out
+
+
+    ########################## Runs and Bands ###############################
+
+
+    @classmethod
+    def silent_runs(cls, values, threshold):
+        """
+        Start and exclusive stop indices of the runs of `values` below `threshold`.
+
+        The compiled version compares and segments in one pass instead of building the
+        mask first (see `PauseDetector.find_runs`).
+        """
+        values = np.ascontiguousarray(values).ravel()
+        threshold = values.dtype.type(threshold)
+        kernel = cls.kernel("silent_runs")
+        if kernel is None:
+            return cls.numpy_silent_runs(values, threshold)
+        return kernel(values, threshold)
+
+
+    @staticmethod
+    def numpy_silent_runs(values, threshold):
+        padded = np.concatenate(([False], values < threshold, [False]))
+        edges = np.flatnonzero(padded[1:] != padded[:-1]).astype(np.int64)
+        return edges[0::2], edges[1::2]
+
+
+    @staticmethod
+    def loop_silent_runs(values, threshold):
+        edges = np.empty(len(values) + 1, dtype=np.int64)
+        count = 0
+        previous = False
+        for i in range(len(values)):
+            silent = values[i] < threshold
+            edges[count] = i
+            count += silent != previous
+            previous = silent
+        if previous:
+            edges[count] = len(values)
+            count += 1
+        return edges[0:count:2].copy(), edges[1:count:2].copy()
+
+
+    @classmethod
+    def band_values(cls, values, low, high):
+        """
+        The values strictly between `low` and `high`, in order (e.g. the 50-500 Hz pitch band).
+        """
+        values = np.ascontiguousarray(values).ravel()
+        kernel = cls.kernel("band_values")
+        if kernel is None:
+            return cls.numpy_band_values(values, low, high)
+        return kernel(values, low, high)
+
+
+    @staticmethod
+    def numpy_band_values(values, low, high):
+        return values[(values > low) & (values < high)]
+
+
+    @staticmethod
+    def loop_band_values(values, low, high):
+        out = np.empty_like(values)
+        count = 0
+        for value in values:
+            if value > low and value < high:
+                out[count] = value
+                count += 1
+        return out[:count].copy()
@@ -0,0 +1,134 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from AudioProcessor import AudioProcessor
+
+
+class LiveAnalysisWorker:
+    """
+    Runs the analysis of live audio chunks in a separate worker process.
+
+    The worker process keeps the recording's `StreamingFeatures` stream and whole-session
+    accumulator, so librosa and DeepFace run outside the process that captures audio and
+    drives the GUI, and only each chunk's samples (and, for reports, the current webcam
+    frame) are sent to it. Chunks are analysed one at a time, in order: `analyse` waits
+    for its result, so any backlog stays in the caller's bounded `AnalysisQueue` rather
+    than in the pool.
+
+    Each chunk comes with the index of its first sample in the recording. When chunks
+    were dropped before it, the stream restarts its frame grid and the session records
+    the gap (see `SessionAccumulator.skip`), so no frame or pause spans the missing audio.
+
+    The process is started with "spawn", as forking a process running Tk and audio
+    threads is unsafe. It is started as soon as the worker is created, so its imports
+    overlap with the first chunk being recorded.
+    """
+
+    state = None
+
+    def __init__(self, settings, sr, face_analyser=None):
+        """
+        Start the worker process.
+
+        Parameters:
+        - settings (dict): Analysis settings for the recording.
+        - sr (int): Sampling rate of the recording.
+        - face_analyser (FaceAnalysis, optional): Face analyser to run on webcam frames.
+        """
+        self.sr = sr
+        self.executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+            initializer=LiveAnalysisWorker.start_session, initargs=(dict(settings), sr, face_analyser),
+        )
+        self.executor.submit(LiveAnalysisWorker.ready)
+        self.analysed = 0
+        self.last_seconds = 0.0
+
+
+    @staticmethod
+    def start_session(settings, sr, face_analyser):
+        """
+        Worker process initialiser: create the stream and session accumulator for the recording.
+        """
+        processor = AudioProcessor(settings)
+        LiveAnalysisWorker.state = {
+            "stream": processor.start_stream(sr),
+            "session": processor.start_session(sr),
+            "face_analyser": face_analyser,
+            "next_start": 0,
+        }
+
+
+    @staticmethod
+    def ready():
+        """Return True once the worker process has started (used to start it early)."""
+        return LiveAnalysisWorker.state is not None
+
+
+    @staticmethod
+    def analyse_in_worker(y, start, silence_threshold, report, webcam_frame):
+        """
+        Analyse one chunk in the worker process (see `analyse`).
+        """
+        state = LiveAnalysisWorker.state
+        if start is None:
+            start = state["next_start"]
+        elif start > state["next_start"]:
+            state["stream"].restart()
+            state["session"].skip(start - state["next_start"])
+        state["next_start"] = start + len(y)
+
+        features = state["stream"].update(y)
+        state["session"].add_block(len(y), features)
+
+        rms = float(np.mean(features.rms)) if features is not None else 0.0
+        result = {"rms": rms, "silent": rms < silence_threshold}
+        if not report or result["silent"]:
+            return result
+
+        result["feedback"] = state["stream"].feedback()
+        result["metrics"] = state["stream"].metrics()
+        result["score"] = state["session"].report().score
+        result["skipped_seconds"] = state["session"].skipped_duration
+        if webcam_frame is not None and state["face_analyser"] is not None:
+            try:
+                result["faces"] = state["face_analyser"].analyse_single_frame(webcam_frame)
+            except Exception as e:
+                print(f"Face analysis in the live analysis worker failed: {e}")
+        return result
+
+
+    def analyse(self, y, silence_threshold, report=False, webcam_frame=None, start=None):
+        """
+        Analyse the next chunk of the recording and wait for the result.
+
+        Every chunk updates the stream and session. When `report` is set and the chunk is
+        not below the silence threshold, the result also holds the real-time advice, the
+        sliding-window metrics, the session score so far and, given a webcam frame, the
+        face analysis.
+
+        Parameters:
+        - y (np.ndarray): Chunk samples (copied before the call is queued, so a view into
+          the capture ring may be passed).
+        - silence_threshold (float): Mean RMS below which the chunk counts as silent.
+        - report (bool): Whether to compute feedback for this chunk.
+        - webcam_frame (np.ndarray, optional): Current webcam frame for face analysis.
+        - start (int, optional): Index of the chunk's first sample in the recording (the
+          chunk is taken to follow the previous one if None).
+
+        Returns:
+        - dict: "rms" and "silent", plus "feedback", "metrics", "score", "skipped_seconds"
+          (audio dropped before analysis so far) and "faces" for reports.
+        """
+        began = time.perf_counter()
+        y = np.array(y, dtype=np.float32).reshape(-1)
+        result = self.executor.submit(LiveAnalysisWorker.analyse_in_worker, y, start, silence_threshold, report, webcam_frame).result()
+        self.analysed += 1
+        self.last_seconds = time.perf_counter() - began
+        return result
+
+
+    def close(self):
+        """Stop the worker process once it has finished the current chunk."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,258 @@
+import numpy as np
+
+
+class NoiseSuppressor:
+    def __init__(self, sr, noise_suppression_factor=0.15, n_fft=2048, hop_length=512, block_frames=256):
+        """
+        Block-wise spectral-gating noise suppression with overlap-add resynthesis.
+
+        Produces the same result as a whole-signal `librosa.stft` / spectral subtraction /
+        `librosa.istft` round trip (centred frames, Hann window), but only ever holds
+        `block_frames` STFT frames at a time. The periodic Hann window is built with NumPy
+        (identical to `scipy.signal.get_window("hann", n_fft)`) to keep SciPy off the import path.
+
+        Parameters:
+        - sr (int): Sample rate of the audio.
+        - noise_suppression_factor (float): Scaling factor for the noise threshold.
+        - n_fft (int): FFT size in samples.
+        - hop_length (int): Hop size in samples.
+        - block_frames (int): Number of STFT frames processed per block.
+        """
+        self.sr = sr
+        self.noise_suppression_factor = noise_suppression_factor
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.block_frames = max(1, int(block_frames))
+        self.window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+
+
+    def frame_count(self, n_samples):
+        """Number of centred STFT frames for a signal of `n_samples`."""
+        return 1 + n_samples // self.hop_length
+
+
+    def stft_block(self, y, start, stop):
+        """
+        Compute centred STFT frames `start` to `stop` without padding the whole signal.
+
+        Parameters:
+        - y (np.ndarray): Full audio signal.
+        - start (int): First frame index.
+        - stop (int): Exclusive last frame index.
+
+        Returns:
+        - np.ndarray: Complex STFT block of shape (1 + n_fft // 2, stop - start).
+        """
+        offset = start * self.hop_length - self.n_fft // 2
+        length = (stop - start - 1) * self.hop_length + self.n_fft
+        segment = np.zeros(length, dtype=np.float32)
+
+        lo, hi = max(offset, 0), min(offset + length, len(y))
+        if hi > lo:
+            segment[lo - offset:hi - offset] = y[lo:hi]
+
+        return self._stft_frames(segment)
+
+
+    def _stft_frames(self, segment):
+        """
+        STFT of every hop-aligned full frame of `segment`, one column per frame.
+        """
+        frames = np.lib.stride_tricks.sliding_window_view(segment, self.n_fft)[::self.hop_length]
+        return np.fft.rfft(frames * self.window, axis=1).T
+
+
+    def split(self, y):
+        """
+        Yield a full signal as consecutive pieces of `block_frames` hops (views of `y`).
+        """
+        step = self.block_frames * self.hop_length
+        for start in range(0, len(y), step):
+            yield y[start:start + step]
+
+
+    def stft_stream(self, blocks):
+        """
+        Centred STFT frames of a signal that arrives as consecutive pieces.
+
+        Each frame is computed as soon as the samples it spans have arrived, at most
+        `block_frames` at a time, and only those samples are kept between pieces. Once
+        the pieces run out, the frames overlapping the end of the signal are zero-padded
+        as `stft_block` pads them, so the frames equal those of the whole signal.
+
+        Parameters:
+        - blocks (Iterable[np.ndarray]): Consecutive, non-overlapping pieces of the signal.
+
+        Yields:
+        - Tuple[int, np.ndarray, int]: Index of the first frame, the complex STFT block of
+          shape (1 + n_fft // 2, count), and the signal length in samples with the last
+          block (None before it).
+        """
+        hop = self.hop_length
+        pending = np.zeros(self.n_fft // 2, dtype=np.float32)
+        start = 0
+        n_samples = 0
+
+        for block in blocks:
+            block = np.asarray(block, dtype=np.float32).reshape(-1)
+            n_samples += len(block)
+            pending = np.concatenate((pending, block))
+            available = 1 + (len(pending) - self.n_fft) // hop if len(pending) >= self.n_fft else 0
+            for offset in range(0, available, self.block_frames):
+                count = min(self.block_frames, available - offset)
+                yield start, self._stft_frames(pending[offset * hop:(offset + count - 1) * hop + self.n_fft]), None
+                start += count
+            pending = pending[available * hop:]
+
+        remaining = self.frame_count(n_samples) - start
+        pending = np.pad(pending, (0, max(0, (remaining - 1) * hop + self.n_fft - len(pending))))
+        for offset in range(0, remaining, self.block_frames):
+            count = min(self.block_frames, remaining - offset)
+            last = offset + count == remaining
+            yield start, self._stft_frames(pending[offset * hop:(offset + count - 1) * hop + self.n_fft]), n_samples if last else None
+            start += count
+
+
+    def estimate_noise_profile(self, y):
+        """
+        Mean magnitude per frequency bin over the first `int(sr)` frames.
+
+        Parameters:
+        - y (np.ndarray): Full audio signal.
+
+        Returns:
+        - np.ndarray: Noise magnitude profile of shape (1 + n_fft // 2,).
+        """
+        profile_frames = min(self.frame_count(len(y)), int(self.sr))
+        total = np.zeros(1 + self.n_fft // 2, dtype=np.float64)
+
+        for start in range(0, profile_frames, self.block_frames):
+            stop = min(start + self.block_frames, profile_frames)
+            total += np.abs(self.stft_block(y, start, stop)).sum(axis=1)
+
+        return (total / max(profile_frames, 1)).astype(np.float32)
+
+
+    def estimate_stream_noise_profile(self, blocks):
+        """
+        `estimate_noise_profile` of a signal that arrives as consecutive pieces.
+
+        Only the pieces up to the end of the profiled frames are read.
+
+        Parameters:
+        - blocks (Iterable[np.ndarray]): Consecutive, non-overlapping pieces of the signal.
+
+        Returns:
+        - np.ndarray: Noise magnitude profile of shape (1 + n_fft // 2,).
+        """
+        limit = int(self.sr)
+        total = np.zeros(1 + self.n_fft // 2, dtype=np.float64)
+        counted = 0
+
+        for start, stft, _ in self.stft_stream(blocks):
+            count = min(stft.shape[1], limit - start)
+            total += np.abs(stft[:, :count]).sum(axis=1)
+            counted += count
+            if counted >= limit:
+                break
+
+        return (total / max(counted, 1)).astype(np.float32)
+
+
+    def process(self, y, out=None):
+        """
+        Denoise a full signal block by block.
+
+        Parameters:
+        - y (np.ndarray): Audio signal (1D array).
+        - out (np.ndarray, optional): Preallocated float32 output of length
+          `hop_length * (frame_count(len(y)) - 1)`.
+
+        Returns:
+        - np.ndarray: Denoised audio signal.
+        """
+        if out is None:
+            out = np.empty(self.hop_length * (self.frame_count(len(y)) - 1), dtype=np.float32)
+
+        position = 0
+        for piece in self.process_stream(self.split(y), self.estimate_noise_profile(y)):
+            out[position:position + len(piece)] = piece
+            position += len(piece)
+        return out
+
+
+    def process_stream(self, blocks, noise_profile):
+        """
+        Denoise a signal that arrives as consecutive pieces.
+
+        The output equals `process` on the whole signal, split into pieces as the frames
+        covering them are finished, so only `block_frames` frames and one frame of
+        overlap-add carry are held at a time.
+
+        Parameters:
+        - blocks (Iterable[np.ndarray]): Consecutive, non-overlapping pieces of the signal.
+        - noise_profile (np.ndarray): Profile from `estimate_noise_profile` or
+          `estimate_stream_noise_profile` of the same signal.
+
+        Yields:
+        - np.ndarray: Consecutive float32 pieces of the denoised signal.
+        """
+        noise_threshold = (noise_profile * self.noise_suppression_factor)[:, np.newaxis]
+        overlap = self.n_fft - self.hop_length
+        trim = self.n_fft // 2
+
+        carry = np.zeros(overlap, dtype=np.float64)
+        carry_norm = np.zeros(overlap, dtype=np.float64)
+        window_sq = self.window.astype(np.float64) ** 2
+
+        for start, stft, n_samples in self.stft_stream(blocks):
+            magnitude = np.abs(stft)
+            gain = np.maximum(magnitude - noise_threshold, 0) / np.maximum(magnitude, np.finfo(np.float32).tiny)
+            frames = np.fft.irfft(stft * gain, n=self.n_fft, axis=0).T * self.window
+
+            count = stft.shape[1]
+            length = (count - 1) * self.hop_length + self.n_fft
+            buffer = np.zeros(length, dtype=np.float64)
+            norm = np.zeros(length, dtype=np.float64)
+            buffer[:overlap] += carry
+            norm[:overlap] += carry_norm
+            self._overlap_add(buffer, frames)
+            self._overlap_add(norm, np.broadcast_to(window_sq, frames.shape))
+
+            final = length if n_samples is not None else count * self.hop_length
+            position = start * self.hop_length - trim
+            stop = final if n_samples is None else min(final, self.hop_length * (self.frame_count(n_samples) - 1) - position)
+            lo = max(-position, 0)
+            if stop > lo:
+                yield self._normalise(buffer[lo:stop], norm[lo:stop])
+            carry = buffer[final:final + overlap].copy()
+            carry_norm = norm[final:final + overlap].copy()
+
+
+    def _overlap_add(self, buffer, frames):
+        """
+        Add `frames` (count, n_fft) into `buffer` at multiples of the hop length.
+
+        When the hop divides the FFT size this takes one vectorised add per hop-sized
+        slice of the frame rather than one per frame.
+        """
+        count = len(frames)
+        hop = self.hop_length
+
+        if self.n_fft % hop:
+            for i in range(count):
+                buffer[i * hop:i * hop + self.n_fft] += frames[i]
+            return
+
+        for part in range(self.n_fft // hop):
+            segment = frames[:, part * hop:(part + 1) * hop].reshape(-1)
+            buffer[part * hop:part * hop + count * hop] += segment
+
+
+    @staticmethod
+    def _normalise(buffer, norm):
+        """
+        Divide finished overlap-add samples by the summed squared window, where it is non-zero.
+        """
+        tiny = np.finfo(np.float32).tiny
+        return np.where(norm > tiny, buffer / np.where(norm > tiny, norm, 1.0), buffer).astype(np.float32)
@@ -2,16 +2,19 @@ import os
 from tkinter import filedialog, messagebox
 import webbrowser
 from fpdf import FPDF
+from StageProfiler import StageProfiler
 
 
 class PDFExporter:
-    def __init__(self, feedback_text_widget):
+    def __init__(self, feedback_text_widget, profiler=None):
         """
         Initialises the PDFExporter with a text widget containing feedback.
+        An optional `StageProfiler` records the export as a "pdf_export" stage.
         """
         self.pdf = FPDF()
         self.pdf.set_auto_page_break(auto=True, margin=15)
         self.feedback_text_widget = feedback_text_widget
+        self.profiler = profiler
 
 
     def export_to_pdf(self):
@@ -23,7 +26,8 @@ class PDFExporter:
         if not pdf_path:  
             return
 
-        self.create_pdf(pdf_path)
+        with StageProfiler.maybe(self.profiler, "pdf_export"):
+            self.create_pdf(pdf_path)
         self.show_export_success_message()
         self.open_pdf_in_viewer(pdf_path)
 
@@ -0,0 +1,114 @@
+import numpy as np
+from FrameKernels import FrameKernels
+
+
+class PauseDetector:
+    """
+    Vectorised run-length detection of pauses and breaks in a frame-level signal.
+
+    Silent frames are found with a boolean mask, and runs are located from the
+    edges of that mask in a single NumPy pass instead of a per-frame Python loop.
+    """
+
+    @staticmethod
+    def find_runs(mask):
+        """
+        Locate contiguous runs of True values in a boolean mask.
+
+        Parameters:
+        - mask (np.ndarray): 1D boolean array (e.g. `rms < threshold`).
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Start indices and exclusive stop indices of each run.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        padded = np.concatenate(([False], mask, [False]))
+        edges = np.flatnonzero(padded[1:] != padded[:-1])
+        return edges[0::2], edges[1::2]
+
+
+    @staticmethod
+    def detect(mask, times, min_pause, break_length, measure="frames"):
+        """
+        Split silent runs into pauses and breaks.
+
+        A run ends at the first non-silent frame, or at the last frame if the
+        signal finishes silent. Runs shorter than `min_pause` are ignored and runs
+        of at least `break_length` are reported as breaks.
+
+        Parameters:
+        - mask (np.ndarray): 1D boolean array marking silent frames.
+        - times (np.ndarray): Start time in seconds of each frame.
+        - min_pause (float): Minimum run length for a pause.
+        - break_length (float): Minimum run length for a break.
+        - measure (str): "frames" to compare run lengths in frames, "seconds" to compare durations.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Pause and break intervals, each of shape (n, 3)
+          holding (start, end, duration) in seconds.
+        """
+        starts, stops = PauseDetector.find_runs(mask)
+        return PauseDetector.split_runs(starts, stops, times, min_pause, break_length, measure)
+
+
+    @staticmethod
+    def detect_below(values, threshold, times, min_pause, break_length, measure="frames"):
+        """
+        `detect` on the mask `values < threshold`, segmented by `FrameKernels.silent_runs`
+        (one compiled pass when numba is available).
+
+        Parameters:
+        - values (np.ndarray): Frame-level signal, e.g. the RMS envelope.
+        - threshold (float): Frames below this value are silent.
+        - times, min_pause, break_length, measure: As for `detect`.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Pause and break intervals, as for `detect`.
+        """
+        starts, stops = FrameKernels.silent_runs(values, threshold)
+        return PauseDetector.split_runs(starts, stops, times, min_pause, break_length, measure)
+
+
+    @staticmethod
+    def split_runs(starts, stops, times, min_pause, break_length, measure="frames"):
+        """
+        Turn silent runs (frame indices) into pause and break intervals, as described in `detect`.
+        """
+        times = np.asarray(times, dtype=np.float64)
+
+        if len(starts) == 0:
+            empty = np.empty((0, 3))
+            return empty, empty.copy()
+
+        start_times = times[starts]
+        end_times = times[np.minimum(stops, len(times) - 1)]
+        lengths = stops - starts if measure == "frames" else end_times - start_times
+
+        return PauseDetector.classify(start_times, end_times, lengths, min_pause, break_length)
+
+
+    @staticmethod
+    def classify(start_times, end_times, lengths, min_pause, break_length):
+        """
+        Split silent runs with known start and end times into pauses and breaks.
+
+        Parameters:
+        - start_times (np.ndarray): Start time in seconds of each run.
+        - end_times (np.ndarray): End time in seconds of each run.
+        - lengths (np.ndarray): Run lengths compared against `min_pause` and `break_length`.
+        - min_pause (float): Minimum run length for a pause.
+        - break_length (float): Minimum run length for a break.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Pause and break intervals, each of shape (n, 3)
+          holding (start, end, duration) in seconds.
+        """
+        start_times = np.asarray(start_times, dtype=np.float64)
+        end_times = np.asarray(end_times, dtype=np.float64)
+        lengths = np.asarray(lengths)
+        intervals = np.column_stack((start_times, end_times, end_times - start_times)).reshape(-1, 3)
+
+        is_pause = lengths >= min_pause
+        is_break = is_pause & (lengths >= break_length)
+
+        return intervals[is_pause & ~is_break], intervals[is_break]
@@ -0,0 +1,188 @@
+import librosa
+import numpy as np
+from PauseDetector import PauseDetector
+
+
+class PitchTracker:
+    """
+    Selectable pitch-tracking engines that turn an `AudioFeatures` bundle into pitch values.
+
+    - "piptrack": every spectral peak whose magnitude exceeds the median magnitude
+      (the original behaviour, covers the full frequency range).
+    - "yin": one fundamental frequency per frame from `librosa.yin` on a decimated copy
+      of the signal, restricted to the speech band and kept only for frames within
+      `VOICED_RANGE_DB` of the loudest frame.
+    """
+
+    SPEECH_FMIN = 60.0
+    SPEECH_FMAX = 500.0
+    VOICED_RANGE_DB = 35.0
+    MIN_ANALYSIS_RATE = 4000.0
+
+    @staticmethod
+    def piptrack_track(features):
+        """
+        Pitch candidates from the shared `librosa.piptrack` result above the median magnitude.
+
+        Parameters:
+        - features (AudioFeatures): Feature bundle for the signal.
+
+        With `features.voice_gate`, the track only covers voice-active frames: the median is
+        taken over those, and they are scattered back to one column per frame.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: (bins, frames) pitch candidates in Hz and a boolean
+          mask of those whose magnitude exceeds the median magnitude.
+        """
+        pitches, magnitudes = features.pitch_track
+        if not features.voice_gate:
+            return pitches, magnitudes > np.median(magnitudes)
+
+        voiced = features.voiced
+        frame_pitches = np.zeros((pitches.shape[0], len(voiced)), dtype=pitches.dtype)
+        mask = np.zeros(frame_pitches.shape, dtype=bool)
+        if pitches.shape[1]:
+            frame_pitches[:, voiced] = pitches
+            mask[:, voiced] = magnitudes > np.median(magnitudes)
+        return frame_pitches, mask
+
+
+    @staticmethod
+    def yin_track(features):
+        """
+        Per-frame fundamental frequency from YIN over the speech band, masked to voiced frames.
+
+        Speech fundamentals sit below `SPEECH_FMAX`, so the signal is first decimated by
+        the largest power of two that divides the hop and keeps the rate above
+        `MIN_ANALYSIS_RATE`. YIN then runs on far fewer samples with a short frame, while
+        its frames stay centred on the same instants as the shared RMS frames.
+
+        With `features.voice_gate`, YIN only runs over the spans of voice-active frames
+        (see `yin_frames`); the other frames are left at 0 Hz and masked out.
+
+        Parameters:
+        - features (AudioFeatures): Feature bundle for the signal.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: (1, frames) fundamental in Hz and a boolean mask of
+          voiced frames, both aligned with the RMS frames.
+        """
+        from scipy.signal import resample_poly
+
+        n_frames = len(features.rms)
+        f0 = np.zeros((1, n_frames))
+        voiced = np.zeros((1, n_frames), dtype=bool)
+
+        factor = PitchTracker.decimation_factor(features.sr, features.hop_length)
+        sr = features.sr / factor
+        frame_length = PitchTracker.yin_frame_length(sr)
+        y = resample_poly(features.y, 1, factor).astype(np.float32) if factor > 1 else features.y
+
+        if len(y) < frame_length:
+            return f0, voiced
+
+        hop_length = features.hop_length // factor
+        if features.center:
+            track_frames = 1 + len(y) // hop_length
+        else:
+            track_frames = 1 + (len(y) - frame_length) // hop_length
+        count = min(track_frames, n_frames)
+
+        active = features.voiced[:count] if features.voice_gate else np.ones(count, dtype=bool)
+        for start, stop in zip(*PauseDetector.find_runs(active)):
+            f0[0, start:stop] = PitchTracker.yin_frames(y, start, stop, sr, frame_length, hop_length, features.center)
+        voiced[0, :count] = PitchTracker.voiced_frames(features.rms[:count])
+        return f0, voiced
+
+
+    @staticmethod
+    def yin_frames(y, start, stop, sr, frame_length, hop_length, center):
+        """
+        `librosa.yin` frames `start` to `stop` of `y`, reading only the samples they span.
+
+        YIN estimates each frame on its own, so these equal the same frames of a run over
+        the whole signal (zero-padded at its ends when `center` is set, as `librosa.yin` pads).
+
+        Returns:
+        - np.ndarray: Fundamental in Hz of each of the `stop - start` frames.
+        """
+        offset = frame_length // 2 if center else 0
+        lo = start * hop_length - offset
+        hi = (stop - 1) * hop_length + frame_length - offset
+        segment = y[max(lo, 0):min(hi, len(y))]
+        if lo < 0 or hi > len(y):
+            segment = np.pad(segment, (max(-lo, 0), max(hi - len(y), 0)))
+        return librosa.yin(
+            segment,
+            fmin=PitchTracker.SPEECH_FMIN,
+            fmax=PitchTracker.SPEECH_FMAX,
+            sr=sr,
+            frame_length=frame_length,
+            hop_length=hop_length,
+            center=False,
+        )
+
+
+    @staticmethod
+    def decimation_factor(sr, hop_length):
+        """
+        Largest power-of-two decimation that divides `hop_length` and keeps at least `MIN_ANALYSIS_RATE`.
+        """
+        factor = 1
+        while hop_length % (factor * 2) == 0 and sr / (factor * 2) >= PitchTracker.MIN_ANALYSIS_RATE:
+            factor *= 2
+        return factor
+
+
+    @staticmethod
+    def yin_frame_length(sr):
+        """
+        Smallest power-of-two YIN frame that can still resolve `SPEECH_FMIN` at rate `sr`.
+        """
+        frame_length = 64
+        while frame_length // 2 - 1 < sr / PitchTracker.SPEECH_FMIN:
+            frame_length *= 2
+        return frame_length
+
+
+    @staticmethod
+    def voiced_frames(rms):
+        """
+        Mark frames whose RMS is within `VOICED_RANGE_DB` of the loudest frame.
+
+        Parameters:
+        - rms (np.ndarray): Frame-level RMS envelope.
+
+        Returns:
+        - np.ndarray: Boolean mask of voiced frames.
+        """
+        if len(rms) == 0 or np.max(rms) <= 0:
+            return np.zeros(len(rms), dtype=bool)
+        return librosa.amplitude_to_db(rms, ref=np.max) > -PitchTracker.VOICED_RANGE_DB
+
+
+    ENGINES = {
+        "piptrack": "piptrack_track",
+        "yin": "yin_track",
+    }
+
+    @staticmethod
+    def track(features, engine="piptrack"):
+        """
+        Dispatch to the named pitch engine.
+
+        Parameters:
+        - features (AudioFeatures): Feature bundle for the signal.
+        - engine (str): One of `PitchTracker.ENGINES`.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Pitch candidates in Hz with one column per frame,
+          and a boolean mask of the candidates to keep (only voice-active frames when
+          `features.voice_gate` is set).
+        """
+        if engine not in PitchTracker.ENGINES:
+            raise ValueError(f"Unknown pitch engine: {engine}. Expected one of {sorted(PitchTracker.ENGINES)}.")
+        pitches, mask = getattr(PitchTracker, PitchTracker.ENGINES[engine])(features)
+        if features.voice_gate:
+            mask = mask & features.voiced[:mask.shape[1]]
+        return pitches, mask
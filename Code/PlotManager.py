@@ -7,18 +7,22 @@ import matplotlib.pyplot as plt
 import librosa.display
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from AudioProcessor import AudioProcessor
+from PauseDetector import PauseDetector
+from StageProfiler import StageProfiler
 from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
 
 class PlotManager:
-    def __init__(self, y, sr, graph_frame, selected_graph, settings=None):
+    def __init__(self, y, sr, graph_frame, selected_graph, settings=None, profiler=None):
         """
         Initialises the PlotManager with audio data, sample rate, and GUI references.
+        An optional `StageProfiler` records each plot as a "plot" stage.
         """
         self.y = y
         self.sr = sr
         self.graph_frame = graph_frame
         self.selected_graph = selected_graph
         self.canvas = None
+        self.profiler = profiler
         
         if not hasattr(PlotManager, "_global_settings"):
             PlotManager._global_settings = settings if settings is not None else {}
@@ -63,14 +67,15 @@ class PlotManager:
         Handles the plotting of the selected graph type on the main thread.
         """
         self.clear_graph_frame()
-        if self.selected_graph == "Waveform":
-            self.plot_waveform()
-        elif self.selected_graph == "Mel Spectrogram":
-            self.plot_mel_spectrogram()
-        elif self.selected_graph == "Fourier Transform":
-            self.plot_fourier_transform()
-        elif self.selected_graph == "Loudness and Pauses Over Time":
-            self.plot_loudness_pauses()
+        with StageProfiler.maybe(self.profiler, "plot", graph=self.selected_graph):
+            if self.selected_graph == "Waveform":
+                self.plot_waveform()
+            elif self.selected_graph == "Mel Spectrogram":
+                self.plot_mel_spectrogram()
+            elif self.selected_graph == "Fourier Transform":
+                self.plot_fourier_transform()
+            elif self.selected_graph == "Loudness and Pauses Over Time":
+                self.plot_loudness_pauses()
 
 
 
@@ -125,24 +130,13 @@ class PlotManager:
         ax.plot(times, rms_db, label="Loudness (dB)", color="blue")
 
         pause_threshold = np.mean(rms) * pause_threshold_factor
-        pause_indices = rms < pause_threshold
-        pause_start = None
-
-        for i, is_pause in enumerate(pause_indices):
-            if is_pause and pause_start is None:
-                pause_start = times[i]
-            elif not is_pause and pause_start is not None:
-                pause_duration = times[i] - pause_start
-                if pause_duration >= min_pause_duration:
-                    color = "red" if pause_duration >= break_duration else "orange"
-                    ax.axvspan(pause_start, times[i], color=color, alpha=0.3)
-                pause_start = None
-
-        if pause_start is not None:
-            pause_duration = times[-1] - pause_start
-            if pause_duration >= min_pause_duration:
-                color = "red" if pause_duration >= break_duration else "orange"
-                ax.axvspan(pause_start, times[-1], color=color, alpha=0.3)
+        pauses, breaks = PauseDetector.detect(
+            rms < pause_threshold, times, min_pause_duration, break_duration, measure="seconds"
+        )
+
+        for color, intervals in (("orange", pauses), ("red", breaks)):
+            for start, end, _ in intervals:
+                ax.axvspan(start, end, color=color, alpha=0.3)
 
         ax.set_title("Loudness and Pauses Over Time", fontsize=8)
         ax.set_xlabel("Time (s)", fontsize=7)
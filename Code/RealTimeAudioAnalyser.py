@@ -1,17 +1,20 @@
 import numpy as np
-import sounddevice as sd
 import matplotlib.pyplot as plt
 from scipy.interpolate import make_interp_spline
 import threading
 import queue
 import time
-import wave
+from collections import deque
 from tkinter import messagebox
-import librosa
-from FaceAnalysis import FaceAnalysis
+from AnalysisQueue import AnalysisQueue
+from AudioRingBuffer import AudioRingBuffer
+from RecordingWriter import RecordingWriter
 
 
 class RealTimeAudioAnalyser:
+    STOP = None
+    QUEUE_TIMEOUT = 0.5
+
     def __init__(self, root, app):
         """
         Initialise the real-time audio analyser.
@@ -29,9 +32,11 @@ class RealTimeAudioAnalyser:
         self.root = root
         self.app = app  
         self.is_recording = False
-        self.audio_buffer = []
+        self.audio_buffer = None
+        self.recording_writer = None
         self.sr = 44100
-        self.analysis_queue = queue.Queue()
+        self.analysis_queue = AnalysisQueue()
+        self.live_worker = None
         self.current_webcam_frame = None
 
         self.update_interval = app.settings.get("update_interval", 5.0)
@@ -104,49 +109,142 @@ class RealTimeAudioAnalyser:
         Launches two background threads:
         - One for recording live audio.
         - One for processing the recorded chunks asynchronously.
+
+        Audio is captured into a fresh `AudioRingBuffer` holding the last
+        `record_buffer_minutes` minutes (2 by default), from which a `RecordingWriter`
+        streams it to a temporary WAV file in the background, so memory use does not
+        grow with the length of the recording. The previous recording's file is deleted.
+
+        Chunks are analysed in a `LiveAnalysisWorker` process holding the recording's
+        `StreamingFeatures` stream (frames analysed once, live metrics over the last
+        `realtime_window` seconds) and whole-session accumulator, whose engagement score,
+        covering everything recorded so far, is shown with each update. Chunks wait for
+        it in an `AnalysisQueue` of at most `realtime_queue_size` chunks (3 by default)
+        that applies the `realtime_backpressure` policy ("drop_oldest" by default,
+        "coalesce" or "block") when the analysis falls behind.
         """
+        from LiveAnalysisWorker import LiveAnalysisWorker
+
         self.is_recording = True
-        self.audio_buffer = []
+        if self.recording_writer is not None:
+            self.recording_writer.discard()
+        self.audio_buffer = AudioRingBuffer.for_duration(60.0 * self.app.settings.get("record_buffer_minutes", 2.0), self.sr)
+        self.recording_writer = RecordingWriter(self.audio_buffer, self.sr)
+        self.recording_writer.start()
+        self.analysis_queue = AnalysisQueue(
+            self.app.settings.get("realtime_queue_size", 3), self.app.settings.get("realtime_backpressure", "drop_oldest"),
+        )
+        self.live_worker = LiveAnalysisWorker(self.app.settings, self.sr, getattr(self, "face_analyser", None))
         threading.Thread(target=self.record_audio).start()
-        threading.Thread(target=self.process_audio).start()
+        threading.Thread(target=self.process_audio, args=(self.analysis_queue, self.audio_buffer, self.live_worker)).start()
 
     def stop_recording(self):
         """
         Stop the audio recording process.
+
+        Queues the `STOP` sentinel behind any chunks still waiting, so the analysis
+        thread finishes them and then exits.
         """
         self.is_recording = False
+        self.analysis_queue.put(self.STOP)
 
     def record_audio(self):
         """
         Continuously record incoming audio in chunks.
 
-        - Buffers audio until a full second is captured.
-        - Pushes it into a queue for background analysis.
-        - Stores the full stream in `audio_buffer` for playback or saving.
+        - Copies each block once into the `audio_buffer` ring, from which the
+          `recording_writer` saves it.
+        - Once a full second is captured, queues its (start, stop) sample indices in the
+          ring for background analysis instead of a copy of the audio.
+        - Never waits in the audio callback: under the "block" backpressure policy the
+          indices are handed to a `feed_chunks` thread, which does the waiting, and the
+          callback only counts a dropped chunk if the ring would already have
+          overwritten everything that thread holds.
+        - Once the input stream is closed, lets the writer save the last samples and close its file.
         """
-        buffer = []  
-        self.audio_buffer = []  
+        ring = self.audio_buffer
+        writer = self.recording_writer
+        analysis_queue = self.analysis_queue
+        chunk_start = ring.written
+
+        blocking = analysis_queue.policy == "block"
+        pending = deque()
+        chunk_ready = threading.Event()
+        max_pending = max(1, ring.capacity // self.sr)
+        if blocking:
+            threading.Thread(target=self.feed_chunks, args=(analysis_queue, pending, chunk_ready), daemon=True).start()
 
         def callback(indata, frames, time, status):
+            nonlocal chunk_start
             if self.is_recording:
-                buffer.append(indata.copy())
-                self.audio_buffer.append(indata.copy())  
+                _, stop = ring.write(indata)
+
+                if stop - chunk_start >= self.sr:
+                    if not blocking:
+                        analysis_queue.put((chunk_start, stop))
+                    elif len(pending) < max_pending:
+                        pending.append((chunk_start, stop))
+                        chunk_ready.set()
+                    else:
+                        analysis_queue.discard()
+                    chunk_start = stop
+
+        try:
+            import sounddevice as sd
 
-                if len(buffer) * frames >= self.sr:
-                    full_chunk = np.concatenate(buffer, axis=0)
-                    self.analysis_queue.put(full_chunk) 
-                    buffer.clear()  
+            with sd.InputStream(samplerate=self.sr, channels=1, callback=callback):
+                while self.is_recording:
+                    sd.sleep(100)
+        finally:
+            writer.stop()
 
-        with sd.InputStream(samplerate=self.sr, channels=1, callback=callback):
-            while self.is_recording:
-                sd.sleep(100)
+    def feed_chunks(self, analysis_queue, pending, chunk_ready):
+        """
+        Move chunks handed over by the audio callback into a "block" policy queue.
+
+        Waits for space in the queue here, off the audio callback, for as long as the
+        analysis needs. Chunks still waiting when recording stops are counted as dropped,
+        as they would arrive after the `STOP` sentinel.
+
+        Parameters:
+        - analysis_queue (AnalysisQueue): The recording's queue.
+        - pending (collections.deque): (start, stop) ranges appended by the callback.
+        - chunk_ready (threading.Event): Set by the callback after each append.
+        """
+        while self.is_recording:
+            chunk_ready.wait(self.QUEUE_TIMEOUT)
+            chunk_ready.clear()
+            while pending and self.is_recording:
+                if analysis_queue.wait_for_space(self.QUEUE_TIMEOUT):
+                    analysis_queue.put(pending.popleft(), timeout=self.QUEUE_TIMEOUT)
+        analysis_queue.discard(len(pending))
+
+    def close(self):
+        """
+        Stop any recording and delete the current recording's temporary file.
+
+        Called when the application exits; the recording can no longer be downloaded afterwards.
+        """
+        if self.is_recording:
+            self.stop_recording()
+        if self.recording_writer is not None:
+            self.recording_writer.discard()
+            self.recording_writer = None
+
+    def recorded_audio(self):
+        """
+        The recording so far as a 1D float32 array, memory-mapped from the writer's file.
+        """
+        if self.recording_writer is None:
+            return np.zeros(0, dtype=np.float32)
+        return self.recording_writer.read()
 
     def play_recording(self):
         """
         Play the most recently recorded audio in a separate thread.
         """
         if self.audio_buffer:
-            audio_array = np.concatenate(self.audio_buffer, axis=0)
+            audio_array = self.recorded_audio()
             self.current_playback_index = 0
             self.is_paused = False
             self.playback_thread = threading.Thread(target=self._play_audio, args=(audio_array,), daemon=True)
@@ -158,6 +256,8 @@ class RealTimeAudioAnalyser:
 
         Plays from the current playback index and tracks progress.
         """
+        import sounddevice as sd
+
         try:
             self.is_paused = False
             self.start_time = time.time()  
@@ -174,6 +274,8 @@ class RealTimeAudioAnalyser:
         """
         Pause current playback and store the resume position.
         """
+        import sounddevice as sd
+
         if not self.audio_buffer or self.is_paused:
             return 
 
@@ -195,9 +297,10 @@ class RealTimeAudioAnalyser:
         """
         Resume playback from where it was paused.
         """
+        import sounddevice as sd
 
         self.is_paused = False 
-        audio_array = np.concatenate(self.audio_buffer, axis=0) 
+        audio_array = self.recorded_audio()
 
 
         if self.current_playback_index < 0 or self.current_playback_index >= len(audio_array):
@@ -242,10 +345,12 @@ class RealTimeAudioAnalyser:
         Parameters:
         - seconds (float): Number of seconds to skip (positive or negative).
         """
+        import sounddevice as sd
+
         if self.audio_buffer:
             self.is_paused = True  
             sd.stop()  
-            audio_array = np.concatenate(self.audio_buffer, axis=0)
+            audio_array = self.recorded_audio()
             new_index = self.current_playback_index + int(seconds * self.sr)
             self.current_playback_index = max(0, min(new_index, len(audio_array)))
             self.is_paused = False  
@@ -256,22 +361,16 @@ class RealTimeAudioAnalyser:
 
     def download_recording(self, filename):
         """
-        Save the latest recording as a WAV file to disk.
+        Save the latest recording as a peak-normalised 16-bit WAV file to disk.
+
+        The audio is already on disk, so this only converts the writer's file block by
+        block (see `RecordingWriter.export`).
 
         Parameters:
-        - filename (str): Desired output filename (should end in .wav).
+        - filename (str): Desired output filename (should end in .wav, or .flac for FLAC).
         """
         if self.audio_buffer:
-            audio_array = np.concatenate(self.audio_buffer, axis=0).flatten()
-            audio_array = (audio_array / np.max(np.abs(audio_array))) * 32767  
-            audio_array = audio_array.astype(np.int16) 
-
-            with wave.open(filename, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  
-                wf.setframerate(self.sr)
-                wf.writeframes(audio_array.tobytes())
-            
+            self.recording_writer.export(filename)
 
             messagebox.showinfo("Download Complete", "Recording downloaded successfully!")
     
@@ -291,111 +390,184 @@ class RealTimeAudioAnalyser:
 
 
 
-    def process_audio(self):
+    def process_audio(self, analysis_queue=None, audio_buffer=None, live_worker=None):
         """
-        Continuously retrieve and analyse audio chunks from the analysis queue.
+        Analyse audio chunks from the analysis queue as they arrive.
+
+        Blocks on the queue instead of polling it, so the thread uses no CPU between
+        chunks. Each chunk is passed to `analyse_chunk()` until the `STOP` sentinel
+        queued by `stop_recording` is reached. The wait times out every
+        `QUEUE_TIMEOUT` seconds so the thread also exits if recording stopped without
+        a sentinel and the queue is empty.
+
+        Chunks queued as (start, stop) sample indices are read from the ring they were
+        captured into; audio arrays are analysed as they are. Chunks overwritten in the
+        ring before they were read are skipped and counted as dropped by the queue. The
+        start index goes with each chunk to the worker, so it can detect gaps left by dropped chunks.
 
-        This function runs in a loop while recording is active or until all queued
-        chunks have been processed. Each chunk is passed to `analyse_chunk()`.
+        Parameters:
+        - analysis_queue (AnalysisQueue, optional): Queue to consume (defaults to `self.analysis_queue`).
+        - audio_buffer (AudioRingBuffer, optional): Ring the indices refer to (defaults to `self.audio_buffer`).
+        - live_worker (LiveAnalysisWorker, optional): Worker process that analyses this
+          recording's chunks, closed when the thread exits (defaults to `self.live_worker`).
+        """
+        if analysis_queue is None:
+            analysis_queue = self.analysis_queue
+        if audio_buffer is None:
+            audio_buffer = self.audio_buffer
+        if live_worker is None:
+            live_worker = self.live_worker
+        try:
+            while True:
+                try:
+                    chunk = analysis_queue.get(timeout=self.QUEUE_TIMEOUT)
+                except queue.Empty:
+                    if not self.is_recording:
+                        return
+                    continue
+
+                if chunk is self.STOP:
+                    return
+                start = None
+                if isinstance(chunk, tuple):
+                    start = chunk[0]
+                    try:
+                        chunk = audio_buffer.read(*chunk)
+                    except IndexError as e:
+                        print(f"Skipping chunk that analysis fell behind on: {e}")
+                        analysis_queue.discard()
+                        continue
+                self.analyse_chunk(chunk, live_worker, start, analysis_queue)
+        finally:
+            if live_worker is not None:
+                live_worker.close()
+
+
+    def analysis_stats(self):
+        """
+        Backpressure counters of the live analysis.
+
+        Returns:
+        - dict: The queue's `AnalysisQueue.stats` plus "analysed" (chunks analysed by the
+          current worker) and "last_analysis_seconds" (round trip of the latest chunk).
         """
-        while self.is_recording or not self.analysis_queue.empty():
-            if not self.analysis_queue.empty():
-                chunk = self.analysis_queue.get()
-                self.analyse_chunk(chunk)
+        stats = self.analysis_queue.stats()
+        if self.live_worker is not None:
+            stats["analysed"] = self.live_worker.analysed
+            stats["last_analysis_seconds"] = self.live_worker.last_seconds
+        return stats
+
 
+    def analyse_chunk(self, chunk, live_worker=None, start=None, analysis_queue=None):
+        """
+        Send one chunk to the live analysis worker and refresh the feedback and metric graphs.
 
-    def analyse_chunk(self, chunk):
-        from AudioProcessor import AudioProcessor  
-        processor = AudioProcessor()  
-        sr = self.sr
-        y = np.concatenate(chunk)
+        The worker updates its feature stream and session with every chunk. Every
+        `update_interval` seconds it also returns advice, sliding-window metrics, the
+        session score and the face analysis of the current webcam frame, which are shown
+        in the GUI together with the queue's dropped and merged chunk counts, if any.
 
-        frame_rms = librosa.feature.rms(y=y, frame_length=2048, hop_length=512)[0]
-        avg_rms = np.mean(frame_rms)
+        Parameters:
+        - chunk (np.ndarray): Newly captured audio.
+        - live_worker (LiveAnalysisWorker, optional): Worker of the recording the chunk
+          belongs to (defaults to `self.live_worker`).
+        - start (int, optional): Index of the chunk's first sample in the recording, so the
+          worker can tell when chunks before it were dropped.
+        - analysis_queue (AnalysisQueue, optional): Queue of the recording the chunk came
+          from, whose counters are shown (defaults to `self.analysis_queue`).
+        """
+        if live_worker is None:
+            live_worker = self.live_worker
+        if analysis_queue is None:
+            analysis_queue = self.analysis_queue
+        current_time = time.time()
+        report = current_time - self.last_update_time >= self.update_interval
+        webcam_frame = self.current_webcam_frame if report else None
+        result = live_worker.analyse(chunk, self.silence_threshold, report, webcam_frame, start)
 
-        if avg_rms < self.silence_threshold:
+        if result["silent"]:
             self.root.after(0, lambda: self.app.update_feedback_text(
                 "Below the silence threshold, no analysis is being performed."
             ))
             return
+        if not report:
+            return
 
-        current_time = time.time()
-
-        if current_time - self.last_update_time >= self.update_interval:
-            # Process speech feedback first.
-            full_feedback = processor.give_realtime_audio_feedback(y, sr)
-            if isinstance(full_feedback, str):
-                self.root.after(0, lambda: self.app.update_feedback_text(full_feedback))
+        # Process speech feedback first.
+        full_feedback = result["feedback"] + f"\n\nSession engagement score so far: {result['score']}"
+        stats = analysis_queue.stats()
+        if stats["dropped"] or stats["coalesced"]:
+            full_feedback += (
+                f"\nAnalysis backlog: {stats['depth']} waiting, {stats['dropped']} dropped, {stats['coalesced']} merged "
+                f"({result['skipped_seconds']:.1f} s not analysed)."
+            )
+        self.root.after(0, lambda: self.app.update_feedback_text(full_feedback))
+
+        # Show the face analysis of the webcam frame sent with the chunk.
+        if webcam_frame is None or getattr(self, "face_analyser", None) is None:
+            print("No webcam frame available for face analysis or face_analyser not initialized.")
+        elif result.get("faces"):
+            summary = []
+            for face in result["faces"]:
+                emotion = face['emotion']
+                state = face['state']
+                engagement = face['engagement']
+                summary.append(f"{emotion} ({state}), {engagement}%")
+            face_feedback = "Face Engagement: " + " | ".join(summary)
+            self.root.after(0, lambda: self.app.update_face_feedback_text(face_feedback))
+
+        # Update the metric graphs from the stream's sliding window, on the Tk thread.
+        window = result["metrics"]
+        metrics = {
+            "Loudness": window["loudness"],
+            "Pitch": window["pitch"],
+            "Speech Rate": window["speech_rate"],
+            "Energy": window["energy"]
+        }
+        self.root.after(0, lambda: self.update_metric_graphs(metrics))
+        self.last_update_time = current_time
+
+
+    def update_metric_graphs(self, metrics):
+        """
+        Append the latest metric values to their histories and redraw the metric graphs.
 
-            # Process face analysis feedback using the stored webcam frame.
-            if self.current_webcam_frame is not None and hasattr(self, 'face_analyser'):
-                try:
-                    face_data = self.face_analyser.analyse_single_frame(self.current_webcam_frame)
-                    if face_data:
-                        summary = []
-                        for face in face_data:
-                            emotion = face['emotion']
-                            state = face['state']
-                            engagement = face['engagement']
-                            summary.append(f"{emotion} ({state}), {engagement}%")
-                        face_feedback = "Face Engagement: " + " | ".join(summary)
-                        self.root.after(0, lambda: self.app.update_face_feedback_text(face_feedback))
-                except Exception as e:
-                    print(f"Face analysis in analyse_chunk failed: {e}")
+        Parameters:
+        - metrics (dict): Latest value of each graphed metric.
+        """
+        thresholds = {
+            "Loudness": (-30, -26),
+            "Pitch": (1100, 1200),
+            "Speech Rate": (20, 30),
+            "Energy": (0.004, 0.005)
+        }
+
+        for metric, value in metrics.items():
+            fig, ax, canvas = self.app.metric_graphs[metric]
+            history_attr = f"{metric.lower()}_history"
+            if not hasattr(self, history_attr):
+                setattr(self, history_attr, [])
+            history = getattr(self, history_attr)
+            history.append(value)
+            if len(history) > 50:
+                history.pop(0)
+
+            ax.clear()
+            if len(history) > 3:
+                x = np.linspace(0, len(history) - 1, len(history))
+                x_smooth = np.linspace(x.min(), x.max(), 300)
+                y_smooth = make_interp_spline(x, history)(x_smooth)
+                ax.plot(x_smooth, y_smooth, color="black")
             else:
-                print("No webcam frame available for face analysis or face_analyser not initialized.")
-
-            # Process and update metric graphs for speech analysis.
-            metrics = {
-                "Loudness": processor.analyse_loudness(y, sr)[0],
-                "Pitch": processor.analyse_pitch(y, sr)[0],
-                "Speech Rate": processor.analyse_speech_rate(y, sr),
-                "Energy": processor.analyse_vocal_energy(y, sr)
-            }
-
-            for metric, value in metrics.items():
-                if isinstance(value, np.ndarray):
-                    try:
-                        metrics[metric] = float(np.mean(value))
-                    except Exception as e:
-                        print(f"Error converting {metric} to float: {e}")
-                        metrics[metric] = 0.0
-
-            thresholds = {
-                "Loudness": (-30, -26),
-                "Pitch": (1100, 1200),
-                "Speech Rate": (20, 30),
-                "Energy": (0.004, 0.005)
-            }
-
-            for metric, value in metrics.items():
-                fig, ax, canvas = self.app.metric_graphs[metric]
-                history_attr = f"{metric.lower()}_history"
-                if not hasattr(self, history_attr):
-                    setattr(self, history_attr, [])
-                history = getattr(self, history_attr)
-                history.append(value)
-                if len(history) > 50:
-                    history.pop(0)
-
-                ax.clear()
-                if len(history) > 3:
-                    x = np.linspace(0, len(history) - 1, len(history))
-                    x_smooth = np.linspace(x.min(), x.max(), 300)
-                    y_smooth = make_interp_spline(x, history)(x_smooth)
-                    ax.plot(x_smooth, y_smooth, color="black")
-                else:
-                    ax.plot(history, color="black")
-
-                ax.set_xticks([])
-                ax.set_yticks([])
-                canvas.draw()
-
-                low, high = thresholds[metric]
-                color = "red" if value < low else "green" if value > high else "yellow"
-                self.root.after(0, lambda m=metric, c=color: self.app.metric_labels[m].config(fg=c))
-
-            self.last_update_time = current_time
+                ax.plot(history, color="black")
+
+            ax.set_xticks([])
+            ax.set_yticks([])
+            canvas.draw()
+
+            low, high = thresholds[metric]
+            color = "red" if value < low else "green" if value > high else "yellow"
+            self.app.metric_labels[metric].config(fg=color)
 
 
 
@@ -0,0 +1,196 @@
+import atexit
+import os
+import struct
+import tempfile
+import threading
+import wave
+import numpy as np
+from WavReader import WavReader
+
+
+class RecordingWriter:
+    """
+    Streams a live recording from an `AudioRingBuffer` to a sound file as it is captured.
+
+    A background thread wakes every `WRITE_INTERVAL` seconds and appends every sample
+    the capture callback has added to the ring since the last write, so the ring only
+    has to hold a short window and the recording's memory use stays flat however long
+    the lecture runs.
+
+    The spill file is a 32-bit float WAV file whose RIFF and data sizes are rewritten
+    after every append, so it is a valid recording up to the last write even if the
+    application crashes, and `WavReader` can memory-map it for playback and export
+    while recording continues. If the writer falls more than the ring's capacity
+    behind, the overwritten samples are written as silence and counted in
+    `dropped_samples`, keeping the timeline intact. Samples are copied out of the ring
+    and checked before they are written, so a producer lapping the writer mid-read
+    cannot corrupt the file.
+    """
+
+    WRITE_INTERVAL = 0.5
+    EXPORT_BLOCK_SECONDS = 10.0
+    HEADER_BYTES = 44
+
+    def __init__(self, ring, sr, path=None):
+        """
+        Open the spill file.
+
+        Parameters:
+        - ring (AudioRingBuffer): Ring the capture callback writes into.
+        - sr (int): Sampling rate of the recording.
+        - path (str, optional): Spill file. Defaults to a new temporary WAV file, which is
+          deleted by `discard` or, failing that, when the interpreter exits.
+        """
+        if path is None:
+            handle, path = tempfile.mkstemp(prefix="lecture_recording_", suffix=".wav")
+            os.close(handle)
+            atexit.register(self.discard)
+
+        self.ring = ring
+        self.sr = sr
+        self.path = path
+        self.file = open(path, "w+b")
+        self.write_header(0)
+        self.origin = self.flushed = ring.written
+        self.peak = 0.0
+        self.dropped_samples = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+
+    def write_header(self, data_bytes):
+        """
+        Write the RIFF/WAVE header for `data_bytes` bytes of mono float32 samples, then return to the end of the file.
+        """
+        self.file.seek(0)
+        self.file.write(struct.pack(
+            "<4sI4s4sIHHIIHH4sI", b"RIFF", self.HEADER_BYTES - 8 + data_bytes, b"WAVE",
+            b"fmt ", 16, WavReader.IEEE_FLOAT, 1, self.sr, self.sr * 4, 4, 32, b"data", data_bytes,
+        ))
+        self.file.seek(0, os.SEEK_END)
+
+
+    def append(self, samples):
+        """
+        Append float32 samples to the data chunk and update the header sizes.
+        """
+        np.asarray(samples, dtype="<f4").tofile(self.file)
+        self.write_header(self.file.tell() - self.HEADER_BYTES)
+        self.file.flush()
+
+
+    def start(self):
+        """Start the background writer thread."""
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+
+    def run(self):
+        """Writer thread: append new samples every `WRITE_INTERVAL` seconds until stopped."""
+        while not self.stopped.wait(self.WRITE_INTERVAL):
+            self.write_pending()
+        self.write_pending()
+
+
+    def write_pending(self):
+        """
+        Append the samples captured since the last write to the spill file.
+
+        Returns:
+        - int: Number of samples written.
+        """
+        with self.lock:
+            if self.file.closed:
+                return 0
+            start, stop = self.flushed, self.ring.written
+            if stop == start:
+                return 0
+
+            if not self.ring.holds(start):
+                lost = min(self.ring.oldest, stop) - start
+                self.append(np.zeros(lost, dtype=np.float32))
+                self.dropped_samples += lost
+                self.flushed += lost
+
+            try:
+                samples = np.array(self.ring.read(self.flushed, stop))
+            except IndexError:
+                return self.flushed - start
+            if not self.ring.holds(self.flushed):
+                lost = min(self.ring.oldest, stop) - self.flushed
+                samples[:lost] = 0.0
+                self.dropped_samples += lost
+            self.append(samples)
+            if len(samples):
+                self.peak = max(self.peak, float(np.max(np.abs(samples))))
+            self.flushed = stop
+            return stop - start
+
+
+    def stop(self):
+        """
+        Write any remaining samples and close the spill file. Safe to call more than once.
+        """
+        self.stopped.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.write_pending()
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+    @property
+    def frames(self):
+        """Samples written to the spill file so far."""
+        return self.flushed - self.origin
+
+
+    def read(self):
+        """
+        The recording written so far, as a 1D float32 memory-mapped view of the spill file.
+        """
+        self.write_pending()
+        return WavReader(self.path).read()
+
+
+    def export(self, filename):
+        """
+        Save the recording as a peak-normalised 16-bit file, a block at a time.
+
+        Produces the same samples as normalising the whole recording in memory: they are
+        scaled so the loudest reaches 32767 (the peak is tracked while writing) and
+        truncated to int16. Files ending in ".flac" are encoded as FLAC, others as WAV.
+
+        Parameters:
+        - filename (str): Output path.
+        """
+        self.write_pending()
+        peak = self.peak or 1.0
+        reader = WavReader(self.path)
+        block = max(1, int(self.EXPORT_BLOCK_SECONDS * self.sr))
+        blocks = (((reader.read(start, start + block) / peak) * 32767).astype(np.int16) for start in range(0, len(reader), block))
+
+        if filename.lower().endswith(".flac"):
+            import soundfile as sf
+
+            with sf.SoundFile(filename, mode="w", samplerate=self.sr, channels=1, subtype="PCM_16") as output:
+                for samples in blocks:
+                    output.write(samples)
+            return
+
+        with wave.open(filename, "wb") as output:
+            output.setnchannels(1)
+            output.setsampwidth(2)
+            output.setframerate(self.sr)
+            for samples in blocks:
+                output.writeframes(samples.tobytes())
+
+
+    def discard(self):
+        """Stop writing and delete the spill file. Safe to call more than once."""
+        atexit.unregister(self.discard)
+        self.stop()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,66 @@
+import numpy as np
+
+
+class RunningStats:
+    """
+    Mergeable running mean and variance (Welford's algorithm).
+
+    Each `update` folds in a whole batch with the pairwise combination of Chan et al.,
+    so adding a chunk costs O(chunk) and the statistics never need the earlier values.
+    Two accumulators built over separate parts of a signal can be combined with `merge`.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+
+    def update(self, values):
+        """
+        Fold a batch of values into the statistics.
+
+        Parameters:
+        - values (np.ndarray): Values to add (any shape).
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return
+        batch_mean = float(np.mean(values))
+        self.combine(len(values), batch_mean, float(np.sum((values - batch_mean) ** 2)))
+
+
+    def merge(self, other):
+        """
+        Fold another `RunningStats` into this one.
+
+        Parameters:
+        - other (RunningStats): Statistics over a disjoint set of values.
+        """
+        if other.count:
+            self.combine(other.count, other.mean, other.m2)
+
+
+    def combine(self, count, mean, m2):
+        """
+        Fold in the count, mean and sum of squared deviations of another set of values.
+        """
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+
+    @property
+    def variance(self):
+        """Population variance (0 when empty)."""
+        return self.m2 / self.count if self.count else 0.0
+
+
+    @property
+    def std(self):
+        """Population standard deviation (0 when empty)."""
+        return float(np.sqrt(self.variance))
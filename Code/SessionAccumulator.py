@@ -0,0 +1,266 @@
+import numpy as np
+from AnalysisResult import AnalysisResult
+from FrameKernels import FrameKernels
+from PauseDetector import PauseDetector
+from RunningStats import RunningStats
+from StreamingFeatures import StreamingFeatures
+
+
+class SessionAccumulator:
+    """
+    Whole-session engagement metrics kept up to date while a recording grows.
+
+    Audio is fed in arbitrary chunks with `update`, framed by a `StreamingFeatures`
+    stream exactly as in `AudioProcessor.give_audio_feedback_from_file` (hop-aligned
+    blocks with `center=False`), or as ready-made blocks with `add_block` when the caller
+    already runs its own stream. Each new block only updates running state:
+
+    - `RunningStats` (Welford) for pitch, in-band pitch, RMS energy and ZCR.
+    - A histogram of absolute frame loudness (`AudioFeatures.loudness_rms`) in `LOUDNESS_BIN_DB` steps. The report's
+      loudness is relative to the loudest frame of the session and floored `TOP_DB`
+      below it, both of which can change as audio arrives, so a running mean alone
+      cannot reproduce it.
+    - Counts of each ZCR value (a multiple of 1/frame_length), so the speech-frame
+      count against the session-wide mean ZCR is exact.
+    - A pause state machine that closes silent runs as they end and carries an open
+      run across chunk boundaries.
+
+    Audio that was never analysed (e.g. chunks the live analysis dropped) is recorded
+    with `skip`: it counts towards the session duration and moves later frames along
+    the recording's timeline, but closes any open pause rather than extending it.
+
+    `report` then builds the same `AnalysisResult` as the streamed whole-file analysis
+    in time independent of the session length.
+    """
+
+    TOP_DB = 80.0
+    MIN_AMPLITUDE = 1e-5
+    LOUDNESS_RANGE_DB = (-100.0, 40.0)
+    LOUDNESS_BIN_DB = 0.01
+
+    def __init__(self, processor, sr):
+        """
+        Start an empty session.
+
+        Parameters:
+        - processor (AudioProcessor): Processor whose settings (frozen at this point) and
+          analysis helpers are used for the session.
+        - sr (int): Sampling rate of the incoming audio.
+        """
+        self.processor = processor.with_settings()
+        self.sr = sr
+        self.frame_length, self.hop_length = self.processor.frame_parameters(sr)
+        self.stream = StreamingFeatures(self.processor, sr, window_seconds=0.0)
+        self.samples = 0
+        self.frames = 0
+        self.skipped_samples = 0
+        self.skipped_frames = 0
+
+        low, high = self.LOUDNESS_RANGE_DB
+        bins = int(round((high - low) / self.LOUDNESS_BIN_DB)) + 1
+        self.loudness_counts = np.zeros(bins, dtype=np.int64)
+        self.loudness_sums = np.zeros(bins)
+        self.peak_rms = 0.0
+
+        self.energy = RunningStats()
+        self.zcr = RunningStats()
+        self.zcr_counts = np.zeros(self.frame_length + 1, dtype=np.int64)
+        self.pitch = RunningStats()
+        self.band_pitch = RunningStats()
+
+        self.pause_runs = []
+        self.open_pause = None
+
+
+    def update(self, y):
+        """
+        Add the next chunk of audio to the session.
+
+        Parameters:
+        - y (np.ndarray): Audio chunk (any length; 2D single-channel input is flattened).
+        """
+        y = np.asarray(y, dtype=np.float32).ravel()
+        self.add_block(len(y), self.stream.update(y))
+
+
+    def add_block(self, n_samples, features):
+        """
+        Add a chunk whose frames were already computed by a `StreamingFeatures` stream.
+
+        Parameters:
+        - n_samples (int): Length of the chunk in samples.
+        - features (AudioFeatures or None): Bundle of the frames the chunk completed, as returned
+          by `StreamingFeatures.update` for a stream with the same settings and rate.
+        """
+        self.samples += n_samples
+        if features is not None:
+            self.add_frames(features)
+
+
+    def skip(self, n_samples):
+        """
+        Record a gap of `n_samples` samples that were not analysed.
+
+        Parameters:
+        - n_samples (int): Length of the gap in samples.
+        """
+        if n_samples <= 0:
+            return
+        if self.open_pause is not None:
+            self.pause_runs.append((self.open_pause, self.position))
+            self.open_pause = None
+        self.stream.restart()
+        self.samples += n_samples
+        self.skipped_samples += n_samples
+        self.skipped_frames = max(self.skipped_frames, int(round(self.samples / self.hop_length)) - self.frames)
+
+
+    @property
+    def position(self):
+        """Timeline position (in frames) of the next frame, counting skipped audio."""
+        return self.frames + self.skipped_frames
+
+
+    def add_frames(self, features):
+        """
+        Fold the frames of one block into the running state.
+
+        Parameters:
+        - features (AudioFeatures): Features of a block computed with `center=False`.
+        """
+        rms = features.rms
+        zcr = features.zcr[features.voiced] if features.voice_gate else features.zcr
+        if len(rms) == 0:
+            return
+
+        loudness_rms = features.loudness_rms
+        low, _ = self.LOUDNESS_RANGE_DB
+        db = 20.0 * np.log10(np.maximum(loudness_rms.astype(np.float64), self.MIN_AMPLITUDE))
+        bins = np.clip(np.rint((db - low) / self.LOUDNESS_BIN_DB).astype(np.int64), 0, len(self.loudness_counts) - 1)
+        np.add.at(self.loudness_counts, bins, 1)
+        np.add.at(self.loudness_sums, bins, db)
+        self.peak_rms = max(self.peak_rms, float(np.max(loudness_rms)))
+
+        self.energy.update(rms)
+        self.zcr.update(zcr)
+        np.add.at(self.zcr_counts, np.rint(zcr * self.frame_length).astype(np.int64), 1)
+
+        pitch_values = features.pitch_values
+        self.pitch.update(pitch_values)
+        self.band_pitch.update(FrameKernels.band_values(pitch_values, 50, 500))
+
+        starts, stops = FrameKernels.silent_runs(rms, self.processor.settings.get("pause_threshold_value", 0.001))
+        self.track_pauses(starts, stops, len(rms))
+        self.frames += len(rms)
+
+
+    def track_pauses(self, starts, stops, n_frames):
+        """
+        Advance the pause state machine over the silent runs of one block.
+
+        Parameters:
+        - starts (np.ndarray): Start frame of each silent run in the block.
+        - stops (np.ndarray): Exclusive stop frame of each silent run in the block.
+        - n_frames (int): Frames in the block, which continues from `self.position`.
+        """
+        position = self.position
+        starts = starts + position
+        stops = stops + position
+
+        if self.open_pause is not None:
+            if len(starts) and starts[0] == position:
+                starts[0] = self.open_pause
+            else:
+                self.pause_runs.append((self.open_pause, position))
+            self.open_pause = None
+
+        if len(stops) and stops[-1] == position + n_frames:
+            self.open_pause = int(starts[-1])
+            starts, stops = starts[:-1], stops[:-1]
+
+        self.pause_runs.extend(zip(starts.tolist(), stops.tolist()))
+
+
+    @property
+    def duration(self):
+        """Seconds of audio received so far, including skipped audio."""
+        return self.samples / self.sr
+
+
+    @property
+    def skipped_duration(self):
+        """Seconds of audio skipped without analysis."""
+        return self.skipped_samples / self.sr
+
+
+    def avg_loudness(self):
+        """
+        Mean frame loudness in dB relative to the loudest frame, floored `TOP_DB` below it.
+
+        Matches `np.mean(librosa.amplitude_to_db(rms, ref=np.max))` over all frames so far,
+        up to half a histogram bin for frames within that bin of the floor.
+        """
+        if self.frames == 0:
+            return 0.0
+
+        low, _ = self.LOUDNESS_RANGE_DB
+        peak_db = 20.0 * np.log10(max(self.peak_rms, self.MIN_AMPLITUDE))
+        floor = peak_db - self.TOP_DB
+        edge = int(np.clip(np.rint((floor - low) / self.LOUDNESS_BIN_DB), 0, len(self.loudness_counts) - 1))
+
+        total = np.sum(self.loudness_sums[edge + 1:]) + floor * np.sum(self.loudness_counts[:edge])
+        if self.loudness_counts[edge]:
+            total += max(self.loudness_sums[edge] / self.loudness_counts[edge], floor) * self.loudness_counts[edge]
+        return float(total / self.frames - peak_db)
+
+
+    def speech_rate(self):
+        """
+        Frames whose ZCR exceeds the session mean by 0.005, per second of analysed audio.
+        """
+        if self.samples == self.skipped_samples:
+            return 0.0
+        values = np.arange(len(self.zcr_counts)) / self.frame_length
+        speech_frames = np.sum(self.zcr_counts[values > self.zcr.mean + 0.005])
+        return float(speech_frames / (self.duration - self.skipped_duration))
+
+
+    def pause_intervals(self):
+        """
+        Pause and break intervals so far; a trailing silent run ends at the last frame.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Pause and break intervals, each of shape (n, 3)
+          holding (start, end, duration) in seconds.
+        """
+        settings = self.processor.settings
+        frame_duration = max(self.hop_length / self.sr, 0.01) if self.frames > 1 else 0.01
+        min_pause_frames = int(settings.get("pause_duration", 0.3) / frame_duration)
+        break_frames = int(settings.get("break_duration", 7.0) / frame_duration)
+
+        runs = self.pause_runs + ([(self.open_pause, self.position)] if self.open_pause is not None else [])
+        starts, stops = np.array(runs, dtype=np.int64).reshape(-1, 2).T
+        ends = np.minimum(stops, self.position - 1)
+
+        return PauseDetector.classify(
+            starts * self.hop_length / self.sr, ends * self.hop_length / self.sr,
+            stops - starts, min_pause_frames, break_frames,
+        )
+
+
+    def report(self):
+        """
+        Score the whole session so far.
+
+        Returns:
+        - AnalysisResult: Metrics, pause/break intervals, engagement score and advice codes.
+        """
+        processor = self.processor
+        avg_loudness = self.avg_loudness()
+        pauses, breaks = self.pause_intervals()
+        monotony = "none" if self.band_pitch.count == 0 else processor.variation_level(self.band_pitch.mean, self.band_pitch.std)
+
+        return processor.advise(AnalysisResult(
+            self.duration, avg_loudness, processor.loudness_level(avg_loudness), pauses, breaks,
+            self.pitch.mean, self.pitch.mean, self.pitch.std, self.speech_rate(), self.energy.mean, monotony,
+        ))
@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+
+class StageProfiler:
+    """
+    Record wall time, CPU time and peak allocated memory for named stages of the analysis pipeline.
+
+    Stages are opened with `with profiler.stage("name"):` and may be nested; each record
+    keeps the name of its enclosing stage. Peak memory is measured with `tracemalloc`
+    (which NumPy reports its array buffers to) as the highest traced allocation above
+    what was already allocated when the stage started. CPU time is process-wide, so
+    it includes any helper threads a stage uses.
+    """
+
+    def __init__(self, trace_path=None, trace_memory=True):
+        """
+        Initialise the profiler.
+
+        Parameters:
+        - trace_path (str, optional): JSON file rewritten with the trace whenever an outermost stage ends.
+        - trace_memory (bool): Measure peak memory with `tracemalloc` (default True).
+        """
+        self.trace_path = trace_path
+        self.trace_memory = trace_memory
+        self.records = []
+        self.origin = time.perf_counter()
+        self._open = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+
+    @staticmethod
+    def maybe(profiler, name, **details):
+        """
+        Return `profiler.stage(name)`, or a no-op context when `profiler` is None.
+        """
+        if profiler is None:
+            return nullcontext()
+        return profiler.stage(name, **details)
+
+
+    @contextmanager
+    def stage(self, name, **details):
+        """
+        Context manager that times the enclosed block as one stage.
+
+        Parameters:
+        - name (str): Stage name, e.g. "load", "denoise" or "analyse_pitch".
+        - **details: Extra JSON-serialisable values stored with the record.
+        """
+        stack = self._stack()
+        entry = {"name": name, "peak": 0, "base": 0}
+        parent = stack[-1]["name"] if stack else None
+
+        with self._lock:
+            if self.trace_memory:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._started_tracing = True
+                entry["base"] = self._update_peaks()[0]
+            self._open.append(entry)
+        stack.append(entry)
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall_seconds = time.perf_counter() - start_wall
+            cpu_seconds = time.process_time() - start_cpu
+            stack.pop()
+
+            with self._lock:
+                if self.trace_memory and tracemalloc.is_tracing():
+                    self._update_peaks()
+                self._open.remove(entry)
+
+                self.records.append({
+                    "name": name,
+                    "parent": parent,
+                    "depth": len(stack),
+                    "start": start_wall - self.origin,
+                    "wall_seconds": wall_seconds,
+                    "cpu_seconds": cpu_seconds,
+                    "peak_mb": max(entry["peak"] - entry["base"], 0) / (1024 * 1024) if self.trace_memory else None,
+                    **details,
+                })
+
+                outermost = not self._open
+                if outermost and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+
+            if outermost and self.trace_path:
+                self.dump(self.trace_path)
+
+
+    def _stack(self):
+        """Open stages of the calling thread, innermost last."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+
+    def _update_peaks(self):
+        """
+        Fold the traced peak since the last reset into every open stage, then reset it.
+
+        Returns:
+        - Tuple[int, int]: Current and peak traced memory in bytes.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        for entry in self._open:
+            entry["peak"] = max(entry["peak"], peak)
+        tracemalloc.reset_peak()
+        return current, peak
+
+
+    def summary(self):
+        """
+        Aggregate the records per stage name.
+
+        Returns:
+        - dict: For each stage name, its call count, total wall and CPU seconds and largest peak memory.
+        """
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record["name"], {"count": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_mb": None})
+            total["count"] += 1
+            total["wall_seconds"] += record["wall_seconds"]
+            total["cpu_seconds"] += record["cpu_seconds"]
+            if record["peak_mb"] is not None:
+                total["peak_mb"] = max(total["peak_mb"] or 0.0, record["peak_mb"])
+        return totals
+
+
+    def to_dict(self):
+        """
+        Return the trace as a JSON-serialisable dictionary.
+
+        Returns:
+        - dict: "stages" (records in completion order) and "summary" (see `summary`).
+        """
+        with self._lock:
+            records = list(self.records)
+        return {"stages": records, "summary": self.summary()}
+
+
+    def dump(self, path):
+        """
+        Write the trace to a JSON file.
+
+        Parameters:
+        - path (str): Output file path.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
@@ -0,0 +1,153 @@
+import librosa
+import numpy as np
+
+
+class StreamingFeatures:
+    """
+    Frame-level features of a live signal, computed once per frame as audio arrives.
+
+    Incoming audio is framed exactly as `AudioProcessor.give_audio_feedback_from_file`
+    frames streamed blocks: hop-aligned with `center=False`, carrying the last
+    `frame_length - hop_length` samples of each chunk over to the next, so every frame
+    of the stream is analysed exactly once, including those straddling chunk boundaries.
+    Each `update` builds one `AudioFeatures` bundle for the new frames only (one STFT
+    and pitch track over them) and returns it.
+
+    The last `window_seconds` of frame-level RMS, loudness RMS, ZCR, voice activity and pitch
+    candidates are kept, and `metrics` and `feedback` summarise that sliding window the
+    way `give_realtime_audio_feedback` summarises a chunk, without recomputing anything.
+    Pitch candidates are selected per update (e.g. above the median magnitude of the
+    new frames).
+    """
+
+    def __init__(self, processor, sr, window_seconds=5.0):
+        """
+        Start an empty stream.
+
+        Parameters:
+        - processor (AudioProcessor): Processor whose settings (frozen at this point) and
+          analysis helpers are used.
+        - sr (int): Sampling rate of the incoming audio.
+        - window_seconds (float): Length of the sliding window kept for `metrics` (0 keeps none).
+        """
+        self.processor = processor.with_settings()
+        self.sr = sr
+        self.frame_length, self.hop_length = self.processor.frame_parameters(sr)
+        self.window_frames = int(round(window_seconds * sr / self.hop_length))
+        self.samples = 0
+        self.frames = 0
+        self.tail = np.zeros(0, dtype=np.float32)
+
+        self.rms = np.zeros(0, dtype=np.float32)
+        self.loudness_rms = np.zeros(0, dtype=np.float32)
+        self.zcr = np.zeros(0)
+        self.voiced = np.zeros(0, dtype=bool)
+        self.pitches = None
+        self.pitch_mask = None
+
+
+    def update(self, y):
+        """
+        Add the next chunk of audio and compute the features of the frames it completes.
+
+        Parameters:
+        - y (np.ndarray): Audio chunk (any length; 2D single-channel input is flattened).
+
+        Returns:
+        - AudioFeatures or None: Bundle (`center=False`) of the new frames, or None if the
+          chunk did not complete a frame.
+        """
+        y = np.asarray(y, dtype=np.float32).ravel()
+        self.samples += len(y)
+        pending = np.concatenate((self.tail, y))
+
+        if len(pending) < self.frame_length:
+            self.tail = pending
+            return None
+
+        n_frames = 1 + (len(pending) - self.frame_length) // self.hop_length
+        block = pending[:self.frame_length + (n_frames - 1) * self.hop_length]
+        self.tail = pending[n_frames * self.hop_length:].copy()
+
+        features = self.processor.build_features(block, self.sr, center=False)
+        self.frames += n_frames
+        if self.window_frames > 0:
+            self.add_to_window(features)
+        return features
+
+
+    def restart(self):
+        """
+        Forget the carried-over samples after a gap in the input, so frames never join
+        audio from before and after it. The next chunk starts a new frame grid; the
+        sliding window keeps its frames.
+        """
+        self.tail = np.zeros(0, dtype=np.float32)
+
+
+    def add_to_window(self, features):
+        """
+        Append the frames of one bundle to the sliding window and drop the oldest beyond it.
+        """
+        keep = self.window_frames
+        voiced = features.voiced if features.voice_gate else np.ones(len(features.rms), dtype=bool)
+        pitches, mask = features.pitch_frames
+
+        self.rms = np.concatenate((self.rms, features.rms))[-keep:]
+        self.loudness_rms = np.concatenate((self.loudness_rms, features.loudness_rms))[-keep:]
+        self.zcr = np.concatenate((self.zcr, features.zcr))[-keep:]
+        self.voiced = np.concatenate((self.voiced, voiced))[-keep:]
+        if self.pitches is None or self.pitches.shape[0] != pitches.shape[0]:
+            self.pitches, self.pitch_mask = pitches[:, -keep:], mask[:, -keep:]
+        else:
+            self.pitches = np.concatenate((self.pitches, pitches), axis=1)[:, -keep:]
+            self.pitch_mask = np.concatenate((self.pitch_mask, mask), axis=1)[:, -keep:]
+
+
+    @property
+    def window_duration(self):
+        """Seconds of audio covered by the frames in the window."""
+        return len(self.rms) * self.hop_length / self.sr
+
+
+    def metrics(self):
+        """
+        Real-time metrics over the sliding window.
+
+        Returns:
+        - dict or None: "loudness" (mean dB relative to the loudest frame), "pitch" and
+          "pitch_variation" (mean and standard deviation of the pitch candidates),
+          "speech_rate" (frames whose ZCR exceeds the window mean by 0.005, per second;
+          voice-active frames only with gating) and "energy" (mean RMS), or None before
+          the first frame.
+        """
+        if len(self.rms) == 0:
+            return None
+
+        pitch_values = self.pitches[self.pitch_mask]
+        zcr = self.zcr[self.voiced]
+        speech_frames = np.sum(zcr > np.mean(zcr) + 0.005) if len(zcr) else 0
+
+        return {
+            "loudness": float(np.mean(librosa.amplitude_to_db(self.loudness_rms, ref=np.max))),
+            "pitch": float(np.mean(pitch_values)) if len(pitch_values) else 0.0,
+            "pitch_variation": float(np.std(pitch_values)) if len(pitch_values) else 0.0,
+            "speech_rate": float(speech_frames / self.window_duration),
+            "energy": float(np.mean(self.rms)),
+        }
+
+
+    def feedback(self):
+        """
+        Real-time advice over the sliding window (see `AudioProcessor.generate_realtime_advice`).
+
+        Returns:
+        - str: Advice text.
+        """
+        metrics = self.metrics()
+        if metrics is None:
+            return "No feedback available for this segment."
+        advice = self.processor.generate_realtime_advice(
+            metrics["loudness"], metrics["pitch_variation"], metrics["speech_rate"], metrics["energy"],
+        )
+        return advice or "No feedback available for this segment."
@@ -0,0 +1,99 @@
+import queue
+import threading
+import unittest
+from AnalysisQueue import AnalysisQueue
+
+
+class TestAnalysisQueue(unittest.TestCase):
+
+    def fill(self, analysis_queue, count=5, step=100):
+        for i in range(count):
+            analysis_queue.put((i * step, (i + 1) * step))
+
+    def drain(self, analysis_queue):
+        chunks = []
+        while analysis_queue.depth:
+            chunks.append(analysis_queue.get(timeout=0))
+        return chunks
+
+    def test_drop_oldest_keeps_newest_chunks(self):
+        analysis_queue = AnalysisQueue(2, "drop_oldest")
+        self.fill(analysis_queue)
+        self.assertEqual(self.drain(analysis_queue), [(300, 400), (400, 500)])
+        self.assertEqual(analysis_queue.stats(), {"policy": "drop_oldest", "depth": 0, "max_depth": 2, "dropped": 3, "coalesced": 0})
+
+    def test_coalesce_merges_into_newest_chunk(self):
+        analysis_queue = AnalysisQueue(2, "coalesce")
+        self.fill(analysis_queue)
+        analysis_queue.put(None)
+        self.assertEqual(self.drain(analysis_queue), [(0, 100), (100, 500), None])
+        self.assertEqual(analysis_queue.coalesced, 3)
+        self.assertEqual(analysis_queue.dropped, 0)
+
+    def test_block_waits_for_consumer_then_times_out(self):
+        analysis_queue = AnalysisQueue(1, "block")
+        analysis_queue.put((0, 100))
+        consumer = threading.Timer(0.1, analysis_queue.get)
+        consumer.start()
+        self.assertTrue(analysis_queue.put((100, 200), timeout=5.0))
+        consumer.join()
+        self.assertEqual(self.drain(analysis_queue), [(100, 200)])
+
+        analysis_queue.put((200, 300))
+        self.assertFalse(analysis_queue.wait_for_space(timeout=0.01))
+        self.assertFalse(analysis_queue.put((300, 400), timeout=0.05))
+        self.assertEqual(analysis_queue.dropped, 1)
+        self.assertEqual(self.drain(analysis_queue), [(200, 300)])
+        self.assertTrue(analysis_queue.wait_for_space(timeout=0))
+        with self.assertRaises(queue.Empty):
+            analysis_queue.get(timeout=0.01)
+
+    def test_block_feeder_waits_off_the_audio_callback(self):
+        from collections import deque
+        from types import SimpleNamespace
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}))
+        analyser.is_recording = True
+        analysis_queue = AnalysisQueue(1, "block")
+        pending, chunk_ready = deque(), threading.Event()
+        feeder = threading.Thread(target=analyser.feed_chunks, args=(analysis_queue, pending, chunk_ready), daemon=True)
+        feeder.start()
+
+        pending.extend((i * 100, (i + 1) * 100) for i in range(4))
+        chunk_ready.set()
+        received = [analysis_queue.get(timeout=5.0) for _ in range(3)]
+        analyser.is_recording = False
+        feeder.join()
+
+        self.assertEqual(received, [(0, 100), (100, 200), (200, 300)])
+        self.assertEqual(len(pending) + analysis_queue.depth, 1)
+        self.assertEqual(analysis_queue.dropped, len(pending))
+
+    def test_feedback_shows_the_recordings_own_queue(self):
+        from types import SimpleNamespace
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        feedback, callbacks = [], []
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}, update_feedback_text=feedback.append))
+        analyser.root = SimpleNamespace(after=lambda delay, callback: callbacks.append(callback))
+        analyser.last_update_time = 0.0
+        metrics = dict.fromkeys(("loudness", "pitch", "speech_rate", "energy"), 0.0)
+        worker = SimpleNamespace(analyse=lambda *args: {
+            "silent": False, "feedback": "", "score": 50, "skipped_seconds": 1.0, "metrics": metrics,
+        })
+        recording_queue = AnalysisQueue(1)
+        recording_queue.discard()
+        analyser.analysis_queue = AnalysisQueue(1)
+
+        analyser.analyse_chunk([0.0], worker, 0, recording_queue)
+        callbacks[0]()
+
+        self.assertIn("1 dropped", feedback[0])
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            AnalysisQueue(2, "newest")
+
+if __name__ == "__main__":
+    unittest.main()
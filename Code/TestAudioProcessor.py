@@ -1,6 +1,15 @@
 import unittest 
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import soundfile as sf
+import librosa
 from AudioProcessor import AudioProcessor
+from AnalysisResult import AnalysisResult
+from AudioFeatures import AudioFeatures
+from BenchmarkSuite import BenchmarkSuite
+from NoiseSuppressor import NoiseSuppressor
 
 class TestAudioProcessor(unittest.TestCase):
     
@@ -14,6 +23,15 @@ class TestAudioProcessor(unittest.TestCase):
         self.assertIsInstance(loudness, float)
         self.assertTrue(any(word in feedback.lower() for word in ["loud", "quiet", "balanced"]))
 
+    def test_loudness_matches_baseline_frames(self):
+        signal = BenchmarkSuite().synthetic_lecture(20.0, self.sample_rate)
+        rms = librosa.feature.rms(y=signal, frame_length=1024, hop_length=512)[0]
+        expected = float(np.mean(librosa.amplitude_to_db(rms, ref=np.max)))
+        loudness, _ = self.processor.analyse_loudness(signal, self.sample_rate)
+        batched = self.processor.give_batch_audio_feedback([signal], self.sample_rate)[0]
+        self.assertAlmostEqual(loudness, expected, places=4)
+        self.assertAlmostEqual(batched.avg_loudness, expected, places=4)
+
     def test_analysis_pitch(self):
         pitch, pitch_values = self.processor.analyse_pitch(self.test_signal, self.sample_rate)
         self.assertIsInstance(pitch, float)
@@ -29,5 +47,190 @@ class TestAudioProcessor(unittest.TestCase):
         self.assertIsInstance(energy, float)
         self.assertGreaterEqual(energy, 0)
 
+    def test_shared_features_match_piptrack(self):
+        features = AudioFeatures(self.test_signal, self.sample_rate)
+        pitches, magnitudes = librosa.piptrack(y=self.test_signal, sr=self.sample_rate)
+        expected = pitches[magnitudes > np.median(magnitudes)]
+        np.testing.assert_allclose(features.pitch_values, expected)
+
+    def test_analyses_reuse_shared_features(self):
+        features = AudioFeatures(self.test_signal, self.sample_rate)
+        self.processor.analyse_pitch(self.test_signal, self.sample_rate, features)
+        pitch_track = features.pitch_track
+        self.processor.analyse_prosody(self.test_signal, self.sample_rate, features)
+        self.processor.analyse_monotony(self.test_signal, self.sample_rate, features)
+        self.assertIs(features.pitch_track, pitch_track)
+
+    def test_give_audio_feedback(self):
+        result = self.processor.give_audio_feedback(self.test_signal, self.sample_rate)
+        self.assertIsInstance(result, AnalysisResult)
+        self.assertEqual(len(result.advice), 6)
+        self.assertAlmostEqual(result.score, round(16.7 * sum(code.endswith("_ok") for code in result.advice), 1))
+        self.assertIn("Advice:", result.render())
+        self.assertIn(result.loudness_feedback, result.render())
+
+    def test_steady_tone_is_advised_as_monotonous(self):
+        t = np.arange(3 * self.sample_rate) / self.sample_rate
+        tone = (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+        result = self.processor.give_audio_feedback(tone, self.sample_rate)
+        self.assertEqual(result.monotony, "low")
+        self.assertIn("monotony_flat", result.advice)
+        self.assertNotIn("monotony_ok", result.advice)
+
+    def test_result_uses_slots(self):
+        result = self.processor.give_audio_feedback(self.test_signal, self.sample_rate)
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(result.pauses.shape[1], 3)
+        self.assertEqual(result.to_dict()["pause_count"], result.pause_count)
+
+    def test_stream_block_frames_respects_memory_ceiling(self):
+        frames = AudioProcessor.stream_block_frames(48000, block_duration=600.0, max_memory_mb=1.0)
+        block_bytes = (frames * 512 + 2048 - 512) * 4
+        self.assertLessEqual(block_bytes, 1024 * 1024)
+        self.assertEqual(AudioProcessor.stream_block_frames(22050, 1.0, 64.0), int(22050 / 512))
+
+    def test_streamed_feedback_matches_in_memory(self):
+        signal = self.test_signal.astype(np.float32) * 0.1
+        signal = np.tile(signal, 6)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "lecture.wav")
+            sf.write(path, signal, self.sample_rate)
+            streamed = self.processor.give_audio_feedback_from_file(path, block_duration=2.0)
+        in_memory = self.processor.give_audio_feedback(signal, self.sample_rate)
+        self.assertAlmostEqual(streamed.avg_loudness, in_memory.avg_loudness, delta=0.5)
+        self.assertIn("Advice:", streamed.render())
+
+    def test_streamed_feedback_is_denoised_like_loaded_file(self):
+        processor = AudioProcessor({"pause_threshold_value": 0.02})
+        signal = BenchmarkSuite().synthetic_lecture(30.0, self.sample_rate).astype(np.float32)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "lecture.wav")
+            sf.write(path, signal, self.sample_rate, subtype="FLOAT")
+            streamed = processor.give_audio_feedback_from_file(path, block_duration=2.0)
+            in_memory = processor.give_audio_feedback(*AudioProcessor.load_audio_file(path))
+        self.assertAlmostEqual(streamed.avg_loudness, in_memory.avg_loudness, delta=0.1)
+        self.assertAlmostEqual(streamed.avg_energy, in_memory.avg_energy, delta=1e-3)
+        self.assertAlmostEqual(streamed.avg_pitch, in_memory.avg_pitch, delta=10.0)
+        self.assertEqual(streamed.pause_count, in_memory.pause_count)
+        self.assertEqual(streamed.advice, in_memory.advice)
+
+    def test_streamed_noise_suppression_matches_whole_signal(self):
+        signal = (np.tile(self.test_signal, 3) * 0.1).astype(np.float32)
+        suppressor = NoiseSuppressor(self.sample_rate, block_frames=17)
+        blocks = lambda: (signal[i:i + 1000] for i in range(0, len(signal), 1000))
+        streamed = np.concatenate(list(suppressor.process_stream(blocks(), suppressor.estimate_stream_noise_profile(blocks()))))
+        np.testing.assert_allclose(streamed, suppressor.process(signal), atol=1e-6)
+
+    def test_load_audio_in_chunks_returns_views(self):
+        chunks, sr = AudioProcessor.load_audio_in_chunks(self.test_signal, chunk_size=0.3, sr=self.sample_rate)
+        self.assertEqual(sum(len(chunk) for chunk in chunks), len(self.test_signal))
+        self.assertTrue(all(np.shares_memory(chunk, self.test_signal) for chunk in chunks))
+
+    def test_parallel_feedback_matches_serial(self):
+        processor = AudioProcessor({"pause_threshold_value": 0.02})
+        signal = BenchmarkSuite().synthetic_lecture(30.0, self.sample_rate).astype(np.float32)
+        parallel = processor.give_audio_feedback(signal, self.sample_rate, workers=2, chunk_size=1.3)
+        serial = processor.give_audio_feedback(signal, self.sample_rate, workers=1)
+        self.assertGreater(serial.pause_count, 2)
+        np.testing.assert_allclose(parallel.pauses, serial.pauses)
+        np.testing.assert_allclose(parallel.breaks, serial.breaks)
+        self.assertAlmostEqual(parallel.avg_loudness, serial.avg_loudness, places=4)
+        self.assertAlmostEqual(parallel.avg_energy, serial.avg_energy, places=6)
+        self.assertAlmostEqual(parallel.speech_rate, serial.speech_rate)
+
+    def test_noise_suppression_matches_whole_signal_reference(self):
+        signal = (np.tile(self.test_signal, 3) * 0.1).astype(np.float32)
+        expected = BenchmarkSuite.legacy_noise_suppression(signal, self.sample_rate)
+        cleaned = self.processor.noise_suppression(signal, self.sample_rate, block_frames=17)
+        self.assertEqual(cleaned.shape, expected.shape)
+        np.testing.assert_allclose(cleaned, expected, atol=1e-5)
+
+    def test_timeline_matches_direct_windows(self):
+        signal = np.concatenate([self.test_signal * 0.1, np.zeros(self.sample_rate), self.test_signal * 0.1] * 2)
+        features = AudioFeatures(signal, self.sample_rate)
+        timeline = self.processor.analyse_timeline(signal, self.sample_rate, window=2.0, hop=0.5, features=features)
+
+        frame_rate = self.sample_rate / features.hop_length
+        pitches, mask = features.pitch_frames
+        loudness = librosa.amplitude_to_db(features.loudness_rms, ref=np.max)
+        self.assertGreater(len(timeline["start"]), 1)
+        for i, start in enumerate(timeline["start"]):
+            frames = slice(int(round(start * frame_rate)), int(round(start * frame_rate)) + int(round(2.0 * frame_rate)))
+            self.assertAlmostEqual(timeline["loudness"][i], np.mean(loudness[frames]), places=4)
+            self.assertAlmostEqual(timeline["energy"][i], np.mean(features.rms[frames]), places=6)
+            window_pitch = pitches[:, frames][mask[:, frames]]
+            self.assertAlmostEqual(timeline["pitch_variation"][i], np.std(window_pitch), places=3)
+        self.assertGreater(np.max(timeline["pause_density"]), 0)
+
+    def test_timeline_short_signal_has_one_window(self):
+        timeline = self.processor.analyse_timeline(self.test_signal, self.sample_rate, window=30.0, hop=10.0)
+        self.assertEqual(len(timeline["start"]), 1)
+        self.assertAlmostEqual(timeline["energy"][0], self.processor.analyse_vocal_energy(self.test_signal, self.sample_rate), places=6)
+
+    def test_load_audio_file_at_analysis_rate(self):
+        signal = BenchmarkSuite().synthetic_lecture(3.0, 44100)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "lecture.wav")
+            sf.write(path, signal, 44100)
+            y, sr = AudioProcessor.load_audio_file(path, analysis_rate=16000)
+        self.assertEqual(sr, 16000)
+        self.assertAlmostEqual(len(y), 3.0 * 16000, delta=186)
+        self.assertEqual(y.dtype, np.float32)
+        self.assertEqual(AudioFeatures.scaled_frames(44100), (2048, 512))
+        self.assertEqual(AudioFeatures.scaled_frames(16000), (744, 186))
+
+    def test_analysis_rate_metrics_stay_close(self):
+        row, = BenchmarkSuite(repeats=1).benchmark_analysis_rate(duration=10.0, analysis_rates=(16000,))
+        self.assertTrue(row["advice_matches"])
+        self.assertLess(row["avg_loudness_drift"], 2.0)
+        self.assertLess(row["avg_pitch_relative_drift"], 0.05)
+        self.assertEqual(row["pause_count_drift"], 0)
+
+    def test_settings_are_frozen_per_processor(self):
+        settings = {"loudness_threshold": -30.0}
+        processor = AudioProcessor(settings)
+        other = AudioProcessor()
+        settings["loudness_threshold"] = -10.0
+        processor.update_settings({"pause_duration": 1.0})
+        self.assertEqual(processor.settings["loudness_threshold"], -30.0)
+        self.assertNotIn("pause_duration", other.settings)
+        with self.assertRaises(TypeError):
+            processor.settings["pause_duration"] = 2.0
+
+    def test_concurrent_runs_use_their_own_settings(self):
+        signal = np.concatenate([self.test_signal * 0.1, np.zeros(self.sample_rate // 2)] * 4)
+        configurations = [
+            {"loudness_threshold": threshold, "pause_duration": pause, "pause_threshold_value": 0.01}
+            for threshold in (-40.0, -25.0, -5.0) for pause in (0.2, 0.4, 1.0)
+        ]
+        expected = [self.processor.give_audio_feedback(signal, self.sample_rate, settings=config) for config in configurations]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda config: self.processor.give_audio_feedback(signal, self.sample_rate, settings=config),
+                configurations * 2,
+            ))
+        for result, reference in zip(results, expected * 2):
+            self.assertEqual(result.to_dict(intervals=True), reference.to_dict(intervals=True))
+        self.assertEqual(len({(result.loudness_level, result.pause_count) for result in expected}), 6)
+        self.assertEqual(self.processor.settings, {})
+
+    def test_batch_features_match_per_clip(self):
+        clips = [self.test_signal[:length] * 0.1 for length in (4000, 22050, 9000)]
+        for clip, features in zip(clips, AudioFeatures.batch(clips, self.sample_rate)):
+            reference = AudioFeatures(clip, self.sample_rate)
+            np.testing.assert_allclose(features.rms, reference.rms, atol=1e-6)
+            np.testing.assert_array_equal(features.zcr, reference.zcr)
+            np.testing.assert_allclose(features.magnitude, reference.magnitude, atol=1e-4)
+            np.testing.assert_allclose(features.pitch_values, reference.pitch_values, rtol=1e-4)
+
+    def test_batch_feedback_matches_loop_in_input_order(self):
+        clips = [self.test_signal[:length] * scale for length, scale in ((22050, 0.1), (3000, 0.01), (12000, 0.5))]
+        results = self.processor.give_batch_audio_feedback(clips, self.sample_rate, max_frames=40)
+        for clip, result in zip(clips, results):
+            reference = self.processor.give_audio_feedback(clip, self.sample_rate)
+            self.assertAlmostEqual(result.duration, reference.duration)
+            self.assertAlmostEqual(result.avg_loudness, reference.avg_loudness, places=3)
+            self.assertEqual(result.advice, reference.advice)
+
 if __name__ == "__main__":
     unittest.main()
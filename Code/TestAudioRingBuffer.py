@@ -0,0 +1,87 @@
+import unittest
+from types import SimpleNamespace
+import numpy as np
+from AudioRingBuffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_reads_match_written_samples_across_wraps(self):
+        ring = AudioRingBuffer(1000)
+        written = []
+        for frames in (300, 512, 1, 700, 999, 1500, 64):
+            block = self.rng.standard_normal((frames, 1)).astype(np.float32)
+            self.assertEqual(ring.write(block), (len(written), len(written) + frames))
+            written.extend(block.ravel())
+
+            expected = np.array(written, dtype=np.float32)
+            np.testing.assert_array_equal(ring.read(), expected[-1000:])
+            start = ring.oldest + 10
+            np.testing.assert_array_equal(ring.read(start, start + 200), expected[start:start + 200])
+        self.assertEqual(len(ring), 1000)
+
+    def test_contiguous_reads_are_views(self):
+        ring = AudioRingBuffer(100)
+        ring.write(np.ones(60, dtype=np.float32))
+        self.assertTrue(np.shares_memory(ring.read(10, 50), ring.samples))
+        ring.write(np.ones(60, dtype=np.float32))
+        self.assertFalse(np.shares_memory(ring.read(), ring.samples))
+
+    def test_holds_reports_views_overwritten_after_read(self):
+        ring = AudioRingBuffer(100)
+        ring.write(np.ones(60, dtype=np.float32))
+        view = ring.read(10, 50)
+        ring.write(np.zeros(50, dtype=np.float32))
+        self.assertTrue(ring.holds(10) and np.all(view == 1.0))
+        ring.write(np.zeros(1, dtype=np.float32))
+        self.assertFalse(ring.holds(10))
+        self.assertEqual(view[0], 0.0)
+
+    def test_overwritten_or_unwritten_ranges_raise(self):
+        ring = AudioRingBuffer(100)
+        ring.write(np.zeros(250, dtype=np.float32))
+        with self.assertRaises(IndexError):
+            ring.read(100, 200)
+        with self.assertRaises(IndexError):
+            ring.read(200, 260)
+
+    def test_analysis_thread_reads_chunks_by_index(self):
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}))
+        analyser.audio_buffer = AudioRingBuffer(44100 * 3)
+        received = []
+        analyser.analyse_chunk = lambda chunk, live_worker=None, start=None, analysis_queue=None: received.append(chunk)
+
+        for _ in range(4):
+            analyser.analysis_queue.put(analyser.audio_buffer.write(self.rng.standard_normal((44100, 1))))
+        analyser.stop_recording()
+        analyser.process_audio()
+
+        self.assertEqual(len(received), 3)
+        self.assertTrue(all(np.shares_memory(chunk, analyser.audio_buffer.samples) for chunk in received))
+
+    def test_analysis_thread_keeps_its_own_worker(self):
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}))
+        ring = AudioRingBuffer(44100 * 2)
+        recording_worker = SimpleNamespace(closed=False)
+        recording_worker.close = lambda: setattr(recording_worker, "closed", True)
+        analyser.live_worker = SimpleNamespace(close=lambda: None)
+        workers = []
+        analyser.analyse_chunk = lambda chunk, live_worker=None, start=None, analysis_queue=None: workers.append(live_worker)
+
+        analysis_queue = analyser.analysis_queue
+        analysis_queue.put(ring.write(self.rng.standard_normal(44100)))
+        analysis_queue.put(analyser.STOP)
+        analyser.process_audio(analysis_queue, ring, recording_worker)
+
+        self.assertEqual(workers, [recording_worker])
+        self.assertTrue(recording_worker.closed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import soundfile as sf
+from BatchAnalyser import BatchAnalyser
+
+
+class TestBatchAnalyser(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.input_dir = os.path.join(self.folder.name, "semester")
+        os.makedirs(os.path.join(self.input_dir, "week2"))
+        rng = np.random.default_rng(0)
+        for name in ("week1.wav", os.path.join("week2", "lecture.wav")):
+            sf.write(os.path.join(self.input_dir, name), rng.standard_normal(22050).astype(np.float32) * 0.1, 22050)
+        open(os.path.join(self.input_dir, "notes.txt"), "w").close()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_find_audio_files(self):
+        files = BatchAnalyser.find_audio_files([self.input_dir])
+        self.assertEqual([os.path.basename(path) for path in files], ["week1.wav", "lecture.wav"])
+
+    def test_run_writes_results(self):
+        output_dir = os.path.join(self.folder.name, "results")
+        summary = BatchAnalyser(output_dir, workers=2).run([self.input_dir])
+
+        self.assertEqual(summary["files"], 2)
+        self.assertEqual(summary["failed"], 0)
+        self.assertGreater(summary["audio_hours_per_wall_hour"], 0)
+
+        with open(os.path.join(output_dir, "results.csv")) as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 2)
+
+        with open(BatchAnalyser(output_dir).result_path(rows[0]["file"], ".json")) as file:
+            result = json.load(file)
+        self.assertIn("Advice:", result["report"])
+        self.assertEqual(result["engagement_score"], float(rows[0]["engagement_score"]))
+
+    def test_result_paths_stay_in_output_dir(self):
+        output_dir = os.path.join(self.folder.name, "results")
+        analyser = BatchAnalyser(output_dir)
+        paths = [analyser.result_path(os.path.join(self.input_dir, folder, "lecture.wav"), ".json") for folder in ("", "week2")]
+
+        self.assertNotEqual(paths[0], paths[1])
+        for path in paths:
+            self.assertEqual(os.path.dirname(path), output_dir)
+            self.assertTrue(os.path.basename(path).startswith("lecture_"))
+
+
+if __name__ == "__main__":
+    unittest.main()
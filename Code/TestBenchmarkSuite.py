@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from BenchmarkSuite import BenchmarkSuite, main
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = BenchmarkSuite(repeats=1)
+
+    def test_synthetic_lecture_has_speech_and_silence(self):
+        y = self.suite.synthetic_lecture(10.0, 16000)
+        self.assertEqual(len(y), 160000)
+        self.assertEqual(y.dtype, np.float32)
+        frames = np.abs(y[:len(y) // 160 * 160]).reshape(-1, 160).max(axis=1)
+        self.assertTrue(np.any(frames > 0.1))
+        self.assertTrue(np.any(frames < 0.1))
+
+    def test_benchmark_analysis_times_every_function(self):
+        results = self.suite.benchmark_analysis(durations=(2.0,), sample_rates=(16000,))
+        functions = {row["function"] for row in results}
+        self.assertTrue(set(BenchmarkSuite.ANALYSES) <= functions)
+        self.assertTrue({"noise_suppression", "load_audio_file", "give_audio_feedback"} <= functions)
+        self.assertTrue(all(row["seconds"] > 0 for row in results))
+
+    def test_compare_matches_rows(self):
+        baseline = [{"benchmark": "analysis", "function": "analyse_pitch", "sample_rate": 16000, "audio_seconds": 2.0, "seconds": 0.5}]
+        current = [dict(baseline[0], seconds=1.0)]
+        comparison = BenchmarkSuite.compare(baseline, current)
+        self.assertEqual(len(comparison), 1)
+        self.assertAlmostEqual(comparison[0]["ratio"], 2.0)
+
+    def test_analysis_core_import_is_gui_free(self):
+        result, = self.suite.benchmark_import_time({"AudioProcessor": "import AudioProcessor"})
+        self.assertNotIn("error", result)
+        self.assertEqual(result["heavy_modules"], [])
+
+    def test_realtime_consumer_sleeps_while_idle(self):
+        blocking, polling = self.suite.benchmark_realtime_consumer(idle_seconds=0.5)
+        self.assertEqual(blocking["function"], "process_audio")
+        self.assertLess(blocking["cpu_fraction"], 0.1)
+        self.assertEqual(polling["function"], "legacy_busy_loop")
+        self.assertGreater(polling["cpu_fraction"], 0.5)
+
+    def test_bounded_queue_limits_backlog(self):
+        legacy, drop_oldest, coalesce, block = self.suite.benchmark_realtime_backpressure(duration=12.0, sr=22050, realtime_factor=400.0)
+        self.assertEqual(legacy["consumer"], "legacy_busy_consumer")
+        self.assertEqual(legacy["analysed"], legacy["chunks"])
+        self.assertGreater(legacy["max_depth"], 3)
+        self.assertEqual(drop_oldest["analysed"] + drop_oldest["dropped"], drop_oldest["chunks"])
+        self.assertEqual(coalesce["dropped"], 0)
+        self.assertEqual(block["analysed"], block["chunks"])
+        for row in (drop_oldest, coalesce, block):
+            self.assertLessEqual(row["max_depth"], 3)
+
+    def test_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as folder:
+            output = os.path.join(folder, "bench.json")
+            main(["pause_detection", "-r", "1", "-o", output])
+            with open(output) as file:
+                report = json.load(file)
+        self.assertIn("commit", report["metadata"])
+        self.assertTrue(all(row["benchmark"] == "pause_detection" for row in report["results"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+import soundfile as sf
+from AudioProcessor import AudioProcessor
+from FeatureCache import FeatureCache
+
+
+class TestFeatureCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.cache = FeatureCache(cache_dir=os.path.join(self.folder.name, "cache"))
+        self.sample_rate = 22050
+        self.audio_path = os.path.join(self.folder.name, "lecture.wav")
+        signal = np.random.default_rng(0).standard_normal(self.sample_rate * 2).astype(np.float32) * 0.1
+        sf.write(self.audio_path, signal, self.sample_rate)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_store_and_load(self):
+        key = self.cache.key(self.audio_path, "features", sr=self.sample_rate)
+        self.assertIsNone(self.cache.load(key))
+        self.cache.store(key, {"rms": np.arange(5.0), "duration": 2.0})
+        arrays = self.cache.load(key)
+        np.testing.assert_array_equal(arrays["rms"], np.arange(5.0))
+        self.assertEqual(float(arrays["duration"]), 2.0)
+
+    def test_key_depends_on_parameters(self):
+        first = self.cache.key(self.audio_path, "pcm", noise_suppression_factor=0.15)
+        second = self.cache.key(self.audio_path, "pcm", noise_suppression_factor=0.3)
+        self.assertNotEqual(first, second)
+
+    def test_evicts_least_recently_used(self):
+        payload = {"data": np.random.default_rng(1).standard_normal(40000)}
+        self.cache.store("old", payload)
+        time.sleep(0.01)
+        self.cache.store("new", payload)
+        time.sleep(0.01)
+        self.cache.load("old")
+        self.cache.max_bytes = os.path.getsize(self.cache.path_for("old")) + 1
+        self.cache.evict()
+        self.assertTrue(os.path.exists(self.cache.path_for("old")))
+        self.assertFalse(os.path.exists(self.cache.path_for("new")))
+
+    def test_repeat_analysis_hits_cache(self):
+        processor = AudioProcessor()
+        y, sr = processor.load_audio_file(self.audio_path, cache=self.cache)
+        first = processor.give_cached_audio_feedback(self.audio_path, y, sr, self.cache)
+        self.assertEqual(len(os.listdir(self.cache.cache_dir)), 2)
+
+        cached_y, cached_sr = processor.load_audio_file(self.audio_path, cache=self.cache)
+        np.testing.assert_array_equal(cached_y, y)
+        second = processor.give_cached_audio_feedback(self.audio_path, cached_y, cached_sr, self.cache)
+        self.assertEqual(first.to_dict(intervals=True), second.to_dict(intervals=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import importlib.util
+import unittest
+import numpy as np
+import librosa
+from AudioFeatures import AudioFeatures
+from FrameKernels import FrameKernels
+
+
+class TestFrameKernels(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.signal = (rng.standard_normal(20000) * 0.1).astype(np.float32)
+        self.signal[::7] = 0.0
+        self.signal[::11] = np.float32(1e-10)
+        self.starts = FrameKernels.frame_starts(len(self.signal), 2048, 512)
+        self.rms = np.abs(rng.normal(0.05, 0.03, 5001)).astype(np.float32)
+        self.pitches = rng.uniform(0, 1000, 3000).astype(np.float32)
+
+    def calls(self):
+        return {
+            "frame_rms": (self.signal, self.starts, 2048),
+            "frame_zcr": (self.signal, self.starts, 2048),
+            "silent_runs": (self.rms, np.float32(0.02)),
+            "band_values": (self.pitches, 50, 500),
+        }
+
+    def assert_identical(self, result, expected):
+        for got, want in zip(result if isinstance(result, tuple) else (result,), expected if isinstance(expected, tuple) else (expected,)):
+            self.assertEqual(got.dtype, want.dtype)
+            np.testing.assert_array_equal(got, want)
+
+    def test_loops_match_numpy(self):
+        for name, args in self.calls().items():
+            loop_args = args + (np.float32(FrameKernels.ZERO_THRESHOLD),) if name == "frame_zcr" else args
+            with self.subTest(kernel=name):
+                self.assert_identical(getattr(FrameKernels, f"loop_{name}")(*loop_args), getattr(FrameKernels, f"numpy_{name}")(*args))
+
+    @unittest.skipIf(importlib.util.find_spec("numba") is None, "numba is not installed")
+    def test_compiled_kernels_match_numpy(self):
+        accelerated = FrameKernels.ACCELERATED
+        try:
+            for name, args in self.calls().items():
+                with self.subTest(kernel=name):
+                    FrameKernels.ACCELERATED = True
+                    compiled = getattr(FrameKernels, name)(*args)
+                    FrameKernels.ACCELERATED = False
+                    self.assert_identical(compiled, getattr(FrameKernels, name)(*args))
+        finally:
+            FrameKernels.ACCELERATED = accelerated
+
+    def test_features_match_librosa(self):
+        for center in (True, False):
+            features = AudioFeatures(self.signal, 22050, center=center)
+            expected_rms = librosa.feature.rms(y=self.signal, center=center)[0]
+            expected_zcr = librosa.feature.zero_crossing_rate(self.signal, center=center)[0]
+            np.testing.assert_allclose(features.rms, expected_rms, rtol=1e-5, atol=1e-7)
+            np.testing.assert_array_equal(features.zcr, expected_zcr)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from BenchmarkSuite import BenchmarkSuite
+from LiveAnalysisWorker import LiveAnalysisWorker
+
+
+class TestLiveAnalysisWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 22050
+        self.signal = BenchmarkSuite().synthetic_lecture(6.0, self.sample_rate).astype(np.float32)
+        LiveAnalysisWorker.start_session({}, self.sample_rate, None)
+
+    def tearDown(self):
+        LiveAnalysisWorker.state = None
+
+    def test_dropped_chunks_are_recorded_as_gaps(self):
+        second = self.sample_rate
+        for start in (0, second, 4 * second, 5 * second):
+            result = LiveAnalysisWorker.analyse_in_worker(self.signal[start:start + second], start, 0.0, True, None)
+
+        session = LiveAnalysisWorker.state["session"]
+        self.assertAlmostEqual(result["skipped_seconds"], 2.0)
+        self.assertAlmostEqual(session.report().duration, 6.0)
+        self.assertEqual(LiveAnalysisWorker.state["next_start"], 6 * second)
+
+    def test_analyse_passes_sample_offsets_to_the_worker(self):
+        second = self.sample_rate
+        worker = LiveAnalysisWorker({}, self.sample_rate)
+        try:
+            for start in (0, second, 2 * second, 3 * second):
+                result = worker.analyse(self.signal[start:start + second], 0.0, True, start=start)
+            self.assertEqual(result["skipped_seconds"], 0.0)
+
+            result = worker.analyse(self.signal[5 * second:6 * second], 0.0, True, start=5 * second)
+            self.assertAlmostEqual(result["skipped_seconds"], 1.0)
+        finally:
+            worker.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from PauseDetector import PauseDetector
+from BenchmarkSuite import BenchmarkSuite
+
+
+class TestPauseDetector(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = BenchmarkSuite(seed=1)
+        self.rms = self.suite.synthetic_rms(20000)
+        self.times = np.arange(len(self.rms)) * 512 / 22050
+
+    def test_find_runs(self):
+        starts, stops = PauseDetector.find_runs(np.array([1, 1, 0, 0, 1, 0, 1, 1], dtype=bool))
+        np.testing.assert_array_equal(starts, [0, 4, 6])
+        np.testing.assert_array_equal(stops, [2, 5, 8])
+
+    def test_matches_legacy_loop(self):
+        pauses, breaks = PauseDetector.detect(self.rms < 0.001, self.times, 10, 200)
+        legacy_pauses, legacy_breaks = self.suite.legacy_pause_loop(self.rms, self.times, 0.001, 10, 200)
+        np.testing.assert_allclose(pauses, np.array(legacy_pauses).reshape(-1, 3))
+        np.testing.assert_allclose(breaks, np.array(legacy_breaks).reshape(-1, 3))
+
+    def test_trailing_silence_ends_at_last_frame(self):
+        mask = np.array([False, True, True, True])
+        pauses, breaks = PauseDetector.detect(mask, np.arange(4.0), 1.0, 10.0, measure="seconds")
+        np.testing.assert_allclose(pauses, [[1.0, 3.0, 2.0]])
+        self.assertEqual(len(breaks), 0)
+
+    def test_empty_mask(self):
+        pauses, breaks = PauseDetector.detect(np.zeros(0, dtype=bool), np.zeros(0), 1, 2)
+        self.assertEqual(pauses.shape, (0, 3))
+        self.assertEqual(breaks.shape, (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+import numpy as np
+from AudioFeatures import AudioFeatures
+from BenchmarkSuite import BenchmarkSuite
+from PitchTracker import PitchTracker
+
+
+class TestPitchTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 22050
+        self.signal, self.f0 = BenchmarkSuite.synthetic_voiced(3.0, self.sample_rate)
+
+    def test_yin_tracks_gliding_fundamental(self):
+        values = AudioFeatures(self.signal, self.sample_rate, pitch_engine="yin").pitch_values
+        self.assertAlmostEqual(float(np.mean(values)), float(np.mean(self.f0)), delta=2.0)
+        self.assertTrue(np.all((values >= PitchTracker.SPEECH_FMIN) & (values <= PitchTracker.SPEECH_FMAX)))
+
+    def test_yin_ignores_silence(self):
+        silence = np.zeros(self.sample_rate, dtype=np.float32)
+        voiced = AudioFeatures(self.signal, self.sample_rate, pitch_engine="yin").pitch_values
+        values = AudioFeatures(np.concatenate([self.signal, silence]), self.sample_rate, pitch_engine="yin").pitch_values
+        self.assertLessEqual(len(values), len(voiced) + 4)
+
+    def test_gated_yin_only_tracks_voiced_spans(self):
+        signal = BenchmarkSuite().synthetic_lecture(20.0, self.sample_rate, silence=8.0).astype(np.float32)
+        ungated = AudioFeatures(signal, self.sample_rate, pitch_engine="yin")
+        gated = AudioFeatures(signal, self.sample_rate, pitch_engine="yin", voice_gate=True)
+        with mock.patch.object(PitchTracker, "yin_frames", wraps=PitchTracker.yin_frames) as yin_frames:
+            pitches, mask = gated.pitch_frames
+            tracked = [call.args[2] - call.args[1] for call in yin_frames.call_args_list]
+
+        voiced = gated.voiced[:pitches.shape[1]]
+        self.assertEqual(sum(tracked), np.sum(voiced))
+        self.assertLess(sum(tracked), 0.6 * pitches.shape[1])
+        np.testing.assert_array_equal(pitches[:, voiced], ungated.pitch_frames[0][:, voiced])
+        np.testing.assert_array_equal(mask, ungated.pitch_frames[1] & voiced)
+
+    def test_decimation_keeps_hop_aligned(self):
+        for sr in (16000, 22050, 44100, 48000):
+            factor = PitchTracker.decimation_factor(sr, 512)
+            self.assertEqual(512 % factor, 0)
+            self.assertGreaterEqual(sr / factor, PitchTracker.MIN_ANALYSIS_RATE)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            AudioFeatures(self.signal, self.sample_rate, pitch_engine="crepe").pitch_values
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import wave
+import numpy as np
+import soundfile as sf
+from AudioRingBuffer import AudioRingBuffer
+from RecordingWriter import RecordingWriter
+
+
+class TestRecordingWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.sr = 8000
+        self.folder = tempfile.TemporaryDirectory()
+        self.ring = AudioRingBuffer(self.sr)
+        self.writer = RecordingWriter(self.ring, self.sr, os.path.join(self.folder.name, "spill.wav"))
+        rng = np.random.default_rng(0)
+        self.blocks = [(rng.standard_normal((256, 1)) * 0.1).astype(np.float32) for _ in range(100)]
+        self.audio = np.concatenate(self.blocks).ravel()
+
+    def tearDown(self):
+        self.writer.stop()
+        self.folder.cleanup()
+
+    def capture(self, blocks):
+        for indata in blocks:
+            self.ring.write(indata)
+            if self.ring.written - self.writer.flushed >= self.sr // 2:
+                self.writer.write_pending()
+
+    def test_spill_file_is_valid_while_recording(self):
+        self.capture(self.blocks[:50])
+        self.writer.write_pending()
+        partial, sr = sf.read(self.writer.path, dtype="float32")
+        self.assertEqual(sr, self.sr)
+        np.testing.assert_array_equal(partial, self.audio[:50 * 256])
+
+        self.writer.start()
+        self.capture(self.blocks[50:])
+        self.writer.stop()
+        np.testing.assert_array_equal(self.writer.read(), self.audio)
+        self.assertEqual(self.writer.dropped_samples, 0)
+
+    def test_export_matches_in_memory_normalisation(self):
+        self.capture(self.blocks)
+        expected = ((self.audio / np.max(np.abs(self.audio))) * 32767).astype(np.int16)
+
+        path = os.path.join(self.folder.name, "download.wav")
+        self.writer.export(path)
+        with wave.open(path) as file:
+            self.assertEqual(file.getframerate(), self.sr)
+            np.testing.assert_array_equal(np.frombuffer(file.readframes(file.getnframes()), dtype=np.int16), expected)
+
+        path = os.path.join(self.folder.name, "download.flac")
+        self.writer.export(path)
+        np.testing.assert_array_equal(sf.read(path, dtype="int16")[0], expected)
+
+    def test_lagging_writer_keeps_timeline_with_silence(self):
+        for indata in self.blocks:
+            self.ring.write(indata)
+        self.writer.write_pending()
+        recording = self.writer.read()
+        lost = len(self.audio) - self.ring.capacity
+        self.assertEqual(self.writer.dropped_samples, lost)
+        self.assertEqual(len(recording), len(self.audio))
+        self.assertFalse(np.any(recording[:lost]))
+        np.testing.assert_array_equal(recording[lost:], self.audio[lost:])
+
+    def test_closing_analyser_deletes_temporary_spill_file(self):
+        from types import SimpleNamespace
+        from RealTimeAudioAnalyser import RealTimeAudioAnalyser
+
+        analyser = RealTimeAudioAnalyser(None, SimpleNamespace(settings={}))
+        analyser.recording_writer = RecordingWriter(self.ring, self.sr)
+        path = analyser.recording_writer.path
+        self.capture(self.blocks[:10])
+        self.assertTrue(os.path.exists(path))
+        analyser.close()
+        self.assertFalse(os.path.exists(path))
+        self.assertIsNone(analyser.recording_writer)
+
+if __name__ == "__main__":
+    unittest.main()
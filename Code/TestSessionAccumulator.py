@@ -0,0 +1,84 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+from AudioProcessor import AudioProcessor
+from BenchmarkSuite import BenchmarkSuite
+from RunningStats import RunningStats
+
+
+class TestSessionAccumulator(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 22050
+        signal = BenchmarkSuite().synthetic_lecture(40.0, self.sample_rate)
+        frames = (len(signal) - 2048) // 512
+        self.signal = signal[:2048 + 512 * frames].astype(np.float32)
+        self.processor = AudioProcessor({"pause_threshold_value": 0.02, "pause_duration": 0.3, "break_duration": 2.0})
+
+    def streamed_reference(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "lecture.wav")
+            sf.write(path, self.signal, self.sample_rate, subtype="FLOAT")
+            return self.processor.give_audio_feedback_from_file(path, noise_suppression_factor=0)
+
+    def test_session_matches_streamed_file(self):
+        session = self.processor.start_session(self.sample_rate)
+        chunk = int(0.37 * self.sample_rate)
+        for start in range(0, len(self.signal), chunk):
+            session.update(self.signal[start:start + chunk, np.newaxis])
+        result = session.report()
+        reference = self.streamed_reference()
+
+        self.assertGreater(reference.pause_count + len(reference.breaks), 0)
+        np.testing.assert_allclose(result.pauses, reference.pauses)
+        np.testing.assert_allclose(result.breaks, reference.breaks)
+        self.assertAlmostEqual(result.avg_loudness, reference.avg_loudness, delta=0.01)
+        self.assertAlmostEqual(result.speech_rate, reference.speech_rate)
+        self.assertAlmostEqual(result.avg_energy, reference.avg_energy, places=6)
+        self.assertAlmostEqual(result.duration, reference.duration)
+        self.assertEqual(result.advice, reference.advice)
+
+    def test_report_is_available_mid_session(self):
+        session = self.processor.start_session(self.sample_rate)
+        self.assertEqual(session.report().pause_count, 0)
+        session.update(self.signal[:self.sample_rate * 5])
+        early = session.report()
+        session.update(self.signal[self.sample_rate * 5:])
+        self.assertAlmostEqual(early.duration, 5.0)
+        self.assertGreater(session.report().duration, early.duration)
+
+    def test_skipped_audio_splits_pauses_and_keeps_timeline(self):
+        reference = self.streamed_reference()
+        gap_start, gap_stop = reference.pauses[len(reference.pauses) // 2][:2]
+        gap_start, gap_stop = int((gap_start + 0.1) * self.sample_rate), int((gap_stop - 0.05) * self.sample_rate)
+
+        session = self.processor.start_session(self.sample_rate)
+        session.update(self.signal[:gap_start])
+        session.skip(gap_stop - gap_start)
+        session.update(self.signal[gap_stop:])
+        result = session.report()
+
+        self.assertAlmostEqual(result.duration, reference.duration)
+        self.assertAlmostEqual(session.skipped_duration, (gap_stop - gap_start) / self.sample_rate)
+        intervals = np.concatenate((result.pauses, result.breaks))
+        self.assertFalse(np.any((intervals[:, 0] < gap_start / self.sample_rate) & (intervals[:, 1] > gap_stop / self.sample_rate)))
+        hop = 512 / self.sample_rate
+        later = reference.pauses[reference.pauses[:, 0] > gap_stop / self.sample_rate + 0.2]
+        self.assertGreater(len(later), 0)
+        np.testing.assert_allclose(result.pauses[-len(later):, :2], later[:, :2], atol=hop)
+
+    def test_running_stats_merge(self):
+        values = np.random.default_rng(1).normal(200.0, 30.0, 1000)
+        left, right = RunningStats(), RunningStats()
+        for part in np.array_split(values[:600], 7):
+            left.update(part)
+        right.update(values[600:])
+        left.merge(right)
+        self.assertEqual(left.count, len(values))
+        self.assertAlmostEqual(left.mean, np.mean(values))
+        self.assertAlmostEqual(left.std, np.std(values))
+
+if __name__ == "__main__":
+    unittest.main()
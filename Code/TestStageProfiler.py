@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from AudioProcessor import AudioProcessor
+from BenchmarkSuite import BenchmarkSuite
+from StageProfiler import StageProfiler
+
+
+class TestStageProfiler(unittest.TestCase):
+
+    def test_nested_stages(self):
+        profiler = StageProfiler()
+        with profiler.stage("outer"):
+            with profiler.stage("inner", graph="Waveform"):
+                sum(range(10000))
+
+        inner, outer = profiler.records
+        self.assertEqual(inner["parent"], "outer")
+        self.assertEqual(inner["graph"], "Waveform")
+        self.assertEqual(outer["depth"], 0)
+        self.assertGreaterEqual(outer["wall_seconds"], inner["wall_seconds"])
+
+    def test_peak_memory(self):
+        profiler = StageProfiler()
+        with profiler.stage("outer"):
+            with profiler.stage("allocate"):
+                buffer = np.ones(4 * 1024 * 1024 // 8)
+                del buffer
+            with profiler.stage("small"):
+                pass
+
+        records = {record["name"]: record for record in profiler.records}
+        self.assertGreaterEqual(records["allocate"]["peak_mb"], 3.9)
+        self.assertLess(records["small"]["peak_mb"], 1.0)
+        self.assertGreaterEqual(records["outer"]["peak_mb"], records["allocate"]["peak_mb"])
+
+    def test_maybe_without_profiler(self):
+        with StageProfiler.maybe(None, "anything"):
+            pass
+
+    def test_trace_file_written_after_outermost_stage(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "trace.json")
+            processor = AudioProcessor()
+            processor.profiler = StageProfiler(trace_path=path)
+            signal = np.random.default_rng(0).standard_normal(22050) * 0.1
+            processor.analyse_all(signal, 22050)
+
+            with open(path) as file:
+                trace = json.load(file)
+
+        for name in BenchmarkSuite.ANALYSES + ("advice",):
+            self.assertEqual(trace["summary"][name]["count"], 1)
+
+    def test_feedback_run_writes_trace_once(self):
+        processor = AudioProcessor()
+        processor.profiler = StageProfiler(trace_path=os.path.join(tempfile.gettempdir(), "unused_trace.json"))
+        signal = np.random.default_rng(0).standard_normal(22050) * 0.1
+        with mock.patch.object(StageProfiler, "dump") as dump:
+            processor.give_audio_feedback(signal, 22050)
+
+        dump.assert_called_once()
+        records = {record["name"]: record for record in processor.profiler.records}
+        self.assertEqual(records["audio_feedback"]["depth"], 0)
+        self.assertEqual(records["analyse_all"]["parent"], "audio_feedback")
+        for name in BenchmarkSuite.ANALYSES:
+            self.assertEqual(records[name]["parent"], "analyse_all")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import librosa
+import numpy as np
+from AudioProcessor import AudioProcessor
+from BenchmarkSuite import BenchmarkSuite
+
+
+class TestStreamingFeatures(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 22050
+        self.signal = BenchmarkSuite().synthetic_lecture(12.0, self.sample_rate).astype(np.float32)
+        self.processor = AudioProcessor({})
+
+    def stream_chunks(self, stream, chunk):
+        emitted = []
+        for start in range(0, len(self.signal), chunk):
+            features = stream.update(self.signal[start:start + chunk])
+            if features is not None:
+                emitted.append(features)
+        return emitted
+
+    def test_chunked_frames_match_whole_signal(self):
+        stream = self.processor.start_stream(self.sample_rate, window_seconds=0.0)
+        emitted = self.stream_chunks(stream, int(0.37 * self.sample_rate))
+        whole = self.processor.build_features(self.signal, self.sample_rate, center=False)
+
+        self.assertEqual(stream.frames, len(whole.rms))
+        np.testing.assert_allclose(np.concatenate([f.rms for f in emitted]), whole.rms, rtol=1e-5, atol=1e-7)
+        np.testing.assert_allclose(np.concatenate([f.zcr for f in emitted]), whole.zcr)
+        self.assertEqual(len(stream.rms), 0)
+
+    def test_window_metrics_match_recent_frames(self):
+        stream = self.processor.start_stream(self.sample_rate, window_seconds=3.0)
+        emitted = self.stream_chunks(stream, self.sample_rate)
+        self.assertEqual(len(stream.rms), stream.window_frames)
+        self.assertAlmostEqual(stream.window_duration, 3.0, delta=0.03)
+
+        rms = np.concatenate([f.rms for f in emitted])[-stream.window_frames:]
+        zcr = np.concatenate([f.zcr for f in emitted])[-stream.window_frames:]
+        loudness_rms = np.concatenate([f.loudness_rms for f in emitted])[-stream.window_frames:]
+        metrics = stream.metrics()
+        self.assertAlmostEqual(metrics["energy"], float(np.mean(rms)), places=6)
+        self.assertAlmostEqual(metrics["loudness"], float(np.mean(librosa.amplitude_to_db(loudness_rms, ref=np.max))), places=4)
+        speech_frames = np.sum(zcr > np.mean(zcr) + 0.005)
+        self.assertAlmostEqual(metrics["speech_rate"], speech_frames / stream.window_duration)
+        self.assertIsInstance(stream.feedback(), str)
+
+    def test_restart_drops_carried_samples(self):
+        stream = self.processor.start_stream(self.sample_rate, window_seconds=0.0)
+        stream.update(self.signal[:10000])
+        stream.restart()
+        features = stream.update(self.signal[20000:40000])
+        reference = self.processor.build_features(self.signal[20000:40000], self.sample_rate, center=False)
+        np.testing.assert_array_equal(features.zcr, reference.zcr)
+        np.testing.assert_allclose(features.rms, reference.rms, rtol=1e-5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+from AudioFeatures import AudioFeatures
+from AudioProcessor import AudioProcessor
+from BenchmarkSuite import BenchmarkSuite
+from VoiceActivityDetector import VoiceActivityDetector
+
+
+class TestVoiceActivityDetector(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 22050
+        self.signal = BenchmarkSuite().synthetic_lecture(30.0, self.sample_rate, silence=6.0)
+
+    def test_marks_voiced_segments_only(self):
+        features = AudioFeatures(self.signal, self.sample_rate)
+        active = VoiceActivityDetector.detect(features.rms, features.zcr, self.sample_rate, features.hop_length)
+        segment_of = (features.times % 10.0) < 4.0
+        self.assertGreater(np.mean(active[segment_of]), 0.95)
+        self.assertLess(np.mean(active[~segment_of]), 0.1)
+
+    def test_steady_signal_stays_active(self):
+        tone, _ = BenchmarkSuite.synthetic_voiced(3.0, self.sample_rate, 150.0, 150.0)
+        features = AudioFeatures(tone, self.sample_rate)
+        self.assertTrue(np.all(VoiceActivityDetector.detect(features.rms, features.zcr, self.sample_rate, 512)))
+
+    def test_gated_spectrum_matches_full_spectrum(self):
+        features = AudioFeatures(self.signal, self.sample_rate, voice_gate=True)
+        np.testing.assert_allclose(features.voiced_magnitude, features.magnitude[:, features.voiced], rtol=1e-4, atol=1e-3)
+        pitches, mask = features.pitch_frames
+        self.assertEqual(pitches.shape[1], len(features.rms))
+        self.assertFalse(np.any(mask[:, ~features.voiced]))
+
+    def test_gated_speech_rate_ignores_noise(self):
+        gated = AudioProcessor({"voice_gate": 1.0})
+        silence = np.random.default_rng(0).normal(0.0, 0.01, self.sample_rate * 20).astype(np.float32)
+        padded = np.concatenate([self.signal, silence])
+        self.assertAlmostEqual(
+            gated.analyse_speech_rate(padded, self.sample_rate) * 50.0,
+            gated.analyse_speech_rate(self.signal, self.sample_rate) * 30.0,
+            delta=0.05 * gated.analyse_speech_rate(self.signal, self.sample_rate) * 30.0,
+        )
+
+if __name__ == "__main__":
+    unittest.main()
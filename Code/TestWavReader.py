@@ -0,0 +1,83 @@
+import unittest
+import os
+import pickle
+import tempfile
+import numpy as np
+import soundfile as sf
+import librosa
+from AudioProcessor import AudioProcessor
+from WavReader import WavReader
+
+
+class TestWavReader(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.sample_rate = 16000
+        rng = np.random.default_rng(0)
+        self.signal = (rng.standard_normal((self.sample_rate * 3, 2)) * 0.1).astype(np.float32)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, name, subtype, signal=None):
+        path = os.path.join(self.folder.name, name)
+        sf.write(path, self.signal if signal is None else signal, self.sample_rate, subtype=subtype)
+        return path
+
+    def test_decodes_like_soundfile(self):
+        for subtype in ("PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"):
+            path = self.write(f"{subtype}.wav", subtype)
+            reader = WavReader(path)
+            expected, _ = sf.read(path, dtype="float32")
+            self.assertEqual((reader.sr, reader.channels, len(reader)), (self.sample_rate, 2, len(expected)))
+            np.testing.assert_allclose(reader.read(100, 5000), expected[100:5000].mean(axis=1), atol=1e-6, err_msg=subtype)
+
+    def test_chunks_are_views_of_the_mapping(self):
+        reader = WavReader(self.write("lecture.wav", "PCM_16"))
+        chunks, sr = AudioProcessor.load_audio_in_chunks(reader.path, chunk_size=0.7, raw=True)
+        self.assertEqual(sr, self.sample_rate)
+        self.assertEqual(sum(len(chunk) for chunk in chunks), len(reader))
+        self.assertTrue(all(np.shares_memory(chunk, chunks[0].base) for chunk in chunks))
+        self.assertEqual(chunks[0].dtype, np.int16)
+
+    def test_chunks_are_mono_float32_like_decoded_files(self):
+        path = self.write("lecture.wav", "PCM_16")
+        chunks, sr = AudioProcessor.load_audio_in_chunks(path, chunk_size=0.7)
+        expected, _ = AudioProcessor.load_audio_in_chunks(librosa.load(path, sr=None)[0], chunk_size=0.7, sr=sr)
+        self.assertEqual([(chunk.dtype, chunk.ndim) for chunk in chunks], [(np.dtype(np.float32), 1)] * len(expected))
+        for chunk, reference in zip(chunks, expected):
+            np.testing.assert_allclose(chunk, reference, atol=1e-6)
+
+        resampled, sr = AudioProcessor.load_audio_in_chunks(WavReader(path), chunk_size=0.7, sr=16000)
+        self.assertEqual(sr, 16000)
+        self.assertEqual((resampled[0].dtype, resampled[0].ndim), (np.dtype(np.float32), 1))
+
+    def test_stream_matches_librosa_blocks(self):
+        path = self.write("lecture.wav", "PCM_16")
+        blocks = list(WavReader(path).stream(5, frame_length=1024, hop_length=256))
+        expected = list(librosa.stream(path, block_length=5, frame_length=1024, hop_length=256, mono=True, dtype=np.float32))
+        self.assertEqual([len(block) for block in blocks], [len(block) for block in expected])
+        for block, reference in zip(blocks, expected):
+            np.testing.assert_allclose(block, reference, atol=1e-6)
+
+    def test_feedback_from_reader_matches_decoded_signal(self):
+        reader = WavReader(self.write("lecture.wav", "PCM_16"))
+        self.assertLess(len(pickle.dumps(reader)), 1024)
+        processor = AudioProcessor()
+        streamed = processor.give_audio_feedback(reader, None, workers=1)
+        parallel = processor.give_audio_feedback(reader, None, workers=2, chunk_size=1.0)
+        in_memory = processor.give_audio_feedback(reader.read(), self.sample_rate)
+        self.assertAlmostEqual(streamed.avg_loudness, in_memory.avg_loudness, delta=0.5)
+        self.assertAlmostEqual(parallel.avg_loudness, in_memory.avg_loudness, delta=0.5)
+        self.assertAlmostEqual(parallel.duration, reader.duration)
+
+    def test_rejects_compressed_files(self):
+        path = os.path.join(self.folder.name, "lecture.flac")
+        sf.write(path, self.signal, self.sample_rate)
+        self.assertIsNone(AudioProcessor.open_wav(path))
+        with self.assertRaises(ValueError):
+            WavReader(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import numpy as np
+
+
+class VoiceActivityDetector:
+    """
+    Cheap energy/ZCR voice-activity detection on the shared RMS and ZCR envelopes.
+
+    The noise floor is taken as the `NOISE_PERCENTILE` of the frame levels. A frame is
+    active if it is `MARGIN_DB` above that floor, or `WEAK_MARGIN_DB` above it with a
+    zero-crossing rate above `FRICATIVE_ZCR_HZ` (unvoiced consonants are quiet but
+    noisy). The floor is kept between `RANGE_DB` and `2 * MARGIN_DB` below the loudest
+    frame, so signals without pauses (or at a steady level) stay active. The
+    mask is then widened by `HANGOVER` seconds on both sides to keep onsets and tails.
+    """
+
+    NOISE_PERCENTILE = 10.0
+    MARGIN_DB = 6.0
+    WEAK_MARGIN_DB = 3.0
+    RANGE_DB = 60.0
+    FRICATIVE_ZCR_HZ = 3000.0
+    HANGOVER = 0.1
+    MIN_AMPLITUDE = 1e-5
+
+    @staticmethod
+    def detect(rms, zcr, sr, hop_length):
+        """
+        Mark the frames that contain speech.
+
+        Parameters:
+        - rms (np.ndarray): Frame-level RMS envelope.
+        - zcr (np.ndarray): Frame-level zero-crossing rate envelope (crossings per sample).
+        - sr (int): Sampling rate of the audio.
+        - hop_length (int): Hop size of the envelopes in samples.
+
+        Returns:
+        - np.ndarray: Boolean mask of active frames.
+        """
+        rms = np.asarray(rms)
+        if len(rms) == 0 or np.max(rms) <= 0:
+            return np.zeros(len(rms), dtype=bool)
+
+        db = 20.0 * np.log10(np.maximum(rms, VoiceActivityDetector.MIN_AMPLITUDE))
+        peak = np.max(db)
+        floor = np.clip(
+            np.percentile(db, VoiceActivityDetector.NOISE_PERCENTILE),
+            peak - VoiceActivityDetector.RANGE_DB, peak - 2 * VoiceActivityDetector.MARGIN_DB,
+        )
+
+        strong = db > floor + VoiceActivityDetector.MARGIN_DB
+        weak = (db > floor + VoiceActivityDetector.WEAK_MARGIN_DB) & (np.asarray(zcr) * sr > VoiceActivityDetector.FRICATIVE_ZCR_HZ)
+
+        hangover = int(np.ceil(VoiceActivityDetector.HANGOVER * sr / hop_length))
+        return VoiceActivityDetector.widen(strong | weak, hangover)
+
+
+    @staticmethod
+    def widen(mask, frames):
+        """
+        Extend every active run of `mask` by `frames` frames on both sides.
+        """
+        if frames <= 0 or not np.any(mask):
+            return mask
+        counts = np.convolve(mask.astype(np.int32), np.ones(2 * frames + 1, dtype=np.int32), mode="same")
+        return counts > 0
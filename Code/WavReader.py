@@ -0,0 +1,216 @@
+import os
+import struct
+import numpy as np
+
+
+class WavReader:
+    """
+    Memory-mapped reader for uncompressed WAV files.
+
+    The PCM data region is mapped with `np.memmap`, so opening a recording of any size
+    reads only its header. `view` and `chunks` return zero-copy views of the raw samples
+    with shape (frames, channels), and samples are converted to mono float32 (the
+    layout `librosa.load` produces) one block at a time by `read`, `stream` or
+    `to_float32`. 24-bit PCM is mapped as (frames, channels, 3) bytes.
+
+    Readers pickle by path, so they can be handed to worker processes cheaply.
+    """
+
+    PCM = 1
+    IEEE_FLOAT = 3
+    EXTENSIBLE = 0xFFFE
+
+    SAMPLE_TYPES = {
+        (PCM, 8): "u1",
+        (PCM, 16): "<i2",
+        (PCM, 24): "u1",
+        (PCM, 32): "<i4",
+        (IEEE_FLOAT, 32): "<f4",
+        (IEEE_FLOAT, 64): "<f8",
+    }
+
+    def __init__(self, path):
+        """
+        Parse the RIFF header of `path` and map its data region.
+
+        Parameters:
+        - path (str): Path to a PCM or IEEE float WAV file.
+
+        Raises:
+        - ValueError: If the file is not an uncompressed RIFF/WAVE file.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+
+        self.path = path
+        fmt, data_offset, data_size = self.parse_header(path)
+        format_code, self.channels, self.sr, block_align, self.bits = fmt
+
+        if (format_code, self.bits) not in self.SAMPLE_TYPES:
+            raise ValueError(f"Unsupported WAV encoding: format {format_code} with {self.bits} bits per sample.")
+
+        data_size = min(data_size, os.path.getsize(path) - data_offset)
+        self.frames = max(data_size, 0) // block_align
+        shape = (self.frames, self.channels, 3) if self.bits == 24 else (self.frames, self.channels)
+        dtype = np.dtype(self.SAMPLE_TYPES[(format_code, self.bits)])
+
+        if self.frames == 0:
+            self.raw = np.empty(shape, dtype=dtype)
+        else:
+            self.raw = np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=shape)
+
+
+    @staticmethod
+    def parse_header(path):
+        """
+        Locate the "fmt " and "data" chunks of a WAV file.
+
+        Parameters:
+        - path (str): Path to the WAV file.
+
+        Returns:
+        - Tuple[tuple, int, int]: (format code, channels, sample rate, block align, bits per sample),
+          the byte offset of the sample data and its size in bytes.
+        """
+        with open(path, "rb") as file:
+            riff, _, wave = struct.unpack("<4sI4s", file.read(12))
+            if riff != b"RIFF" or wave != b"WAVE":
+                raise ValueError(f"Not a RIFF/WAVE file: {path}")
+
+            fmt = None
+            while True:
+                header = file.read(8)
+                if len(header) < 8:
+                    raise ValueError(f"No data chunk found in {path}")
+                chunk_id, size = struct.unpack("<4sI", header)
+
+                if chunk_id == b"fmt ":
+                    body = file.read(size)
+                    format_code, channels, sr, _, block_align, bits = struct.unpack("<HHIIHH", body[:16])
+                    if format_code == WavReader.EXTENSIBLE and len(body) >= 26:
+                        format_code = struct.unpack("<H", body[24:26])[0]
+                    fmt = (format_code, channels, sr, block_align, bits)
+                elif chunk_id == b"data":
+                    if fmt is None:
+                        raise ValueError(f"Data chunk precedes the format chunk in {path}")
+                    return fmt, file.tell(), size
+                else:
+                    file.seek(size, os.SEEK_CUR)
+
+                if size % 2:
+                    file.seek(1, os.SEEK_CUR)
+
+
+    @classmethod
+    def can_read(cls, path):
+        """
+        Return True if `path` is a WAV file this reader can map.
+        """
+        if not isinstance(path, str) or not path.lower().endswith(".wav"):
+            return False
+        try:
+            fmt, _, _ = cls.parse_header(path)
+        except (OSError, ValueError, struct.error):
+            return False
+        return (fmt[0], fmt[4]) in cls.SAMPLE_TYPES
+
+
+    def __len__(self):
+        return self.frames
+
+
+    def __reduce__(self):
+        return (self.__class__, (self.path,))
+
+
+    @property
+    def duration(self):
+        """Length of the recording in seconds."""
+        return self.frames / self.sr
+
+
+    def view(self, start=0, stop=None):
+        """
+        Zero-copy view of the raw samples of frames `start` to `stop`.
+        """
+        return self.raw[start:stop]
+
+
+    def read(self, start=0, stop=None):
+        """
+        Decode frames `start` to `stop` into a mono float32 array.
+        """
+        return self.to_float32(self.view(start, stop))
+
+
+    def chunks(self, chunk_size=10.0):
+        """
+        Split the recording into raw views of fixed duration.
+
+        Parameters:
+        - chunk_size (float): Duration of each chunk in seconds.
+
+        Returns:
+        - list[np.ndarray]: Zero-copy views of the mapped samples; the last holds any remainder.
+        """
+        chunk_frames = max(1, int(chunk_size * self.sr))
+        return [self.view(start, start + chunk_frames) for start in range(0, self.frames, chunk_frames)]
+
+
+    def stream(self, block_frames, frame_length=2048, hop_length=512):
+        """
+        Yield float32 blocks laid out like `librosa.stream`.
+
+        Each block spans `block_frames` analysis frames and overlaps the next by
+        `frame_length - hop_length` samples, so frame-level features computed with
+        `center=False` tile exactly across blocks.
+
+        Parameters:
+        - block_frames (int): Analysis frames per block.
+        - frame_length (int): Analysis frame size in samples.
+        - hop_length (int): Analysis hop size in samples.
+
+        Yields:
+        - np.ndarray: Mono float32 block.
+        """
+        block_samples = frame_length + (block_frames - 1) * hop_length
+        start = 0
+        while start < self.frames:
+            yield self.read(start, start + block_samples)
+            if start + block_samples >= self.frames:
+                break
+            start += block_frames * hop_length
+
+
+    @staticmethod
+    def to_float32(raw):
+        """
+        Convert raw WAV samples to a mono float32 signal in [-1, 1).
+
+        Integer samples are scaled as `soundfile` does, and channels are averaged as in
+        `librosa.load(mono=True)`. Float 1D input is returned unchanged.
+
+        Parameters:
+        - raw (np.ndarray): Samples of shape (frames, channels), or (frames, channels, 3)
+          bytes for 24-bit PCM.
+
+        Returns:
+        - np.ndarray: 1D float32 signal.
+        """
+        if raw.ndim == 1 and raw.dtype == np.float32:
+            return raw
+
+        if raw.ndim == 3:
+            raw = raw.astype(np.int32)
+            raw = (raw[..., 0] << 8) | (raw[..., 1] << 16) | (raw[..., 2] << 24)
+
+        if raw.dtype == np.uint8:
+            samples = (raw.astype(np.float32) - 128.0) / 128.0
+        elif raw.dtype.kind == "i":
+            samples = raw.astype(np.float32) / -float(np.iinfo(raw.dtype).min)
+        else:
+            samples = raw.astype(np.float32, copy=False)
+
+        if samples.ndim == 2:
+            samples = samples[:, 0] if samples.shape[1] == 1 else samples.mean(axis=1, dtype=np.float32)
+        return np.ascontiguousarray(samples)